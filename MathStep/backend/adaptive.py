@@ -0,0 +1,205 @@
+"""
+MathStep Adaptive Difficulty Engine
+Elo-style per-user, per-skill ability estimates held in memory
+"""
+import asyncio
+import math
+import os
+import random
+import threading
+import traceback
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+
+from database import SessionLocal
+from models import SkillAbility, User, UserProgress
+
+# Rating a new learner starts at for every skill
+INITIAL_RATING = 1000.0
+
+# Rating of a question at each generator difficulty (1-5)
+DIFFICULTY_RATINGS = {1: 800.0, 2: 900.0, 3: 1000.0, 4: 1100.0, 5: 1200.0}
+
+# Starting rating by mastery level for progress rows with no answer counts
+MASTERY_RATINGS = {"weak": 900.0, "learning": 1000.0, "mastered": 1100.0}
+
+# Probability of a correct answer we aim to serve at
+TARGET_SUCCESS = float(os.getenv("ADAPTIVE_TARGET_SUCCESS", "0.7"))
+
+# Seconds between persisting changed ratings
+ABILITY_FLUSH_INTERVAL = float(os.getenv("ABILITY_FLUSH_INTERVAL", "30"))
+
+
+def expected_success(rating: float, difficulty: int) -> float:
+    """Elo expected score of a learner against a question of this difficulty"""
+    return 1.0 / (1.0 + 10 ** ((DIFFICULTY_RATINGS[difficulty] - rating) / 400.0))
+
+
+def seed_rating(total_questions: int, correct_answers: int, mastery_level: Optional[str]) -> float:
+    """
+    Starting rating from stored progress: the rating whose expected score
+    on a medium question matches the learner's accuracy, with one correct
+    and one wrong answer added so short histories stay near the middle.
+    Without answer counts, fall back to the mastery level.
+    """
+    if total_questions:
+        accuracy = (correct_answers + 1) / (total_questions + 2)
+        rating = DIFFICULTY_RATINGS[3] + 400.0 * math.log10(accuracy / (1.0 - accuracy))
+        # Beyond the question ratings a longer history changes nothing we serve
+        return min(max(rating, DIFFICULTY_RATINGS[1] - 200.0), DIFFICULTY_RATINGS[5] + 200.0)
+    return MASTERY_RATINGS.get(mastery_level, INITIAL_RATING)
+
+
+def k_factor(answers: int) -> float:
+    """Large steps while the estimate is new, settling as evidence accumulates"""
+    return max(16.0, 64.0 / math.sqrt(1 + answers))
+
+
+class AbilityEngine:
+    """
+    In-memory map of (user_id, skill_id) -> (rating, answers).
+    Reads and updates never touch the database; changed entries are
+    written back by a periodic flush and on shutdown.
+    """
+
+    def __init__(self, session_factory=SessionLocal, flush_interval: float = ABILITY_FLUSH_INTERVAL):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self._ratings: Dict[Tuple[int, str], Tuple[float, int]] = {}
+        self._dirty: set = set()
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def load(self) -> int:
+        """
+        Warm the map from the database (call once at startup). Skills a
+        learner has progress on but no persisted rating for are seeded
+        from that progress instead of starting at INITIAL_RATING.
+        """
+        db = self.session_factory()
+        try:
+            rows = db.query(SkillAbility.user_id, SkillAbility.skill_id, SkillAbility.rating, SkillAbility.answers).all()
+            progress = db.query(
+                UserProgress.user_id,
+                UserProgress.skill_id,
+                UserProgress.total_questions,
+                UserProgress.correct_answers,
+                UserProgress.mastery_level,
+            ).all()
+        finally:
+            db.close()
+        with self._lock:
+            for r in rows:
+                self._ratings[(r.user_id, r.skill_id)] = (r.rating, r.answers)
+            for p in progress:
+                key = (p.user_id, p.skill_id)
+                if key not in self._ratings:
+                    total = p.total_questions or 0
+                    self._ratings[key] = (seed_rating(total, p.correct_answers or 0, p.mastery_level), total)
+        return len(self._ratings)
+
+    def rating(self, user_id: int, skill_id: str) -> float:
+        return self._ratings.get((user_id, skill_id), (INITIAL_RATING, 0))[0]
+
+    def record_answer(self, user_id: int, skill_id: str, difficulty: int, correct: bool) -> float:
+        """O(1) Elo update for one graded answer; returns the new rating"""
+        difficulty = min(max(difficulty, 1), 5)
+        key = (user_id, skill_id)
+        with self._lock:
+            rating, answers = self._ratings.get(key, (INITIAL_RATING, 0))
+            rating += k_factor(answers) * ((1.0 if correct else 0.0) - expected_success(rating, difficulty))
+            self._ratings[key] = (rating, answers + 1)
+            self._dirty.add(key)
+        return rating
+
+    def pick_difficulty(self, user_id: int, skill_id: str) -> int:
+        """Difficulty whose expected success is closest to TARGET_SUCCESS"""
+        rating = self.rating(user_id, skill_id)
+        return min(DIFFICULTY_RATINGS, key=lambda d: abs(expected_success(rating, d) - TARGET_SUCCESS))
+
+    def pick_skill(self, user_id: int, skills: Iterable[str]) -> str:
+        """
+        Favour the skills the learner is weakest at: sample with weight
+        proportional to the chance of failing a medium question.
+        """
+        skills = list(skills)
+        weights = [1.0 - expected_success(self.rating(user_id, s), 3) + 0.05 for s in skills]
+        return random.choices(skills, weights=weights, k=1)[0]
+
+    def next_question(self, user_id: int, skills: Iterable[str]) -> Tuple[str, int]:
+        skill_id = self.pick_skill(user_id, skills)
+        return skill_id, self.pick_difficulty(user_id, skill_id)
+
+    def flush(self) -> int:
+        """
+        Persist ratings changed since the last flush. Ratings of users
+        that do not exist are dropped, as is a batch the database
+        rejects; only transient failures are retried.
+        """
+        with self._lock:
+            keys, self._dirty = self._dirty, set()
+            rows = [(k, self._ratings[k]) for k in keys]
+        if not rows:
+            return 0
+
+        db = self.session_factory()
+        try:
+            user_ids = {user_id for (user_id, _), _ in rows}
+            known = {user_id for (user_id,) in db.query(User.id).filter(User.id.in_(user_ids))}
+            if known != user_ids:
+                self._forget(user_ids - known)
+                rows = [row for row in rows if row[0][0] in known]
+            for (user_id, skill_id), (rating, answers) in rows:
+                db.merge(SkillAbility(user_id=user_id, skill_id=skill_id, rating=rating, answers=answers))
+            db.commit()
+            return len(rows)
+        except IntegrityError:
+            # Retrying would fail the same way on every later flush
+            db.rollback()
+            print(f"Dropped {len(rows)} ability update(s): rejected by the database")
+            raise
+        except Exception:
+            db.rollback()
+            with self._lock:
+                self._dirty.update(k for k in keys if k in self._ratings)
+            raise
+        finally:
+            db.close()
+
+    def _forget(self, user_ids) -> None:
+        """Drop in-memory ratings of users that do not exist"""
+        with self._lock:
+            for key in [k for k in self._ratings if k[0] in user_ids]:
+                del self._ratings[key]
+                self._dirty.discard(key)
+        print(f"Dropped ability ratings of unknown user(s) {sorted(user_ids)}")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                print(f"Error persisting abilities: {e}")
+                traceback.print_exc()
+
+    def start(self) -> None:
+        """Load persisted ratings and start the periodic flush task"""
+        self.load()
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.flush)
+
+
+# Shared instance used by the API
+ability_engine = AbilityEngine()
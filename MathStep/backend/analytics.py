@@ -0,0 +1,166 @@
+"""
+MathStep Skill Analytics
+Incremental maintenance of the per-skill class aggregates
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from collections import defaultdict
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import func, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models import SkillAnalytics, UserProgress, ExamSkill
+
+MASTERY_LEVELS = ("locked", "weak", "learning", "mastered")
+
+# Dialects with INSERT ... ON CONFLICT DO NOTHING
+_UPSERT_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+class AnalyticsDelta:
+    """
+    Accumulates counter changes for a batch of saves so each skill's
+    aggregate row is touched once per transaction.
+    """
+
+    def __init__(self):
+        self._deltas: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def progress_changed(
+        self,
+        skill_id: str,
+        old: Optional[UserProgress],
+        total_questions: int,
+        correct_answers: int,
+        mastery_level: str,
+    ) -> None:
+        """Record the difference between a progress row before and after a save"""
+        d = self._deltas[skill_id]
+        if old is None:
+            d["learners"] += 1
+            d["total_attempts"] += total_questions
+            d["total_correct"] += correct_answers
+        else:
+            d["total_attempts"] += total_questions - (old.total_questions or 0)
+            d["total_correct"] += correct_answers - (old.correct_answers or 0)
+            if old.mastery_level in MASTERY_LEVELS:
+                d[f"mastery_{old.mastery_level}"] -= 1
+        if mastery_level in MASTERY_LEVELS:
+            d[f"mastery_{mastery_level}"] += 1
+
+    def add(self, skill_id: str, column: str, value: int) -> None:
+        self._deltas[skill_id][column] += value
+
+    def exam_recorded(self, weak_skills: Iterable[str], strong_skills: Iterable[str]) -> None:
+        for skill_id in set(weak_skills):
+            self._deltas[skill_id]["exam_weak_count"] += 1
+        for skill_id in set(strong_skills):
+            self._deltas[skill_id]["exam_strong_count"] += 1
+
+    def apply(self, db: Session) -> None:
+        """Add the accumulated deltas to the aggregate rows (caller commits)"""
+        upsert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+        for skill_id, changes in self._deltas.items():
+            changes = {k: v for k, v in changes.items() if v}
+            if not changes:
+                continue
+            # Create the row if missing; a concurrent creator wins and we just add to it
+            _ensure_row(db, upsert, skill_id)
+            # Increment in SQL so concurrent writers don't lose updates
+            db.execute(
+                update(SkillAnalytics)
+                .where(SkillAnalytics.skill_id == skill_id)
+                .values({column: getattr(SkillAnalytics, column) + value for column, value in changes.items()})
+                .execution_options(synchronize_session=False)
+            )
+        self._deltas.clear()
+
+
+def _ensure_row(db: Session, upsert, skill_id: str) -> None:
+    """Insert a zeroed aggregate row unless one exists"""
+    if upsert is not None:
+        db.execute(
+            upsert(SkillAnalytics)
+            .values(skill_id=skill_id, **_zero_counters())
+            .on_conflict_do_nothing(index_elements=["skill_id"])
+        )
+        return
+    # Other backends: plain insert in a savepoint, ignoring the duplicate key
+    if db.get(SkillAnalytics, skill_id) is not None:
+        return
+    try:
+        with db.begin_nested():
+            db.execute(insert(SkillAnalytics).values(skill_id=skill_id, **_zero_counters()))
+    except IntegrityError:
+        pass
+
+
+def _zero_counters() -> Dict[str, int]:
+    counters = {
+        "learners": 0,
+        "total_attempts": 0,
+        "total_correct": 0,
+        "exam_weak_count": 0,
+        "exam_strong_count": 0,
+    }
+    counters.update({f"mastery_{level}": 0 for level in MASTERY_LEVELS})
+    return counters
+
+
+def serialize_skill_analytics(row: SkillAnalytics) -> dict:
+    """camelCase view of an aggregate row"""
+    return {
+        "skillId": row.skill_id,
+        "learners": row.learners,
+        "totalAttempts": row.total_attempts,
+        "totalCorrect": row.total_correct,
+        "correctRate": round(row.total_correct / row.total_attempts, 4) if row.total_attempts else None,
+        "masteryDistribution": {level: getattr(row, f"mastery_{level}") for level in MASTERY_LEVELS},
+        "examWeakCount": row.exam_weak_count,
+        "examStrongCount": row.exam_strong_count,
+        "updatedAt": row.updated_at.isoformat() if row.updated_at else None,
+    }
+
+
+def rebuild_skill_analytics(db: Session) -> int:
+    """
+    Recompute every aggregate from scratch with one pass over the
+    progress table and a grouped count of exam_skills (run the
+    exam_skills backfill in migrations.py first). Used to repair the table.
+    """
+    delta = AnalyticsDelta()
+    for p in db.query(
+        UserProgress.skill_id,
+        UserProgress.total_questions,
+        UserProgress.correct_answers,
+        UserProgress.mastery_level,
+    ).yield_per(1000):
+        delta.progress_changed(p.skill_id, None, p.total_questions or 0, p.correct_answers or 0, p.mastery_level)
+    exam_counts = (
+        db.query(ExamSkill.skill_id, ExamSkill.kind, func.count())
+        .group_by(ExamSkill.skill_id, ExamSkill.kind)
+    )
+    for skill_id, kind, count in exam_counts:
+        delta.add(skill_id, f"exam_{kind}_count", count)
+
+    db.query(SkillAnalytics).delete()
+    db.flush()
+    delta.apply(db)
+    db.commit()
+    return db.query(SkillAnalytics).count()
+
+
+if __name__ == "__main__":
+    from database import SessionLocal, init_db
+
+    init_db()
+    session = SessionLocal()
+    try:
+        print(f"[OK] Rebuilt analytics for {rebuild_skill_analytics(session)} skills")
+    finally:
+        session.close()
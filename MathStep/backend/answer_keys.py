@@ -0,0 +1,101 @@
+"""
+MathStep Answer Key Store
+Server-held, pre-parsed answer keys for issued questions
+"""
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sympy import sympify, simplify
+
+from metrics import grading_tier
+
+# Maximum number of outstanding questions kept in memory
+ANSWER_KEY_CAPACITY = int(os.getenv("ANSWER_KEY_CAPACITY", "100000"))
+
+# Seconds an issued question stays gradeable
+ANSWER_KEY_TTL = float(os.getenv("ANSWER_KEY_TTL", "7200"))
+
+
+@dataclass
+class AnswerKey:
+    """An issued question's answer, parsed once at issue time"""
+    answer: str
+    parsed: Any  # sympy expression, or None if the answer isn't parseable
+    skill_id: str
+    difficulty: int
+    expires_at: float
+
+
+def parse_answer(answer: str) -> Any:
+    """Parse an answer string the same way /grade does; None on failure"""
+    try:
+        return sympify(answer, evaluate=False)
+    except Exception:
+        return None
+
+
+def check_answer(student_answer: str, correct_expr, correct_answer: str) -> bool:
+    """Compare a student answer against a (pre-parsed) answer key"""
+    if correct_expr is None:
+        # Key isn't a sympy expression (e.g. "x = 2, y = 3") - compare the text
+        grading_tier.inc("text")
+        return student_answer.replace(" ", "") == correct_answer.replace(" ", "")
+    grading_tier.inc("sympy")
+    student_expr = sympify(student_answer, evaluate=False)
+    return simplify(student_expr - correct_expr) == 0
+
+
+class AnswerKeyStore:
+    """
+    Bounded, TTL-evicted map of question_id -> AnswerKey.
+    Entries are kept in insertion order, which is also expiry order since
+    every entry gets the same TTL, so eviction only looks at the front.
+    """
+
+    def __init__(self, capacity: int = ANSWER_KEY_CAPACITY, ttl: float = ANSWER_KEY_TTL):
+        self.capacity = capacity
+        self.ttl = ttl
+        self._keys: "OrderedDict[str, AnswerKey]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evict(self, now: float) -> None:
+        while self._keys:
+            key = next(iter(self._keys.values()))
+            if key.expires_at > now and len(self._keys) <= self.capacity:
+                break
+            self._keys.popitem(last=False)
+
+    def issue(self, question: dict) -> str:
+        """Store the answer of a generated question and return its short ID"""
+        key = AnswerKey(
+            answer=str(question["answer"]),
+            parsed=parse_answer(str(question["answer"])),
+            skill_id=question.get("skill_id", ""),
+            difficulty=question.get("difficulty", 2),
+            expires_at=time.monotonic() + self.ttl,
+        )
+        question_id = secrets.token_urlsafe(8)
+        with self._lock:
+            self._keys[question_id] = key
+            self._evict(time.monotonic())
+        return question_id
+
+    def get(self, question_id: str) -> Optional[AnswerKey]:
+        now = time.monotonic()
+        with self._lock:
+            key = self._keys.get(question_id)
+            if key is None or key.expires_at <= now:
+                return None
+            return key
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+# Shared instance used by the API
+answer_keys = AnswerKeyStore()
@@ -0,0 +1,123 @@
+"""
+Benchmark concurrent /users/{id}/progress reads and writes
+against the default and production SQLite profiles.
+
+Usage: python benchmark_db.py [--users 20] [--threads 8] [--ops 400] [--write-ratio 0.3]
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import Response
+from sqlalchemy.orm import sessionmaker
+
+from cache import progress_cache
+from database import Base, create_db_engine
+from generators import SKILL_GENERATORS
+import models
+from routes.users import get_user_progress, save_user_progress, UserProgressSync, SkillProgressData
+
+
+def seed_users(Session, num_users):
+    """Create users with progress on every skill"""
+    db = Session()
+    user_ids = []
+    for i in range(num_users):
+        user = models.User(email=f"bench{i}@example.com", name=f"Bench {i}", google_id=f"bench-{i}")
+        db.add(user)
+        db.flush()
+        for skill_id in SKILL_GENERATORS:
+            db.add(models.UserProgress(user_id=user.id, skill_id=skill_id, last_answers=[True] * 10))
+        user_ids.append(user.id)
+    db.commit()
+    db.close()
+    return user_ids
+
+
+def make_sync_payload():
+    """Build a full progress snapshot like the frontend uploads"""
+    skills = [
+        SkillProgressData(
+            skill_id=skill_id,
+            total_questions=random.randint(0, 200),
+            correct_answers=random.randint(0, 100),
+            last_answers=[random.random() < 0.7 for _ in range(20)],
+            mastery_level=random.choice(["weak", "learning", "mastered"]),
+            last_practiced="2026-01-01",
+        )
+        for skill_id in SKILL_GENERATORS
+    ]
+    return UserProgressSync(
+        total_questions=random.randint(0, 5000),
+        total_correct=random.randint(0, 3000),
+        streak=random.randint(0, 30),
+        points=random.randint(0, 10000),
+        skills=skills,
+    )
+
+
+def run_profile(profile, args):
+    """Run the mixed workload against a fresh database and return ops/sec"""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{tmp}/bench.db", profile)
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        user_ids = seed_users(Session, args.users)
+        progress_cache.clear()  # User ids repeat across profiles
+
+        def one_op(_):
+            user_id = random.choice(user_ids)
+            db = Session()
+            start = time.perf_counter()
+            try:
+                if random.random() < args.write_ratio:
+                    asyncio.run(save_user_progress(user_id, make_sync_payload(), db))
+                else:
+                    asyncio.run(get_user_progress(user_id, Response(), None, db))
+                return time.perf_counter() - start, None
+            except Exception as e:
+                return time.perf_counter() - start, e
+            finally:
+                db.close()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            results = list(pool.map(one_op, range(args.ops)))
+        elapsed = time.perf_counter() - start
+        engine.dispose()
+
+    latencies = sorted(r[0] for r in results)
+    errors = [r[1] for r in results if r[1] is not None]
+    return {
+        "profile": profile,
+        "ops_per_sec": args.ops / elapsed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "errors": len(errors),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=400)
+    parser.add_argument("--write-ratio", type=float, default=0.3)
+    args = parser.parse_args()
+
+    print(f"{args.ops} ops, {args.threads} threads, {args.users} users, {args.write_ratio:.0%} writes\n")
+    print(f"{'profile':<12}{'ops/sec':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for profile in ("default", "production"):
+        r = run_profile(profile, args)
+        print(f"{r['profile']:<12}{r['ops_per_sec']:>10.1f}{r['p50_ms']:>10.2f}{r['p99_ms']:>10.2f}{r['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
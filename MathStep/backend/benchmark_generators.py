@@ -0,0 +1,217 @@
+"""
+Per-generator benchmark suite.
+
+For every skill in SKILL_GENERATORS and difficulties 1-5, measures:
+  - generation throughput and p50/p99 latency
+  - peak memory allocated while generating one question (tracemalloc, separate pass)
+  - grade-against-self latency (parse key once, then check_answer)
+
+Results are written as JSON and optionally compared against a baseline.
+
+Usage:
+  python benchmark_generators.py                      # run, write benchmark_results.json
+  python benchmark_generators.py --save-baseline      # also store as the baseline
+  python benchmark_generators.py --compare            # flag regressions vs the baseline
+  python benchmark_generators.py --skills fractions,integrals --iterations 50
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+
+from generators import SKILL_GENERATORS
+from answer_keys import parse_answer, check_answer
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(HERE, "benchmark_results.json")
+DEFAULT_BASELINE = os.path.join(HERE, "benchmark_baseline.json")
+DIFFICULTIES = [1, 2, 3, 4, 5]
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def bench_generation(generator_class, difficulty, iterations):
+    """Time generate() calls; returns (latencies, questions)"""
+    latencies = []
+    questions = []
+    for _ in range(iterations):
+        generator = generator_class(difficulty=difficulty)
+        start = time.perf_counter()
+        question = generator.generate()
+        latencies.append(time.perf_counter() - start)
+        questions.append(question)
+    return latencies, questions
+
+
+def bench_allocations(generator_class, difficulty, iterations):
+    """
+    Memory generate() allocates per call: the traced peak above what was
+    live when the call started, averaged and maxed over calls. Unlike a
+    snapshot diff this counts temporaries freed before the call returns.
+    """
+    per_call = []
+    tracemalloc.start()
+    try:
+        for _ in range(iterations):
+            generator = generator_class(difficulty=difficulty)
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            generator.generate()
+            _, peak = tracemalloc.get_traced_memory()
+            per_call.append(peak - before)
+    finally:
+        tracemalloc.stop()
+    return statistics.mean(per_call), max(per_call)
+
+
+def bench_grading(questions):
+    """
+    Time grading each question's answer against itself. The key is parsed
+    outside the timed region, as /grade gets it pre-parsed from answer_keys.
+    """
+    latencies = []
+    failures = 0
+    for question in questions:
+        answer = str(question["answer"])
+        key = parse_answer(answer)
+        start = time.perf_counter()
+        try:
+            ok = check_answer(answer, key, answer)
+        except Exception:
+            ok = False
+        latencies.append(time.perf_counter() - start)
+        failures += not ok
+    return latencies, failures
+
+
+def run(skills, iterations, alloc_iterations, seed):
+    results = {}
+    for skill_id in skills:
+        generator_class = SKILL_GENERATORS[skill_id]
+        results[skill_id] = {}
+        for difficulty in DIFFICULTIES:
+            random.seed(seed)
+            gen_lat, questions = bench_generation(generator_class, difficulty, iterations)
+            grade_lat, grade_failures = bench_grading(questions)
+            bytes_per_call, peak = bench_allocations(generator_class, difficulty, alloc_iterations)
+            gen_sorted = sorted(gen_lat)
+            grade_sorted = sorted(grade_lat)
+            results[skill_id][str(difficulty)] = {
+                "generate_per_sec": len(gen_lat) / sum(gen_lat) if sum(gen_lat) else 0.0,
+                "generate_p50_ms": percentile(gen_sorted, 50) * 1000,
+                "generate_p99_ms": percentile(gen_sorted, 99) * 1000,
+                "alloc_peak_bytes_per_call": bytes_per_call,
+                "alloc_peak_bytes_max": peak,
+                "grade_p50_ms": percentile(grade_sorted, 50) * 1000,
+                "grade_p99_ms": percentile(grade_sorted, 99) * 1000,
+                "grade_self_failures": grade_failures,
+            }
+            r = results[skill_id][str(difficulty)]
+            print(
+                f"{skill_id:<30} d{difficulty}  {r['generate_per_sec']:>9.1f}/s  "
+                f"p50 {r['generate_p50_ms']:>7.2f}ms  p99 {r['generate_p99_ms']:>7.2f}ms  "
+                f"alloc {r['alloc_peak_bytes_per_call'] / 1024:>7.1f}KiB  "
+                f"grade p50 {r['grade_p50_ms']:>7.2f}ms  fail {grade_failures}",
+                flush=True,
+            )
+    return results
+
+
+# An increase in these is a regression...
+LOWER_IS_BETTER = ["generate_p50_ms", "generate_p99_ms", "grade_p50_ms", "grade_p99_ms", "alloc_peak_bytes_per_call"]
+# ...and a decrease in these
+HIGHER_IS_BETTER = ["generate_per_sec"]
+
+
+def compare(results, baseline, threshold):
+    """List of human-readable regressions beyond the relative threshold"""
+    regressions = []
+    for skill_id, by_difficulty in results.items():
+        for difficulty, current in by_difficulty.items():
+            base = baseline.get(skill_id, {}).get(difficulty)
+            if not base:
+                continue
+            for metric in LOWER_IS_BETTER:
+                if base.get(metric) and current[metric] > base[metric] * (1 + threshold):
+                    regressions.append(f"{skill_id} d{difficulty} {metric}: {base[metric]:.3f} -> {current[metric]:.3f}")
+            for metric in HIGHER_IS_BETTER:
+                if base.get(metric) and current[metric] < base[metric] * (1 - threshold):
+                    regressions.append(f"{skill_id} d{difficulty} {metric}: {base[metric]:.1f} -> {current[metric]:.1f}")
+            if current["grade_self_failures"] > base.get("grade_self_failures", 0):
+                regressions.append(
+                    f"{skill_id} d{difficulty} grade_self_failures: {base.get('grade_self_failures', 0)} -> {current['grade_self_failures']}"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skills", help="Comma-separated skill ids (default: all)")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed generations per skill/difficulty")
+    parser.add_argument("--alloc-iterations", type=int, default=20, help="Generations traced for allocations")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Write results to the baseline file too")
+    parser.add_argument("--compare", action="store_true", help="Compare against the baseline and exit 1 on regression")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Relative change counted as a regression")
+    args = parser.parse_args()
+
+    skills = args.skills.split(",") if args.skills else list(SKILL_GENERATORS.keys())
+    unknown = [s for s in skills if s not in SKILL_GENERATORS]
+    if unknown:
+        parser.error(f"Unknown skills: {', '.join(unknown)}")
+
+    results = run(skills, args.iterations, args.alloc_iterations, args.seed)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "iterations": args.iterations,
+            "seed": args.seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n[OK] Results written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"[OK] Baseline saved to {args.baseline}")
+
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline}; run with --save-baseline first")
+            sys.exit(2)
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print(f"\n[OK] No regressions beyond {args.threshold:.0%}")
+
+    total = sum(statistics.fmean([d["generate_per_sec"] for d in r.values()]) for r in results.values())
+    print(f"Mean generation throughput across skills: {total / len(results):.1f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+MathStep Progress Cache
+Per-user read-through cache for dashboard progress snapshots
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# Maximum number of user snapshots kept in memory
+PROGRESS_CACHE_SIZE = int(os.getenv("PROGRESS_CACHE_SIZE", "10000"))
+
+
+def compute_etag(payload: Dict[str, Any]) -> str:
+    """Strong ETag from the canonical JSON form of a payload"""
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return '"' + hashlib.sha1(body.encode("utf-8")).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ProgressCache:
+    """
+    LRU cache of user_id -> (etag, progress payload).
+    Writers call invalidate() after committing so the next read rebuilds.
+    Each invalidation bumps a per-user generation, so a reader that loaded
+    its snapshot before a concurrent write cannot store stale data.
+    """
+
+    def __init__(self, max_size: int = PROGRESS_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._generations: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> Optional[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry
+
+    def generation(self, user_id: int) -> int:
+        """Current generation; pass it to put() after loading from the DB"""
+        with self._lock:
+            return self._generations.get(user_id, 0)
+
+    def put(self, user_id: int, payload: Dict[str, Any], generation: Optional[int] = None) -> str:
+        etag = compute_etag(payload)
+        with self._lock:
+            if generation is not None and generation != self._generations.get(user_id, 0):
+                return etag  # Invalidated while loading - don't cache
+            self._entries[user_id] = (etag, payload)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return etag
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+
+
+# Shared instance used by the user routes
+progress_cache = ProgressCache()
@@ -3,19 +3,78 @@ MathStep Database Configuration
 SQLite + SQLAlchemy for user data and progress storage
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 import os
 
 # Database URL - SQLite file in backend directory
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./mathstep.db")
 
+# Database profile - "default" keeps SQLite's stock settings,
+# "production" enables WAL and the tuned pragmas below
+DB_PROFILE = os.getenv("DB_PROFILE", "default")
+
+# Tuning knobs for the production SQLite profile
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",  # Readers no longer block behind writers
+    "synchronous": "NORMAL",  # Safe with WAL, fsync only at checkpoints
+    "cache_size": -int(os.getenv("SQLITE_CACHE_SIZE_KB", "20000")),  # Negative = KiB
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    "temp_store": "MEMORY",
+    "foreign_keys": "ON",
+}
+
+# Connection pool for the production profile
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "8"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "8"))
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Run the production PRAGMAs on every new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+def create_db_engine(url: str = DATABASE_URL, profile: str = DB_PROFILE):
+    """
+    Create an engine for the given URL and profile.
+    Non-SQLite URLs are passed through untouched.
+    """
+    if not url.startswith("sqlite"):
+        return create_engine(url, pool_pre_ping=True)
+
+    connect_args = {"check_same_thread": False}  # Needed for SQLite
+
+    if profile != "production":
+        return create_engine(url, connect_args=connect_args)
+
+    in_memory = url in ("sqlite://", "sqlite:///:memory:")
+    if in_memory:
+        # Every connection to :memory: is a separate database - share one
+        db_engine = create_engine(url, connect_args=connect_args, poolclass=StaticPool)
+    else:
+        # busy_timeout is handled by the PRAGMA, keep the driver timeout in sync
+        connect_args["timeout"] = SQLITE_PRAGMAS["busy_timeout"] / 1000
+        db_engine = create_engine(
+            url,
+            connect_args=connect_args,
+            poolclass=QueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_pre_ping=True,
+        )
+
+    event.listen(db_engine, "connect", _apply_sqlite_pragmas)
+    return db_engine
+
+
 # Create engine
-engine = create_engine(
-    DATABASE_URL, 
-    connect_args={"check_same_thread": False}  # Needed for SQLite
-)
+engine = create_db_engine()
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -35,5 +94,11 @@ def get_db():
 
 def init_db():
     """Initialize database tables"""
-    from . import models  # Import models to register them
+    import models  # Import models to register them
     Base.metadata.create_all(bind=engine)
+    # create_all skips existing tables, so add indexes introduced later
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    from migrations import run_pending
+    run_pending(engine)
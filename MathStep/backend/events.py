@@ -0,0 +1,226 @@
+"""
+MathStep Answer Events
+In-memory queue of graded answers, persisted in batched transactions
+"""
+import asyncio
+import os
+import threading
+import traceback
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+
+from database import SessionLocal
+from models import AnswerEvent, User, UserProgress
+from analytics import AnalyticsDelta
+from cache import progress_cache
+from metrics import app_errors
+from scheduler import ANSWER_HISTORY_SIZE, compute_next_review, mastery_from_answers
+
+# Seconds between flushes of queued answer events
+EVENT_FLUSH_INTERVAL = float(os.getenv("EVENT_FLUSH_INTERVAL", "2"))
+
+# Flush early once this many events are queued
+EVENT_MAX_PENDING = int(os.getenv("EVENT_MAX_PENDING", "2000"))
+
+# Hard cap on queued events while the database is failing; the oldest are dropped beyond it
+EVENT_MAX_QUEUED = int(os.getenv("EVENT_MAX_QUEUED", "20000"))
+
+
+@dataclass
+class QueuedAnswer:
+    user_id: int
+    skill_id: str
+    correct: bool
+    latency_ms: Optional[int] = None
+    answered_at: datetime = field(default_factory=datetime.utcnow)
+
+
+class AnswerEventQueue:
+    """
+    Append-only answer stream. Each flush inserts the queued events and
+    folds them into UserProgress in a single transaction, touching each
+    (user, skill) row once no matter how many answers it received.
+
+    Recording only enqueues; flushing happens on the background task.
+    Events for unknown users, or a batch the database rejects outright,
+    are dropped (and counted) rather than retried, so one bad row cannot
+    block every later flush. Transient failures are retried, with the
+    queue capped at max_queued.
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        flush_interval: float = EVENT_FLUSH_INTERVAL,
+        max_pending: int = EVENT_MAX_PENDING,
+        max_queued: int = EVENT_MAX_QUEUED,
+    ):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_queued = max(max_queued, max_pending)
+        self.dropped = 0
+        self._queue: List[QueuedAnswer] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+
+    def record(self, user_id: int, skill_id: str, correct: bool, latency_ms: Optional[int] = None) -> None:
+        """Queue one graded answer; never touches the database"""
+        with self._lock:
+            self._queue.append(QueuedAnswer(user_id, skill_id, correct, latency_ms))
+            self._trim()
+            should_flush = len(self._queue) >= self.max_pending
+        if should_flush and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def _trim(self) -> None:
+        """Drop the oldest events beyond max_queued (caller holds _lock)"""
+        excess = len(self._queue) - self.max_queued
+        if excess > 0:
+            del self._queue[:excess]
+            self._drop(excess, "answer queue full")
+
+    def _drop(self, count: int, reason: str) -> None:
+        self.dropped += count
+        print(f"Dropped {count} answer event(s): {reason}")
+
+    def flush(self) -> int:
+        """Persist every queued event; returns the number written"""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._queue = self._queue, []
+            if not batch:
+                return 0
+
+            db = self.session_factory()
+            try:
+                batch = self._known_users(db, batch)
+                if not batch:
+                    return 0
+                db.bulk_insert_mappings(AnswerEvent, [
+                    {
+                        "user_id": e.user_id,
+                        "skill_id": e.skill_id,
+                        "correct": e.correct,
+                        "latency_ms": e.latency_ms,
+                        "answered_at": e.answered_at,
+                    }
+                    for e in batch
+                ])
+                self._apply_to_progress(db, batch)
+                db.commit()
+            except IntegrityError:
+                # Retrying would fail the same way and block every later flush
+                db.rollback()
+                self._drop(len(batch), "rejected by the database")
+                raise
+            except Exception:
+                db.rollback()
+                with self._lock:
+                    self._queue[:0] = batch  # Retry on the next flush, in order
+                    self._trim()
+                raise
+            finally:
+                db.close()
+
+            for user_id in {e.user_id for e in batch}:
+                progress_cache.invalidate(user_id)
+            return len(batch)
+
+    def _known_users(self, db, batch: List[QueuedAnswer]) -> List[QueuedAnswer]:
+        """Drop events whose user does not exist (they would violate the users FK)"""
+        user_ids = {e.user_id for e in batch}
+        known = {user_id for (user_id,) in db.query(User.id).filter(User.id.in_(user_ids))}
+        if known == user_ids:
+            return batch
+        kept = [e for e in batch if e.user_id in known]
+        self._drop(len(batch) - len(kept), f"unknown user(s) {sorted(user_ids - known)}")
+        return kept
+
+    def _apply_to_progress(self, db, batch: List[QueuedAnswer]) -> None:
+        grouped: Dict[Tuple[int, str], List[QueuedAnswer]] = defaultdict(list)
+        for e in batch:
+            grouped[(e.user_id, e.skill_id)].append(e)
+
+        # One query for every affected progress row
+        user_ids = {user_id for user_id, _ in grouped}
+        skill_ids = {skill_id for _, skill_id in grouped}
+        existing = {
+            (p.user_id, p.skill_id): p
+            for p in db.query(UserProgress).filter(
+                UserProgress.user_id.in_(user_ids),
+                UserProgress.skill_id.in_(skill_ids),
+            )
+        }
+
+        analytics = AnalyticsDelta()
+        for (user_id, skill_id), events in grouped.items():
+            row = existing.get((user_id, skill_id))
+            old_level = row.mastery_level if row else None
+            answers = list(row.last_answers or []) if row else []
+            answers = (answers + [e.correct for e in events])[-ANSWER_HISTORY_SIZE:]
+            correct = sum(e.correct for e in events)
+            level = mastery_from_answers(answers)
+            practiced_on = events[-1].answered_at.date()
+
+            if row is None:
+                row = UserProgress(user_id=user_id, skill_id=skill_id, total_questions=0, correct_answers=0)
+                db.add(row)
+            analytics.progress_changed(
+                skill_id,
+                row if old_level is not None else None,
+                (row.total_questions or 0) + len(events),
+                (row.correct_answers or 0) + correct,
+                level,
+            )
+            row.total_questions = (row.total_questions or 0) + len(events)
+            row.correct_answers = (row.correct_answers or 0) + correct
+            row.last_answers = answers
+            row.mastery_level = level
+            row.last_practiced = practiced_on.isoformat()
+            row.next_review = compute_next_review(answers, level, old_level, practiced_on)
+        analytics.apply(db)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                print(f"Error flushing answer events: {e}")
+                app_errors.inc("answer_flush")
+                traceback.print_exc()
+
+    def start(self) -> None:
+        """Start the periodic flush task (call from the app startup hook)"""
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            self._task = self._loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the periodic task and flush whatever is left"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wake = None
+        await asyncio.to_thread(self.flush)
+
+
+# Shared instance used by the API
+answer_events = AnswerEventQueue()
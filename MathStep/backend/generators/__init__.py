@@ -5,6 +5,8 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from metrics import generation_seconds
+
 from generators.arithmetic import (
     AdditionGenerator,
     SubtractionGenerator,
@@ -111,7 +113,8 @@ def generate_question(skill_id: str, difficulty: int = 2) -> dict:
         return {"error": f"Unknown skill: {skill_id}"}
     
     generator = generator_class(difficulty=difficulty)
-    return generator.generate()
+    with generation_seconds.time(skill_id, str(generator.difficulty)):
+        return generator.generate()
 
 
 def get_skills_for_grade(grade: int) -> list:
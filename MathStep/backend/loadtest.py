@@ -0,0 +1,307 @@
+"""
+In-process load generator for the MathStep API.
+
+Drives the ASGI app directly (no server, no network) against a throwaway
+SQLite database, replaying a weighted mix of question generation, grading,
+exam generation and user progress sync traffic. Reports throughput, tail
+latency per endpoint and how long the event loop was blocked.
+
+The scratch database is always used, even when DATABASE_URL is set, so a
+run never seeds users and random progress into a real database. Point it
+somewhere else only on purpose, with --database-url.
+
+Usage:
+  python loadtest.py [--requests 2000] [--concurrency 32] [--users 50]
+                     [--mix generate=35,grade=35,exam=5,progress_get=15,progress_post=10]
+                     [--database-url sqlite:///./load.db]
+"""
+import sys
+import os
+import shutil
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import defaultdict
+from urllib.parse import urlencode
+
+DEFAULT_MIX = "generate=35,grade=35,exam=5,progress_get=15,progress_post=10"
+
+# Scenario methods that --mix may name
+TRAFFIC_TYPES = ("generate", "grade", "exam", "progress_get", "progress_post")
+
+
+class ASGIClient:
+    """Just enough of an HTTP client to call an ASGI app in-process"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def request(self, method, path, query=None, json_body=None, headers=None):
+        body = json.dumps(json_body).encode() if json_body is not None else b""
+        raw_headers = [(b"host", b"loadtest")]
+        if json_body is not None:
+            raw_headers.append((b"content-type", b"application/json"))
+        for name, value in (headers or {}).items():
+            raw_headers.append((name.lower().encode(), value.encode()))
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": urlencode(query or {}).encode(),
+            "root_path": "",
+            "headers": raw_headers,
+            "client": ("127.0.0.1", 0),
+            "server": ("loadtest", 80),
+        }
+        sent = False
+
+        async def receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await asyncio.Event().wait()  # Never disconnect
+
+        status = 0
+        chunks = []
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        try:
+            await self.app(scope, receive, send)
+        except Exception as e:
+            # An unhandled server error is a 500, not the end of the run
+            return 500, f"{type(e).__name__}: {e}"
+        payload = b"".join(chunks)
+        try:
+            return status, json.loads(payload) if payload else None
+        except ValueError:
+            return status, payload.decode(errors="replace")
+
+    async def lifespan(self):
+        """Run the app's startup handlers; returns a coroutine to shut down"""
+        queue = asyncio.Queue()
+        started = asyncio.Event()
+        stopped = asyncio.Event()
+        await queue.put({"type": "lifespan.startup"})
+
+        async def send(message):
+            if message["type"].startswith("lifespan.startup"):
+                started.set()
+            elif message["type"].startswith("lifespan.shutdown"):
+                stopped.set()
+
+        task = asyncio.create_task(self.app({"type": "lifespan", "asgi": {"version": "3.0"}}, queue.get, send))
+        await started.wait()
+
+        async def shutdown():
+            await queue.put({"type": "lifespan.shutdown"})
+            await stopped.wait()
+            await task
+
+        return shutdown
+
+
+class LoopMonitor:
+    """Measures event-loop lag by timing how late short sleeps wake up"""
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.blocked_seconds = 0.0
+        self.max_lag = 0.0
+        self.stalls = 0
+        self._task = None
+
+    async def _run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = time.perf_counter() - start - self.interval
+            if lag > self.interval:
+                self.blocked_seconds += lag
+                self.stalls += 1
+            self.max_lag = max(self.max_lag, lag)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
+class Scenario:
+    """Shared state for the traffic mix: users and outstanding questions"""
+
+    def __init__(self, client, skills, user_ids):
+        self.client = client
+        self.skills = skills
+        self.user_ids = user_ids
+        self.issued = []  # (question_id, answer, user_id)
+
+    async def generate(self):
+        user_id = random.choice(self.user_ids)
+        body = {"skill_id": random.choice(self.skills), "user_id": user_id}
+        status, data = await self.client.request("POST", "/generate-question", json_body=body)
+        if status == 200 and data.get("question_id"):
+            self.issued.append((data["question_id"], data["answer"], user_id))
+            del self.issued[:-1000]
+        return status
+
+    async def grade(self):
+        if not self.issued:
+            return await self.generate()
+        question_id, answer, user_id = random.choice(self.issued)
+        student_answer = answer if random.random() < 0.7 else "0"
+        body = {"question_id": question_id, "student_answer": student_answer, "user_id": user_id, "record": True}
+        status, _ = await self.client.request("POST", "/grade", json_body=body)
+        return status
+
+    async def exam(self):
+        query = {"grade": random.randint(5, 12), "num_questions": 10}
+        status, _ = await self.client.request("POST", "/generate-exam", query=query)
+        return status
+
+    async def progress_get(self):
+        status, _ = await self.client.request("GET", f"/users/{random.choice(self.user_ids)}/progress")
+        return status
+
+    async def progress_post(self):
+        skills = [
+            {
+                "skill_id": skill_id,
+                "total_questions": random.randint(0, 100),
+                "correct_answers": random.randint(0, 50),
+                "last_answers": [random.random() < 0.7 for _ in range(20)],
+                "mastery_level": random.choice(["weak", "learning", "mastered"]),
+                "last_practiced": time.strftime("%Y-%m-%d"),
+            }
+            for skill_id in random.sample(self.skills, 5)
+        ]
+        body = {
+            "total_questions": random.randint(0, 1000),
+            "total_correct": random.randint(0, 500),
+            "streak": random.randint(0, 10),
+            "points": random.randint(0, 5000),
+            "skills": skills,
+        }
+        status, _ = await self.client.request("POST", f"/users/{random.choice(self.user_ids)}/progress", json_body=body)
+        return status
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))]
+
+
+async def run(args):
+    from main import app
+    from generators import SKILL_GENERATORS
+
+    client = ASGIClient(app)
+    shutdown = await client.lifespan()
+
+    user_ids = []
+    for i in range(args.users):
+        body = {"email": f"load{i}@example.com", "name": f"Load {i}", "google_id": f"load-{i}"}
+        status, data = await client.request("POST", "/users/sync", json_body=body)
+        if status != 200:
+            raise RuntimeError(f"User sync failed: {status} {data}")
+        user_ids.append(data["id"])
+
+    scenario = Scenario(client, list(SKILL_GENERATORS.keys()), user_ids)
+    mix = parse_mix(args.mix)
+    unknown = [name for name in mix if name not in TRAFFIC_TYPES or not callable(getattr(scenario, name, None))]
+    if unknown:
+        raise SystemExit(f"Unknown traffic types: {', '.join(unknown)}")
+    names, weights = list(mix), list(mix.values())
+
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    remaining = iter(range(args.requests))
+
+    async def worker():
+        for _ in remaining:
+            name = random.choices(names, weights=weights, k=1)[0]
+            start = time.perf_counter()
+            status = await getattr(scenario, name)()
+            latencies[name].append(time.perf_counter() - start)
+            if status >= 400:
+                errors[name] += 1
+
+    monitor = LoopMonitor()
+    monitor.start()
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+    await monitor.stop()
+    await shutdown()
+
+    total = sum(len(v) for v in latencies.values())
+    print(f"\n{total} requests in {elapsed:.2f}s -> {total / elapsed:.1f} req/s (concurrency {args.concurrency})\n")
+    print(f"{'endpoint':<15}{'count':>7}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'errors':>8}")
+    for name in names:
+        values = sorted(latencies[name])
+        if not values:
+            continue
+        print(
+            f"{name:<15}{len(values):>7}{len(values) / elapsed:>9.1f}"
+            f"{percentile(values, 50) * 1000:>10.2f}{percentile(values, 95) * 1000:>10.2f}"
+            f"{percentile(values, 99) * 1000:>10.2f}{values[-1] * 1000:>10.2f}{errors[name]:>8}"
+        )
+    print(
+        f"\nEvent loop blocked {monitor.blocked_seconds:.2f}s "
+        f"({monitor.blocked_seconds / elapsed:.0%} of wall time) in {monitor.stalls} stalls, "
+        f"max lag {monitor.max_lag * 1000:.1f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Comma-separated name=weight pairs")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--database-url", help="Database to load instead of a throwaway SQLite file (ignores DATABASE_URL)")
+    args = parser.parse_args()
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    # Point the app at the database before run() imports database.py
+    tmp_dir = tempfile.mkdtemp(prefix="mathstep-load-")
+    os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{tmp_dir}/load.db"
+    try:
+        asyncio.run(run(args))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+MathStep Event-Loop Stall Detector
+Opt-in watchdog that attributes event-loop stalls to a route and culprit call
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter as Tally, deque
+from typing import Dict, Optional
+
+from metrics import registry, LATENCY_BUCKETS, MetricsMiddleware
+
+# Enable with LOOP_STALL_DETECTOR=1
+LOOP_STALL_DETECTOR = os.getenv("LOOP_STALL_DETECTOR", "0") == "1"
+
+# Stalls shorter than this are ignored
+LOOP_STALL_THRESHOLD_MS = float(os.getenv("LOOP_STALL_THRESHOLD_MS", "100"))
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+GENERATORS_DIR = os.path.join(BACKEND_DIR, "generators")
+
+# The metrics middleware frame holds the request scope, with the matched route once routed
+_MIDDLEWARE_CODE = MetricsMiddleware.__call__.__code__
+
+# Functions reported by name when found on the stalled stack
+GRADING_FUNCTIONS = {"check_answer", "parse_answer"}
+
+loop_stalls = registry.counter("mathstep_event_loop_stalls_total", "Event-loop stalls over the threshold", ("route", "culprit"))
+loop_stall_seconds = registry.histogram(
+    "mathstep_event_loop_stall_seconds", "Duration of event-loop stalls", ("route",), LATENCY_BUCKETS
+)
+
+
+class LoopStallDetector:
+    """
+    A heartbeat task on the loop stamps the time every few milliseconds.
+    A watchdog thread notices when the stamp goes stale, samples the loop
+    thread's stack while it stays stale, and records the stall when the
+    heartbeat resumes, attributed to the most frequently sampled
+    (route, culprit) pair.
+    """
+
+    def __init__(self, threshold_ms: float = LOOP_STALL_THRESHOLD_MS):
+        self.threshold = threshold_ms / 1000
+        self.interval = min(self.threshold / 4, 0.025)
+        self.recent = deque(maxlen=100)
+        self._routes: Dict[object, str] = {}
+        self._last_beat = time.perf_counter()
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, app) -> None:
+        """Install on the running loop; call from the app startup hook"""
+        # Map endpoint code objects to route templates for stack attribution;
+        # routes of included routers are read from the request scope instead
+        for route in app.routes:
+            endpoint = getattr(route, "endpoint", None)
+            if endpoint is not None and hasattr(endpoint, "__code__"):
+                self._routes[endpoint.__code__] = route.path
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="loop-stall-watchdog", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            self._last_beat = time.perf_counter()
+            await asyncio.sleep(self.interval)
+
+    def _watch(self) -> None:
+        samples = Tally()
+        stalled_since = None
+        while not self._stop.wait(self.interval):
+            beat = self._last_beat
+            if time.perf_counter() - beat > self.threshold:
+                stalled_since = beat
+                samples[self._attribute()] += 1
+            elif stalled_since is not None:
+                # Heartbeat resumed; the stall ended at the new beat
+                self._record(beat - stalled_since - self.interval, samples)
+                samples = Tally()
+                stalled_since = None
+
+    def _attribute(self):
+        """(route, culprit) for the loop thread's current stack"""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        route = "unknown"
+        culprit = None
+        innermost = None
+        uses_db = False
+        while frame is not None:
+            code = frame.f_code
+            filename = code.co_filename
+            if route == "unknown" and code in self._routes:
+                route = self._routes[code]
+            elif route == "unknown" and code is _MIDDLEWARE_CODE:
+                # Endpoints of included routers aren't in app.routes
+                matched = frame.f_locals.get("scope", {}).get("route")
+                route = getattr(matched, "path", route)
+            if "sqlalchemy" in filename:
+                uses_db = True
+            if innermost is None and filename.startswith(BACKEND_DIR):
+                innermost = f"{os.path.basename(filename)}:{code.co_name}"
+            if culprit is None:
+                if filename.startswith(GENERATORS_DIR) and code.co_name == "generate":
+                    owner = frame.f_locals.get("self")
+                    culprit = f"{type(owner).__name__}.generate" if owner is not None else "generate"
+                elif code.co_name in GRADING_FUNCTIONS and filename.startswith(BACKEND_DIR):
+                    culprit = code.co_name
+            frame = frame.f_back
+        if culprit is None:
+            if uses_db:
+                culprit = f"database ({innermost})" if innermost else "database"
+            else:
+                culprit = innermost or "other"
+        return route, culprit
+
+    def _record(self, duration: float, samples: Tally) -> None:
+        if not samples:
+            return
+        route, culprit = samples.most_common(1)[0][0]
+        loop_stalls.inc(route, culprit)
+        loop_stall_seconds.observe(duration, route)
+        self.recent.append({"route": route, "culprit": culprit, "seconds": round(duration, 4), "at": time.time()})
+        print(f"[loop-stall] {duration * 1000:.0f}ms in {route} ({culprit})")
+
+
+# Shared instance, started by main.py when LOOP_STALL_DETECTOR=1
+stall_detector = LoopStallDetector()
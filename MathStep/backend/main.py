@@ -3,15 +3,35 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import event
 from pydantic import BaseModel
-from sympy import sympify, simplify
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional, List
 import traceback
 
 from generators import generate_question, get_skills_for_grade, SKILL_GENERATORS, GRADE_SKILLS
+from database import engine, init_db
+from routes import users_router, analytics_router
+from write_behind import counter_buffer
+from adaptive import ability_engine
+from answer_keys import answer_keys, parse_answer, check_answer
+from events import answer_events
+from cache import progress_cache
+from loop_monitor import stall_detector, LOOP_STALL_DETECTOR
+from metrics import registry, MetricsMiddleware, count_query, grading_seconds, app_errors, bounded_label
 
 app = FastAPI(title="MathStep API", version="2.0")
+app.include_router(users_router)
+app.include_router(analytics_router)
+app.add_middleware(MetricsMiddleware)
+
+# Metrics read at scrape time and the per-request DB query counter
+registry.gauge("mathstep_progress_cache_hits", "Progress cache hits", lambda: progress_cache.hits)
+registry.gauge("mathstep_progress_cache_misses", "Progress cache misses", lambda: progress_cache.misses)
+registry.gauge("mathstep_answer_keys_outstanding", "Issued questions still gradeable", lambda: len(answer_keys))
+registry.gauge("mathstep_answer_events_dropped", "Answer events dropped instead of persisted", lambda: answer_events.dropped)
+event.listen(engine, "before_cursor_execute", count_query)
 
 # Configure CORS
 app.add_middleware(
@@ -23,10 +43,37 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def startup():
+    init_db()
+    counter_buffer.start()
+    ability_engine.start()
+    answer_events.start()
+    if LOOP_STALL_DETECTOR:
+        stall_detector.start(app)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await counter_buffer.stop()
+    await ability_engine.stop()
+    await answer_events.stop()
+    if LOOP_STALL_DETECTOR:
+        await stall_detector.stop()
+
+
 # Request/Response Models
 class GradeRequest(BaseModel):
     student_answer: str
-    correct_answer: str
+    question_id: Optional[str] = None  # Issued with the question; answer key stays server-side
+    correct_answer: Optional[str] = None  # Legacy: client-held answer key
+    # Optional context - when set, the answer updates the adaptive engine
+    user_id: Optional[int] = None
+    skill_id: Optional[str] = None
+    difficulty: Optional[int] = None
+    # Append the result to the answer-event stream (needs user_id)
+    record: bool = False
+    latency_ms: Optional[int] = None
 
 class GradeResponse(BaseModel):
     is_correct: bool
@@ -34,7 +81,12 @@ class GradeResponse(BaseModel):
 
 class QuestionRequest(BaseModel):
     skill_id: str
-    difficulty: int = 2
+    difficulty: Optional[int] = None  # Chosen by the adaptive engine when user_id is set, else 2
+    user_id: Optional[int] = None
+
+class NextQuestionRequest(BaseModel):
+    user_id: int
+    grade: Optional[int] = None  # Restrict to skills for this grade
 
 class QuestionResponse(BaseModel):
     question: str
@@ -44,44 +96,90 @@ class QuestionResponse(BaseModel):
     skill_id: str
     difficulty: int
     type: str
+    question_id: Optional[str] = None
 
 
 # Existing grading endpoint
 @app.post("/grade", response_model=GradeResponse)
 async def grade_answer(request: GradeRequest):
+    if request.question_id:
+        key = answer_keys.get(request.question_id)
+        if key is None:
+            raise HTTPException(status_code=404, detail="Unknown or expired question")
+        correct_expr, correct_answer = key.parsed, key.answer
+        skill_id, difficulty = key.skill_id, key.difficulty
+    elif request.correct_answer is not None:
+        correct_expr, correct_answer = parse_answer(request.correct_answer), request.correct_answer
+        skill_id, difficulty = request.skill_id, request.difficulty or 2
+    else:
+        raise HTTPException(status_code=400, detail="question_id or correct_answer is required")
+    
     try:
-        student_expr = sympify(request.student_answer, evaluate=False)
-        correct_expr = sympify(request.correct_answer, evaluate=False)
-        
-        diff = simplify(student_expr - correct_expr)
-        is_correct = diff == 0
-        
-        if is_correct:
-            return GradeResponse(is_correct=True, message="أحسنت! إجابة صحيحة 🎉")
-        else:
-            return GradeResponse(is_correct=False, message="حاول مرة أخرى")
+        with grading_seconds.time(bounded_label(skill_id, SKILL_GENERATORS)):
+            is_correct = check_answer(request.student_answer, correct_expr, correct_answer)
     except Exception as e:
         print(f"Error: {e}")
+        app_errors.inc("grade_parse")
         return GradeResponse(is_correct=False, message="تعذر فهم الإجابة")
+    
+    # Bookkeeping must never change the grade the student sees
+    if request.user_id is not None and skill_id:
+        try:
+            ability_engine.record_answer(request.user_id, skill_id, difficulty, is_correct)
+            if request.record:
+                answer_events.record(request.user_id, skill_id, is_correct, request.latency_ms)
+        except Exception as e:
+            print(f"Error recording answer: {e}")
+            app_errors.inc("answer_record")
+            traceback.print_exc()
+    
+    if is_correct:
+        return GradeResponse(is_correct=True, message="أحسنت! إجابة صحيحة 🎉")
+    return GradeResponse(is_correct=False, message="حاول مرة أخرى")
 
 
 # NEW: Generate question endpoint
 @app.post("/generate-question", response_model=QuestionResponse)
 async def generate_question_endpoint(request: QuestionRequest):
     """Generate a unique question for a skill"""
+    difficulty = request.difficulty
+    if difficulty is None:
+        difficulty = ability_engine.pick_difficulty(request.user_id, request.skill_id) if request.user_id is not None else 2
+    
     try:
-        result = generate_question(request.skill_id, request.difficulty)
+        result = generate_question(request.skill_id, difficulty)
         
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
         
+        result["question_id"] = answer_keys.issue(result)
         return QuestionResponse(**result)
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error generating question: {e}")
+        app_errors.inc("generate")
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Adaptive: pick the next skill and difficulty for a learner
+@app.post("/next-question", response_model=QuestionResponse)
+async def next_question(request: NextQuestionRequest):
+    """Generate the question the adaptive engine recommends next"""
+    skills = get_skills_for_grade(request.grade) if request.grade else list(SKILL_GENERATORS.keys())
+    if not skills:
+        raise HTTPException(status_code=400, detail="No skills for this grade")
+    
+    skill_id, difficulty = ability_engine.next_question(request.user_id, skills)
+    result = generate_question(skill_id, difficulty)
+    if "error" in result:
+        app_errors.inc("generate")
+        raise HTTPException(status_code=500, detail=result["error"])
+    result["question_id"] = answer_keys.issue(result)
+    return QuestionResponse(**result)
+
+
 # NEW: Get skills for grade
 @app.get("/skills-for-grade/{grade}")
 async def skills_for_grade(grade: int):
@@ -102,8 +200,11 @@ async def get_all_skills():
 
 # NEW: Generate exam questions
 @app.post("/generate-exam")
-async def generate_exam(grade: int, num_questions: int = 15):
-    """Generate a set of exam questions for a grade"""
+async def generate_exam(grade: int, num_questions: int = 15, user_id: Optional[int] = None):
+    """
+    Generate a set of exam questions for a grade.
+    With a user_id, each question's difficulty comes from the adaptive engine.
+    """
     skills = get_skills_for_grade(grade)
     questions = []
     
@@ -111,13 +212,23 @@ async def generate_exam(grade: int, num_questions: int = 15):
     selected_skills = random.choices(skills, k=num_questions)
     
     for skill_id in selected_skills:
-        difficulty = random.randint(2, 3)
+        if user_id is not None:
+            difficulty = ability_engine.pick_difficulty(user_id, skill_id)
+        else:
+            difficulty = random.randint(2, 3)
         q = generate_question(skill_id, difficulty)
+        q["question_id"] = answer_keys.issue(q)
         questions.append(q)
     
     return {"grade": grade, "questions": questions}
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """Prometheus text exposition of all metrics"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/")
 async def root():
     return {"message": "MathStep API v2.0 - Question Generation Ready"}
@@ -0,0 +1,123 @@
+"""
+MathStep Data Migrations
+One-off backfills for schema changes; each is safe to re-run
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy.orm import Session
+
+from models import ExamResult, ExamSkill, UserProgress
+from scheduler import compute_next_review, parse_day
+
+
+def exam_skill_rows(exam_id: int, weak_skills, strong_skills) -> list:
+    """ExamSkill rows for an exam's weak/strong lists (duplicates dropped)"""
+    rows = [ExamSkill(exam_id=exam_id, skill_id=s, kind="weak") for s in dict.fromkeys(weak_skills or [])]
+    rows += [ExamSkill(exam_id=exam_id, skill_id=s, kind="strong") for s in dict.fromkeys(strong_skills or [])]
+    return rows
+
+
+def backfill_exam_skills(db: Session, batch_size: int = 500) -> int:
+    """
+    Copy ExamResult.weak_skills/strong_skills JSON into exam_skills.
+    Walks exam_results in id order and skips exams that already have
+    rows, committing once per batch. Returns the number of exams migrated.
+    """
+    migrated = 0
+    last_id = 0
+    while True:
+        batch = (
+            db.query(ExamResult.id, ExamResult.weak_skills, ExamResult.strong_skills)
+            .filter(ExamResult.id > last_id)
+            .filter(~ExamResult.skills.any())
+            .order_by(ExamResult.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            break
+        for exam in batch:
+            db.add_all(exam_skill_rows(exam.id, exam.weak_skills, exam.strong_skills))
+        db.commit()
+        migrated += len(batch)
+        last_id = batch[-1].id
+    return migrated
+
+
+def recompute_next_reviews(db: Session, batch_size: int = 1000) -> int:
+    """
+    Replace client-written next_review strings with server-computed dates.
+    Never loads the old next_review value, so malformed strings are fine.
+    """
+    updated = 0
+    last_id = 0
+    while True:
+        batch = (
+            db.query(UserProgress.id, UserProgress.last_answers, UserProgress.mastery_level, UserProgress.last_practiced)
+            .filter(UserProgress.id > last_id)
+            .order_by(UserProgress.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            break
+        db.bulk_update_mappings(UserProgress, [
+            {
+                "id": p.id,
+                "next_review": compute_next_review(p.last_answers, p.mastery_level, practiced_on=parse_day(p.last_practiced)),
+            }
+            for p in batch
+        ])
+        db.commit()
+        updated += len(batch)
+        last_id = batch[-1].id
+    return updated
+
+
+# Startup migrations in order: (version, description, step). SQLite's
+# PRAGMA user_version records the last one a database has had.
+MIGRATIONS = [
+    # next_review used to be a client-written String; the Date column can't read malformed ones
+    (1, "recomputed next_review for {} progress rows", recompute_next_reviews),
+    # /analytics/skills/{id}/students only sees exams with exam_skills rows
+    (2, "backfilled exam_skills for {} exams", backfill_exam_skills),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def run_pending(engine) -> None:
+    """
+    Run the migrations a database has not had yet (called from init_db).
+    SQLite tracks this in PRAGMA user_version; other databases are
+    created with the current schema and need none.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.connect() as conn:
+        version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+    for target, description, step in MIGRATIONS:
+        if version >= target:
+            continue
+        db = Session(bind=engine)
+        try:
+            count = step(db)
+        finally:
+            db.close()
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"PRAGMA user_version = {target}")
+        print(f"[OK] Migrated database to version {target} ({description.format(count)})")
+
+
+if __name__ == "__main__":
+    from database import SessionLocal, init_db
+
+    init_db()
+    session = SessionLocal()
+    try:
+        print(f"[OK] Backfilled exam_skills for {backfill_exam_skills(session)} exams")
+        print(f"[OK] Recomputed next_review for {recompute_next_reviews(session)} progress rows")
+    finally:
+        session.close()
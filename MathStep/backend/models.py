@@ -3,10 +3,10 @@ MathStep Database Models
 User, Progress, and Exam Result models
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, Float, Boolean, Date, DateTime, ForeignKey, Text, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
-from .database import Base
+from database import Base
 
 
 class User(Base):
@@ -46,13 +46,15 @@ class UserProgress(Base):
     last_answers = Column(JSON, default=list)  # Last 20 answers as boolean array
     mastery_level = Column(String(20), default="locked")  # locked, weak, learning, mastered
     last_practiced = Column(String(10), nullable=True)  # YYYY-MM-DD
-    next_review = Column(String(10), nullable=True)  # YYYY-MM-DD for spaced repetition
+    next_review = Column(Date, nullable=True)  # Computed server-side by scheduler.py
     
     # Relationship
     user = relationship("User", back_populates="progress")
     
     # Unique constraint: one progress per skill per user
     __table_args__ = (
+        # Due queue: range scan of a user's skills by review date
+        Index("ix_user_progress_user_next_review", "user_id", "next_review"),
         {"sqlite_autoincrement": True},
     )
 
@@ -75,5 +77,79 @@ class ExamResult(Base):
     taken_at = Column(DateTime, default=datetime.utcnow)
     duration_seconds = Column(Integer, nullable=True)
     
-    # Relationship
+    # Relationships
     user = relationship("User", back_populates="exam_results")
+    skills = relationship("ExamSkill", back_populates="exam", cascade="all, delete-orphan")
+    
+    # Keyset pagination of a user's history: newest first on (taken_at, id)
+    __table_args__ = (
+        Index("ix_exam_results_user_taken", "user_id", "taken_at", "id"),
+    )
+
+
+class ExamSkill(Base):
+    """Normalized weak/strong skills of an exam result, indexed by skill"""
+    __tablename__ = "exam_skills"
+
+    exam_id = Column(Integer, ForeignKey("exam_results.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(String(100), primary_key=True)
+    kind = Column(String(10), primary_key=True)  # weak, strong
+    
+    # Relationship
+    exam = relationship("ExamResult", back_populates="skills")
+    
+    # Skill-centric lookups: "which exams were weak in X"
+    __table_args__ = (
+        Index("ix_exam_skills_skill_kind", "skill_id", "kind", "exam_id"),
+    )
+
+
+class SkillAnalytics(Base):
+    """Class-wide aggregates per skill, maintained incrementally on every save"""
+    __tablename__ = "skill_analytics"
+
+    skill_id = Column(String(100), primary_key=True)
+    
+    learners = Column(Integer, default=0)  # Users with a progress row for this skill
+    total_attempts = Column(Integer, default=0)
+    total_correct = Column(Integer, default=0)
+    
+    # Mastery level distribution across learners
+    mastery_locked = Column(Integer, default=0)
+    mastery_weak = Column(Integer, default=0)
+    mastery_learning = Column(Integer, default=0)
+    mastery_mastered = Column(Integer, default=0)
+    
+    # How often the skill shows up in diagnostic exam results
+    exam_weak_count = Column(Integer, default=0)
+    exam_strong_count = Column(Integer, default=0)
+    
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class SkillAbility(Base):
+    """Persisted adaptive-engine rating per user and skill"""
+    __tablename__ = "skill_abilities"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    skill_id = Column(String(100), primary_key=True)
+    
+    rating = Column(Float, nullable=False, default=1000.0)  # Elo-style ability
+    answers = Column(Integer, nullable=False, default=0)  # Graded answers seen
+
+
+class AnswerEvent(Base):
+    """Append-only log of graded answers, written in batches by events.py"""
+    __tablename__ = "answer_events"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    skill_id = Column(String(100), nullable=False)
+    
+    correct = Column(Boolean, nullable=False)
+    latency_ms = Column(Integer, nullable=True)  # Time the student took to answer
+    answered_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    __table_args__ = (
+        Index("ix_answer_events_user_answered", "user_id", "answered_at"),
+    )
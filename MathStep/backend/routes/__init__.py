@@ -3,3 +3,4 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from routes.users import router as users_router
+from routes.analytics import router as analytics_router
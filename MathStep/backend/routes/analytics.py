@@ -0,0 +1,67 @@
+"""
+MathStep Analytics Routes
+Class-wide skill aggregates for teachers
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from database import get_db
+from models import SkillAnalytics, ExamSkill, ExamResult, User
+from analytics import serialize_skill_analytics
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+
+# ==========================================
+# Routes
+# ==========================================
+
+@router.get("/skills")
+async def get_skill_analytics(db: Session = Depends(get_db)):
+    """
+    Aggregate mastery for every skill.
+    Reads the materialized rows only - one per skill, independent of user count.
+    """
+    rows = db.query(SkillAnalytics).order_by(SkillAnalytics.skill_id).all()
+    return {"skills": [serialize_skill_analytics(r) for r in rows]}
+
+
+@router.get("/skills/{skill_id}")
+async def get_single_skill_analytics(skill_id: str, db: Session = Depends(get_db)):
+    """Aggregate mastery for one skill"""
+    row = db.get(SkillAnalytics, skill_id)
+    if not row:
+        raise HTTPException(status_code=404, detail="No analytics for this skill")
+    return serialize_skill_analytics(row)
+
+
+@router.get("/skills/{skill_id}/students")
+async def get_students_for_skill(
+    skill_id: str,
+    kind: str = Query("weak", pattern="^(weak|strong)$"),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+):
+    """
+    Students whose exam results list the skill as weak (or strong).
+    Answered with an indexed join on exam_skills instead of decoding JSON.
+    """
+    rows = (
+        db.query(User.id, User.name, User.email)
+        .join(ExamResult, ExamResult.user_id == User.id)
+        .join(ExamSkill, ExamSkill.exam_id == ExamResult.id)
+        .filter(ExamSkill.skill_id == skill_id, ExamSkill.kind == kind)
+        .distinct()
+        .order_by(User.id)
+        .limit(limit)
+        .all()
+    )
+    return {
+        "skillId": skill_id,
+        "kind": kind,
+        "students": [{"id": r.id, "name": r.name, "email": r.email} for r in rows],
+    }
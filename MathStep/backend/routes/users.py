@@ -6,14 +6,23 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Response
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import Optional, List
-from datetime import datetime
+from datetime import date, datetime
+import base64
 
 from database import get_db
 from models import User, UserProgress, ExamResult
+from cache import progress_cache, etag_matches
+from write_behind import counter_buffer, COUNTER_FIELDS
+from analytics import AnalyticsDelta
+from migrations import exam_skill_rows
+from scheduler import compute_next_review, parse_day, REVIEW_DIFFICULTY
+from generators import generate_question
+from answer_keys import answer_keys
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -38,7 +47,7 @@ class SkillProgressData(BaseModel):
     last_answers: List[bool]
     mastery_level: str
     last_practiced: Optional[str] = None
-    next_review: Optional[str] = None
+    next_review: Optional[str] = None  # Ignored - computed server-side
 
 
 class UserProgressSync(BaseModel):
@@ -102,8 +111,36 @@ async def sync_user(user_data: GoogleUserData, db: Session = Depends(get_db)):
 
 
 @router.get("/{user_id}/progress")
-async def get_user_progress(user_id: int, db: Session = Depends(get_db)):
-    """Get all progress data for a user"""
+async def get_user_progress(
+    user_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Get all progress data for a user.
+    Served from the progress cache when possible; returns 304 when the
+    client's If-None-Match still matches the cached snapshot.
+    """
+    cached = progress_cache.get(user_id)
+    if cached is not None:
+        etag, payload = cached
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return payload
+    
+    generation = progress_cache.generation(user_id)
+    payload = _build_progress_payload(user_id, db)
+    etag = progress_cache.put(user_id, payload, generation)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return payload
+
+
+def _build_progress_payload(user_id: int, db: Session) -> dict:
+    """Load a user's progress snapshot from the database"""
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -120,7 +157,7 @@ async def get_user_progress(user_id: int, db: Session = Depends(get_db)):
             "lastAnswers": p.last_answers or [],
             "masteryLevel": p.mastery_level,
             "lastPracticed": p.last_practiced,
-            "nextReview": p.next_review,
+            "nextReview": p.next_review.isoformat() if p.next_review else None,
         }
     
     # Get exam history
@@ -138,12 +175,16 @@ async def get_user_progress(user_id: int, db: Session = Depends(get_db)):
         for e in exams
     ]
     
+    # Overlay counters still waiting in the write-behind buffer
+    counters = {field: getattr(user, field) for field in COUNTER_FIELDS}
+    counters.update(counter_buffer.pending(user_id) or {})
+    
     return {
-        "totalQuestionsAnswered": user.total_questions,
-        "totalCorrectAnswers": user.total_correct,
-        "streak": user.streak,
-        "points": user.points,
-        "lastActiveDate": user.last_active_date,
+        "totalQuestionsAnswered": counters["total_questions"],
+        "totalCorrectAnswers": counters["total_correct"],
+        "streak": counters["streak"],
+        "points": counters["points"],
+        "lastActiveDate": counters["last_active_date"],
         "skills": skills,
         "badges": [],  # TODO: implement badges
         "examHistory": exam_history,
@@ -158,13 +199,21 @@ async def save_user_progress(user_id: int, progress: UserProgressSync, db: Sessi
         raise HTTPException(status_code=404, detail="User not found")
     
     # Update user stats
-    user.total_questions = progress.total_questions
-    user.total_correct = progress.total_correct
-    user.streak = progress.streak
-    user.points = progress.points
-    user.last_active_date = progress.last_active_date
+    counters = {
+        "total_questions": progress.total_questions,
+        "total_correct": progress.total_correct,
+        "streak": progress.streak,
+        "points": progress.points,
+        "last_active_date": progress.last_active_date,
+    }
+    if counter_buffer.enabled:
+        counter_buffer.record(user_id, counters)
+    else:
+        for field, value in counters.items():
+            setattr(user, field, value)
     
     # Update skill progress
+    analytics = AnalyticsDelta()
     for skill_data in progress.skills:
         # Find existing or create new
         skill_progress = db.query(UserProgress).filter(
@@ -172,13 +221,28 @@ async def save_user_progress(user_id: int, progress: UserProgressSync, db: Sessi
             UserProgress.skill_id == skill_data.skill_id
         ).first()
         
+        analytics.progress_changed(
+            skill_data.skill_id,
+            skill_progress,
+            skill_data.total_questions,
+            skill_data.correct_answers,
+            skill_data.mastery_level,
+        )
+        
+        next_review = compute_next_review(
+            skill_data.last_answers,
+            skill_data.mastery_level,
+            previous_level=skill_progress.mastery_level if skill_progress else None,
+            practiced_on=parse_day(skill_data.last_practiced),
+        )
+        
         if skill_progress:
             skill_progress.total_questions = skill_data.total_questions
             skill_progress.correct_answers = skill_data.correct_answers
             skill_progress.last_answers = skill_data.last_answers
             skill_progress.mastery_level = skill_data.mastery_level
             skill_progress.last_practiced = skill_data.last_practiced
-            skill_progress.next_review = skill_data.next_review
+            skill_progress.next_review = next_review
         else:
             skill_progress = UserProgress(
                 user_id=user_id,
@@ -188,11 +252,13 @@ async def save_user_progress(user_id: int, progress: UserProgressSync, db: Sessi
                 last_answers=skill_data.last_answers,
                 mastery_level=skill_data.mastery_level,
                 last_practiced=skill_data.last_practiced,
-                next_review=skill_data.next_review,
+                next_review=next_review,
             )
             db.add(skill_progress)
     
+    analytics.apply(db)
     db.commit()
+    progress_cache.invalidate(user_id)
     return {"success": True}
 
 
@@ -214,6 +280,126 @@ async def save_exam_result(user_id: int, result: ExamResultData, db: Session = D
         duration_seconds=result.duration_seconds,
     )
     db.add(exam)
+    db.flush()
+    db.add_all(exam_skill_rows(exam.id, result.weak_skills, result.strong_skills))
+    
+    analytics = AnalyticsDelta()
+    analytics.exam_recorded(result.weak_skills, result.strong_skills)
+    analytics.apply(db)
     db.commit()
+    progress_cache.invalidate(user_id)
     
     return {"success": True, "exam_id": exam.id}
+
+
+def _encode_exam_cursor(taken_at: datetime, exam_id: int) -> str:
+    raw = f"{taken_at.isoformat()}|{exam_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_exam_cursor(cursor: str) -> tuple:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        taken_at, exam_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(taken_at), int(exam_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@router.get("/{user_id}/exams")
+async def get_exam_history(
+    user_id: int,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    grade: Optional[int] = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Page through a user's exam history, newest first.
+    Uses keyset pagination on (taken_at, id) so every page is an index
+    range scan; pass the returned nextCursor to get the following page.
+    """
+    if not db.query(User.id).filter(User.id == user_id).first():
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    # Only the columns the history view needs
+    query = db.query(
+        ExamResult.id,
+        ExamResult.taken_at,
+        ExamResult.grade,
+        ExamResult.score,
+        ExamResult.total_questions,
+        ExamResult.percentage,
+        ExamResult.duration_seconds,
+    ).filter(ExamResult.user_id == user_id)
+    
+    if grade is not None:
+        query = query.filter(ExamResult.grade == grade)
+    
+    if cursor:
+        taken_at, exam_id = _decode_exam_cursor(cursor)
+        query = query.filter(or_(
+            ExamResult.taken_at < taken_at,
+            and_(ExamResult.taken_at == taken_at, ExamResult.id < exam_id),
+        ))
+    
+    # Fetch one extra row to know whether another page exists
+    rows = query.order_by(ExamResult.taken_at.desc(), ExamResult.id.desc()).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    
+    exams = [
+        {
+            "id": r.id,
+            "date": r.taken_at.isoformat(),
+            "grade": r.grade,
+            "score": r.score,
+            "totalQuestions": r.total_questions,
+            "percentage": r.percentage,
+            "durationSeconds": r.duration_seconds,
+        }
+        for r in rows
+    ]
+    
+    return {
+        "exams": exams,
+        "nextCursor": _encode_exam_cursor(rows[-1].taken_at, rows[-1].id) if has_more else None,
+    }
+
+
+@router.get("/{user_id}/due")
+async def get_due_skills(
+    user_id: int,
+    limit: int = Query(5, ge=1, le=20),
+    db: Session = Depends(get_db),
+):
+    """
+    Skills due for review today, most overdue first, each with a
+    freshly generated question at a difficulty matching its mastery.
+    """
+    if not db.query(User.id).filter(User.id == user_id).first():
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    # Range scan on (user_id, next_review)
+    due = (
+        db.query(UserProgress.skill_id, UserProgress.mastery_level, UserProgress.next_review)
+        .filter(UserProgress.user_id == user_id, UserProgress.next_review <= date.today())
+        .order_by(UserProgress.next_review)
+        .limit(limit)
+        .all()
+    )
+    
+    items = []
+    for p in due:
+        question = generate_question(p.skill_id, REVIEW_DIFFICULTY.get(p.mastery_level, 2))
+        if "error" in question:
+            continue
+        question["question_id"] = answer_keys.issue(question)
+        items.append({
+            "skillId": p.skill_id,
+            "masteryLevel": p.mastery_level,
+            "nextReview": p.next_review.isoformat(),
+            "question": question,
+        })
+    
+    return {"due": items}
@@ -0,0 +1,94 @@
+"""
+MathStep Spaced-Repetition Scheduler
+Computes next review dates from answer history and mastery transitions
+"""
+from datetime import date, timedelta
+from typing import List, Optional
+
+# Base interval in days for each mastery level (locked skills are not scheduled)
+BASE_INTERVAL_DAYS = {
+    "weak": 1,
+    "learning": 2,
+    "mastered": 4,
+}
+
+MASTERY_ORDER = ["locked", "weak", "learning", "mastered"]
+
+# Longest gap between reviews
+MAX_INTERVAL_DAYS = 60
+
+# Generator difficulty to serve for a due skill at each mastery level
+REVIEW_DIFFICULTY = {
+    "weak": 1,
+    "learning": 2,
+    "mastered": 3,
+}
+
+
+# Answers kept in UserProgress.last_answers
+ANSWER_HISTORY_SIZE = 20
+
+
+def mastery_from_answers(last_answers: Optional[List[bool]]) -> str:
+    """Mastery level implied by the recent answer history"""
+    answers = last_answers or []
+    if not answers:
+        return "locked"
+    accuracy = sum(answers) / len(answers)
+    if len(answers) >= 10 and accuracy >= 0.9:
+        return "mastered"
+    if accuracy >= 0.6:
+        return "learning"
+    return "weak"
+
+
+def correct_streak(last_answers: Optional[List[bool]]) -> int:
+    """Number of consecutive correct answers at the end of the history"""
+    streak = 0
+    for answer in reversed(last_answers or []):
+        if not answer:
+            break
+        streak += 1
+    return streak
+
+
+def parse_day(value: Optional[str]) -> Optional[date]:
+    """Parse a YYYY-MM-DD string, returning None when missing or malformed"""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def compute_next_review(
+    last_answers: Optional[List[bool]],
+    mastery_level: str,
+    previous_level: Optional[str] = None,
+    practiced_on: Optional[date] = None,
+) -> Optional[date]:
+    """
+    Next review date for a skill.
+    A wrong last answer or a drop in mastery brings the skill back tomorrow;
+    otherwise the base interval for the level doubles for every two
+    consecutive correct answers, capped at MAX_INTERVAL_DAYS.
+    """
+    base = BASE_INTERVAL_DAYS.get(mastery_level)
+    if base is None:
+        return None
+
+    practiced_on = practiced_on or date.today()
+    answers = last_answers or []
+
+    demoted = (
+        previous_level in MASTERY_ORDER
+        and mastery_level in MASTERY_ORDER
+        and MASTERY_ORDER.index(mastery_level) < MASTERY_ORDER.index(previous_level)
+    )
+    if demoted or (answers and not answers[-1]):
+        return practiced_on + timedelta(days=1)
+
+    # Cap the exponent so the shift stays small before clamping
+    interval = base * (2 ** min(correct_streak(answers) // 2, 6))
+    return practiced_on + timedelta(days=min(interval, MAX_INTERVAL_DAYS))
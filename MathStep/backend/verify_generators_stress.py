@@ -0,0 +1,503 @@
+"""
+Property-based stress verifier for generator answers.
+
+verify_all_skills.py only checks that each generator's answer grades
+against itself. This script generates large numbers of questions per
+skill and difficulty on every core, recomputes each answer independently
+with sympy from the expression (or the question text when the expression
+is empty) and reports every mismatch with the seed that reproduces it.
+
+Every question is generated after random.seed(seed), so a mismatch is
+replayed with --replay skill_id:difficulty:seed. Generators draw from small
+parameter spaces, so each worker memoizes verdicts by (question,
+expression, answer) and sympy only runs once per distinct question.
+
+Questions no oracle recognises are counted as unverified. A skill whose
+unverified share is above --max-unverified is marked ⚠ and fails the
+run, so a skill the oracles never check cannot pass as ✅.
+
+Throughput is bounded by sympy: roughly 400 questions/s on 8 workers, so
+the default 10,000 questions per skill (about 280k in all) takes 10-15
+minutes. The old default of --count 1000000 takes about a day.
+
+Usage:
+  python verify_generators_stress.py                         # 10k questions per skill
+  python verify_generators_stress.py --count 200000 --skills integrals,inequalities
+  python verify_generators_stress.py --workers 8 --output stress_report.json
+  python verify_generators_stress.py --replay integrals:3:1234
+  python verify_generators_stress.py --max-unverified 0.25   # tolerate more unchecked questions
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import argparse
+import json
+import random
+import re
+import time
+from collections import defaultdict
+from multiprocessing import Pool
+
+from sympy import (
+    E, I, S, Complement, FiniteSet, Rational, Symbol, diff, expand,
+    factorint, gcd, integrate, lcm, limit, log, nan, oo, simplify, solve, sqrt, zoo,
+)
+from sympy.calculus.util import continuous_domain
+from sympy.core.relational import Rel
+from sympy.parsing.sympy_parser import (
+    implicit_multiplication, parse_expr, rationalize, standard_transformations,
+)
+
+from generators import SKILL_GENERATORS
+
+DIFFICULTIES = [1, 2, 3, 4, 5]
+
+# Questions per skill by default (see the run time note above)
+DEFAULT_COUNT = 10_000
+
+# Questions per chunk handed to a worker
+CHUNK_SIZE = 20000
+
+# Examples kept per chunk for each failure kind
+MAX_EXAMPLES = 5
+
+# Verdict cache entries per worker before it is reset
+MAX_CACHED_VERDICTS = 200000
+
+# Largest share of a skill's questions that may go unverified
+MAX_UNVERIFIED_SHARE = 0.05
+
+x = Symbol("x")
+y = Symbol("y")
+
+LOCALS = {"x": x, "y": y, "i": I, "e": E}
+
+# rationalize keeps decimals exact, so 2.3333333333333335 != 7/3
+TRANSFORMS = standard_transformations + (implicit_multiplication, rationalize)
+
+LATEX_SYMBOLS = [
+    ("\\left", ""),
+    ("\\right", ""),
+    ("\\,", " "),
+    ("\\cdot", "*"),
+    ("\\times", "*"),
+    ("×", "*"),
+    ("\\div", "/"),
+    ("÷", "/"),
+    ("\\geq", ">="),
+    ("\\leq", "<="),
+    ("≥", ">="),
+    ("≤", "<="),
+    ("≠", "!="),
+    ("\\infty", "oo"),
+    ("°", "*pi/180"),
+    ("\\sin", "sin"),
+    ("\\cos", "cos"),
+    ("\\tan", "tan"),
+]
+
+RELATION = re.compile(r"(>=|<=|!=|>|<)")
+
+
+class Unsupported(Exception):
+    """No oracle recognises this question's shape"""
+
+
+def latex_to_text(tex):
+    """Rewrite the LaTeX subset the generators emit as sympy input"""
+    s = re.sub(r"\\text\{[^{}]*\}", " ", tex)
+    for old, new in LATEX_SYMBOLS:
+        s = s.replace(old, new)
+    previous = None
+    while previous != s:
+        previous = s
+        s = re.sub(r"\\sqrt\{([^{}]*)\}", r"sqrt(\1)", s)
+        s = re.sub(r"\\frac\{([^{}]*)\}\{([^{}]*)\}", r"((\1)/(\2))", s)
+    s = re.sub(r"(?<![A-Za-z\\])e\^\{([^{}]*)\}", r"exp(\1)", s)
+    s = re.sub(r"(?<![A-Za-z\\])e\^x", "exp(x)", s)
+    if "\\" in s:
+        raise Unsupported(f"LaTeX left after conversion: {s}")
+    return s.replace("{", "(").replace("}", ")").replace("^", "**")
+
+
+def to_sympy(tex):
+    return parse_expr(latex_to_text(tex), local_dict=LOCALS, transformations=TRANSFORMS)
+
+
+def to_relation(tex):
+    """'3x + 5 \\geq 20' -> Relational"""
+    text = latex_to_text(tex)
+    parts = RELATION.split(text, maxsplit=1)
+    if len(parts) != 3:
+        raise Unsupported(f"Not a relation: {tex}")
+    lhs, op, rhs = parts
+    return Rel(
+        parse_expr(lhs, local_dict=LOCALS, transformations=TRANSFORMS),
+        parse_expr(rhs, local_dict=LOCALS, transformations=TRANSFORMS),
+        op,
+    )
+
+
+# ==========================================
+# Oracles: recompute the expected answer
+# ==========================================
+
+def _equation_roots(tex, symbol=x):
+    lhs, rhs = tex.split("=", 1)
+    return FiniteSet(*solve(to_sympy(lhs) - to_sympy(rhs), symbol))
+
+
+def _from_question_text(question):
+    """Word problems whose numbers only appear in the question text"""
+    m = re.search(r"f\(x\) = (.+?) و g\(x\) = (.+?)، أوجد f\(g\((-?\d+)\)\)", question)
+    if m:
+        f, g = to_sympy(m.group(1)), to_sympy(m.group(2))
+        return "value", f.subs(x, g.subs(x, int(m.group(3))))
+    m = re.search(r"f\(x\) = (.+?)، أوجد f\((-?\d+)\)", question)
+    if m:
+        return "value", to_sympy(m.group(1)).subs(x, int(m.group(2)))
+    m = re.search(r"بميل (-?\d+) ويمر بالنقطة \((-?\d+), (-?\d+)\)", question)
+    if m:
+        slope, x1, y1 = (int(g) for g in m.groups())
+        return "value", expand(y1 + slope * (x - x1))
+    m = re.search(r"الضلعان (\d+) و (\d+)", question)
+    if m:
+        a, b = (int(g) for g in m.groups())
+        return "value", sqrt(a ** 2 + b ** 2)
+    m = re.search(r"نسبة التشابه (\d+):(\d+)\. إذا كان ضلع (\d+)", question)
+    if m:
+        small, large, side = (int(g) for g in m.groups())
+        return "value", Rational(side * large, small)
+    m = re.search(r"النسبة (\d+):(\d+)، وكان العدد الأول (\d+)", question)
+    if m:
+        a, b, first = (int(g) for g in m.groups())
+        return "value", Rational(b * first, a)
+    raise Unsupported("Unrecognised word problem")
+
+
+def expected_answer(question, expression):
+    """(kind, value) recomputed from scratch; raises Unsupported"""
+    tex = expression.strip()
+    if not tex:
+        return _from_question_text(question)
+
+    m = re.fullmatch(r"\\gcd\((\d+),\s*(\d+)\)", tex)
+    if m:
+        return "value", gcd(int(m.group(1)), int(m.group(2)))
+    m = re.fullmatch(r"\\text\{lcm\}\((\d+),\s*(\d+)\)", tex)
+    if m:
+        return "value", lcm(int(m.group(1)), int(m.group(2)))
+    m = re.fullmatch(r"(\d+):(\d+)", tex)
+    if m:
+        a, b = int(m.group(1)), int(m.group(2))
+        g = gcd(a, b)
+        return "ratio", (a // g, b // g)
+    if re.fullmatch(r"\d+", tex) and "الأولية" in question:
+        return "factorization", factorint(int(tex))
+
+    m = re.fullmatch(r"\\lim_\{x \\to ([^{}]+)\}\s*(.+)", tex)
+    if m:
+        return "value", limit(to_sympy(m.group(2)), x, to_sympy(m.group(1)))
+    m = re.fullmatch(r"\\int_\{([^{}]+)\}\^\{([^{}]+)\}\s*(.+?)\s*\\,\s*dx", tex)
+    if m:
+        lower, upper, body = (to_sympy(g) for g in m.groups())
+        return "value", integrate(body, (x, lower, upper))
+    m = re.fullmatch(r"\\int\s+(.+?)\s*\\,\s*dx", tex)
+    if m:
+        return "antiderivative", integrate(to_sympy(m.group(1)), x)
+
+    m = re.fullmatch(r"\\log_\{(\d+)\}\s*(.+?)\s*=\s*(.+)", tex)
+    if m:
+        base, arg, rhs = int(m.group(1)), to_sympy(m.group(2)), to_sympy(m.group(3))
+        return "set", FiniteSet(*solve(log(arg, base) - rhs, x))
+    m = re.fullmatch(r"\\log_\{(\d+)\}\s*(.+)", tex)
+    if m:
+        return "value", simplify(log(to_sympy(m.group(2)), int(m.group(1))))
+
+    points = re.findall(r"\((-?\d+),\s*(-?\d+)\)", tex)
+    if len(points) == 2 and "ميل" in question:
+        (x1, y1), (x2, y2) = [(int(a), int(b)) for a, b in points]
+        return "value", Rational(y2 - y1, x2 - x1)
+
+    if "\\\\" in tex:
+        first, second = re.split(r"\s*\\\\\s*", tex)
+        equations = [to_sympy(side.split("=")[0]) - to_sympy(side.split("=")[1]) for side in (first, second)]
+        solution = solve(equations, [x, y], dict=True)[0]
+        wanted = y if "أوجد y" in question else x
+        return "value", solution[wanted]
+
+    m = re.fullmatch(r"f\(x\) = (.+)", tex)
+    if m:
+        f = to_sympy(m.group(1))
+        if "اشتق" in question:
+            return "value", diff(f, x)
+        if "مجال" in question:
+            return "set", continuous_domain(f, x, S.Reals)
+        if "العكسية" in question:
+            return "value", solve(f - y, x)[0].subs(y, x)
+        raise Unsupported("Unknown question about f(x)")
+
+    m = re.fullmatch(r"y = (.+)", tex)
+    if m and "ميل" in question:
+        return "value", diff(to_sympy(m.group(1)), x)
+
+    if RELATION.search(latex_to_text(tex)):
+        return "set", to_relation(tex).as_set()
+    if "=" in tex:
+        return "set", _equation_roots(tex)
+
+    value = to_sympy(tex)
+    if question.startswith("حلل") and value.has(x):
+        return "factored", expand(value)
+    return "value", expand(value) if value.has(x) else simplify(value)
+
+
+# ==========================================
+# Comparing the generator's answer
+# ==========================================
+
+def _answer_value(text):
+    text = text.strip()
+    if text.lower() == "undefined":
+        return zoo
+    if text.endswith("%"):
+        return to_sympy(text[:-1]) / 100
+    if "=" in text:
+        text = text.split("=", 1)[1]
+    return to_sympy(text)
+
+
+def _answer_set(text):
+    text = text.strip()
+    if RELATION.search(latex_to_text(text)):
+        return to_relation(text).as_set()
+    if "=" in text:
+        text = text.split("=", 1)[1]
+    return FiniteSet(*(to_sympy(part) for part in text.split(",")))
+
+
+def _factor_counts(text):
+    counts = {}
+    for part in text.split("×"):
+        base, _, power = part.strip().partition("^")
+        counts[int(base)] = counts.get(int(base), 0) + (int(power) if power else 1)
+    return counts
+
+
+def _same_value(expected, got):
+    if expected.has(zoo, nan, oo) or got.has(zoo, nan, oo):
+        return expected == got
+    return simplify(expected - got) == 0
+
+
+def _same_set(expected, got):
+    if isinstance(expected, FiniteSet) and isinstance(got, FiniteSet):
+        if len(expected) != len(got):
+            return False
+        remaining = list(got)
+        for value in expected:
+            match = next((g for g in remaining if _same_value(value, g)), None)
+            if match is None:
+                return False
+            remaining.remove(match)
+        return True
+    return Complement(expected, got) == S.EmptySet and Complement(got, expected) == S.EmptySet
+
+
+def answer_matches(expected, answer):
+    kind, value = expected
+    text = str(answer).strip()
+    if kind == "ratio":
+        m = re.fullmatch(r"(-?\d+)\s*:\s*(-?\d+)", text)
+        return bool(m) and (int(m.group(1)), int(m.group(2))) == value
+    if kind == "factorization":
+        return _factor_counts(text) == value
+    if kind == "set":
+        return _same_set(value, _answer_set(text))
+    if kind == "antiderivative":
+        got = _answer_value(re.sub(r"\+\s*C\s*$", "", text))
+        return simplify(diff(got - value, x)) == 0
+    got = _answer_value(text)
+    if kind == "factored":
+        return (got.is_Mul or got.is_Pow) and expand(got - value) == 0
+    return _same_value(value, got)
+
+
+def verdict(question):
+    """('ok' | 'mismatch' | 'unverified', expected or reason)"""
+    try:
+        expected = expected_answer(question["question"], question["expression"])
+    except Exception as e:
+        return "unverified", f"{type(e).__name__}: {e}"
+    try:
+        ok = answer_matches(expected, question["answer"])
+    except Exception as e:
+        return "mismatch", f"{expected[1]} (answer unparseable: {type(e).__name__})"
+    return ("ok" if ok else "mismatch"), str(expected[1])
+
+
+# ==========================================
+# Parallel driver
+# ==========================================
+
+_verdicts = {}
+
+
+def generate_seeded(skill_id, difficulty, seed):
+    random.seed(seed)
+    return SKILL_GENERATORS[skill_id](difficulty=difficulty).generate()
+
+
+def verify_chunk(task):
+    """Worker: generate and verify seeds [first_seed, first_seed + count)"""
+    skill_id, difficulty, first_seed, count = task
+    tally = defaultdict(int)
+    examples = defaultdict(list)
+    for seed in range(first_seed, first_seed + count):
+        try:
+            question = generate_seeded(skill_id, difficulty, seed)
+        except Exception as e:
+            tally["errors"] += 1
+            if len(examples["errors"]) < MAX_EXAMPLES:
+                examples["errors"].append({"difficulty": difficulty, "seed": seed, "error": f"{type(e).__name__}: {e}"})
+            continue
+
+        key = (question["question"], question["expression"], str(question["answer"]))
+        result = _verdicts.get(key)
+        if result is None:
+            if len(_verdicts) >= MAX_CACHED_VERDICTS:
+                _verdicts.clear()
+            result = _verdicts[key] = verdict(question)
+        status, detail = result
+
+        tally[status] += 1
+        if status != "ok" and len(examples[status]) < MAX_EXAMPLES:
+            examples[status].append({
+                "difficulty": difficulty,
+                "seed": seed,
+                "question": question["question"],
+                "expression": question["expression"],
+                "answer": str(question["answer"]),
+                "expected" if status == "mismatch" else "reason": detail,
+            })
+    return skill_id, dict(tally), dict(examples)
+
+
+def build_tasks(skills, count, first_seed):
+    """Split count questions per skill evenly across difficulties and chunks"""
+    per_difficulty = max(1, count // len(DIFFICULTIES))
+    tasks = []
+    for skill_id in skills:
+        for difficulty in DIFFICULTIES:
+            for start in range(0, per_difficulty, CHUNK_SIZE):
+                tasks.append((skill_id, difficulty, first_seed + start, min(CHUNK_SIZE, per_difficulty - start)))
+    return tasks
+
+
+def unverified_share(entry):
+    return entry["unverified"] / entry["checked"] if entry["checked"] else 1.0
+
+
+def run(skills, count, workers, first_seed, max_unverified=MAX_UNVERIFIED_SHARE):
+    tasks = build_tasks(skills, count, first_seed)
+    remaining = defaultdict(int)
+    for task in tasks:
+        remaining[task[0]] += 1
+
+    report = {
+        skill_id: {"checked": 0, "ok": 0, "mismatch": 0, "unverified": 0, "errors": 0, "examples": defaultdict(list)}
+        for skill_id in skills
+    }
+    with Pool(workers) as pool:
+        for skill_id, tally, examples in pool.imap_unordered(verify_chunk, tasks):
+            entry = report[skill_id]
+            for status, n in tally.items():
+                entry[status] += n
+                if status != "errors":
+                    entry["checked"] += n
+            for status, items in examples.items():
+                entry["examples"][status].extend(items)
+            remaining[skill_id] -= 1
+            if remaining[skill_id] == 0:
+                if entry["mismatch"] or entry["errors"]:
+                    mark = "❌"
+                elif unverified_share(entry) > max_unverified:
+                    mark = "⚠"
+                else:
+                    mark = "✅"
+                print(
+                    f"{mark} {skill_id:<30} {entry['checked']:>9} checked  {entry['mismatch']:>7} mismatched  "
+                    f"{entry['unverified']:>7} unverified ({unverified_share(entry):>4.0%})  {entry['errors']:>5} errors",
+                    flush=True,
+                )
+    for entry in report.values():
+        entry["examples"] = {k: v[:MAX_EXAMPLES] for k, v in entry["examples"].items()}
+    return report
+
+
+def replay(spec):
+    skill_id, difficulty, seed = spec.split(":")
+    question = generate_seeded(skill_id, int(difficulty), int(seed))
+    status, detail = verdict(question)
+    print(json.dumps(question, ensure_ascii=False, indent=2))
+    print(f"\n{status}: {detail}")
+    return status == "ok"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skills", help="Comma-separated skill ids (default: all)")
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help=f"Questions per skill, spread over difficulties 1-5 (default: {DEFAULT_COUNT})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="First seed of each skill/difficulty range")
+    parser.add_argument("--max-unverified", type=float, default=MAX_UNVERIFIED_SHARE,
+                        help=f"Fail skills with a larger unverified share (default: {MAX_UNVERIFIED_SHARE})")
+    parser.add_argument("--output", help="Write the full report as JSON")
+    parser.add_argument("--replay", metavar="SKILL:DIFFICULTY:SEED", help="Regenerate and verify one question")
+    args = parser.parse_args()
+
+    if args.replay:
+        sys.exit(0 if replay(args.replay) else 1)
+
+    skills = args.skills.split(",") if args.skills else list(SKILL_GENERATORS.keys())
+    unknown = [s for s in skills if s not in SKILL_GENERATORS]
+    if unknown:
+        parser.error(f"Unknown skills: {', '.join(unknown)}")
+
+    print(f"Verifying {args.count} questions per skill for {len(skills)} skills on {args.workers} workers...\n", flush=True)
+    start = time.perf_counter()
+    report = run(skills, args.count, args.workers, args.seed, args.max_unverified)
+    elapsed = time.perf_counter() - start
+
+    checked = sum(r["checked"] for r in report.values())
+    unverified = sum(r["unverified"] for r in report.values())
+    failing = {s: r for s, r in report.items() if r["mismatch"] or r["errors"]}
+    unchecked = {s: r for s, r in report.items() if s not in failing and unverified_share(r) > args.max_unverified}
+    print(f"\n{checked} questions checked in {elapsed:.1f}s ({checked / elapsed:,.0f}/s), {unverified} unverified")
+
+    for skill_id, entry in failing.items():
+        print(f"\n{skill_id}:")
+        for item in entry["examples"].get("mismatch", []) + entry["examples"].get("errors", []):
+            detail = item.get("expected") or item.get("error")
+            print(
+                f"  d{item['difficulty']} seed {item['seed']}: {item.get('expression') or item.get('question', '')!s} "
+                f"-> answer {item.get('answer', '-')}, expected {detail}"
+            )
+        print(f"  replay: python verify_generators_stress.py --replay {skill_id}:<difficulty>:<seed>")
+
+    for skill_id, entry in unchecked.items():
+        print(f"\n⚠ {skill_id}: {entry['unverified']} of {entry['checked']} questions unverified ({unverified_share(entry):.0%})")
+        for item in entry["examples"].get("unverified", []):
+            print(f"  d{item['difficulty']} seed {item['seed']}: {item['expression'] or item['question']!s} -> {item['reason']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"elapsed_seconds": elapsed, "skills": report}, f, ensure_ascii=False, indent=2)
+        print(f"\n[OK] Report written to {args.output}")
+
+    sys.exit(1 if failing or unchecked else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+MathStep Write-Behind Buffer
+Coalesces User aggregate counter updates and flushes them in batches
+"""
+import asyncio
+import os
+import threading
+import time
+import traceback
+from typing import Any, Dict, Optional
+
+from database import SessionLocal
+from models import User
+
+# "immediate" writes counters in the request transaction (fully durable),
+# "buffered" keeps them in memory until the next flush
+COUNTER_WRITE_MODE = os.getenv("COUNTER_WRITE_MODE", "immediate")
+
+# Maximum staleness of buffered counters in the database
+COUNTER_FLUSH_INTERVAL = float(os.getenv("COUNTER_FLUSH_INTERVAL", "5"))
+
+# Flush early once this many users have pending updates
+COUNTER_MAX_PENDING = int(os.getenv("COUNTER_MAX_PENDING", "500"))
+
+# Columns owned by the buffer
+COUNTER_FIELDS = ("total_questions", "total_correct", "streak", "points", "last_active_date")
+
+
+class CounterBuffer:
+    """
+    In-memory buffer of user_id -> latest counter values.
+    Progress syncs send absolute values, so repeated updates for the same
+    user collapse into a single row update at flush time.
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        mode: str = COUNTER_WRITE_MODE,
+        flush_interval: float = COUNTER_FLUSH_INTERVAL,
+        max_pending: int = COUNTER_MAX_PENDING,
+    ):
+        self.session_factory = session_factory
+        self.mode = mode
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self.last_flush = time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode == "buffered"
+
+    def record(self, user_id: int, counters: Dict[str, Any]) -> None:
+        """Queue the latest counter values for a user; never touches the database"""
+        with self._lock:
+            self._pending.setdefault(user_id, {}).update(counters)
+            should_flush = len(self._pending) >= self.max_pending
+        if should_flush and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def pending(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Unflushed counter values for a user, if any"""
+        with self._lock:
+            values = self._pending.get(user_id)
+            return dict(values) if values else None
+
+    def flush(self) -> int:
+        """Write all pending counters in one transaction; returns rows written"""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            self.last_flush = time.monotonic()
+            if not batch:
+                return 0
+
+            db = self.session_factory()
+            try:
+                db.bulk_update_mappings(User, [{"id": user_id, **values} for user_id, values in batch.items()])
+                db.commit()
+                return len(batch)
+            except Exception:
+                db.rollback()
+                # Put the batch back without clobbering newer values
+                with self._lock:
+                    for user_id, values in batch.items():
+                        newer = self._pending.get(user_id, {})
+                        self._pending[user_id] = {**values, **newer}
+                raise
+            finally:
+                db.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                print(f"Error flushing counters: {e}")
+                traceback.print_exc()
+
+    def start(self) -> None:
+        """Start the periodic flush task (call from the app startup hook)"""
+        if self.enabled and self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            self._task = self._loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the periodic task and flush whatever is left"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wake = None
+        await asyncio.to_thread(self.flush)
+
+
+# Shared instance used by the user routes
+counter_buffer = CounterBuffer()
@@ -0,0 +1,207 @@
+"""
+Compile the question bank into the exam pages.
+
+Every est-practice-exam*.html page is a template: its markup, styles and
+quiz script stay as they are, and the `const questions = [...]` array
+is regenerated from question_bank/<exam>.json in a single pass. Pages
+whose output is unchanged are not rewritten.
+
+After compiling, each page is parsed back and compared with its bank
+file, so a record that would not survive the trip into JavaScript fails
+the build instead of shipping a broken exam.
+
+Strings go through tex_escape: TeX mangled by old single-escaped pages
+is repaired and every string is escaped for JavaScript in one pass, so
+a rebuild of an unchanged bank is always a no-op.
+
+Every build ends with the duplicate question report from
+find_duplicates.py (skip it with --no-duplicates).
+
+--prerender typesets all math to static SVG at build time (see
+prerender_math.py) and drops the MathJax loader from the pages. Use it
+with --out, which writes the site (pages, other .html files and images/)
+to another folder and leaves the TeX pages here untouched. With --check
+it never runs MathJax: formulas missing from math_cache.json make their
+pages stale. TeX that MathJax cannot typeset fails the build.
+
+Usage:
+  python build_exams.py                # compile every exam in the bank
+  python build_exams.py exam6 exam8    # only these exams
+  python build_exams.py --check        # exit 1 if any page is out of date (CI)
+  python build_exams.py --prerender --out dist
+"""
+import argparse
+import json
+import glob
+import os
+import shutil
+import sys
+
+from question_bank import EXAMS, HERE, extract_questions, find_questions_array, load_exam, validate
+from find_duplicates import corpus, find_duplicates, print_clusters
+from prerender_math import MathPrerenderer, MathRenderError
+from tex_escape import js_string, repair_record
+
+INDENT = " " * 12
+
+
+def _js(value):
+    """JavaScript literal for a JSON value"""
+    if isinstance(value, str):
+        return js_string(value)
+    if isinstance(value, list):
+        return "[" + ", ".join(_js(item) for item in value) + "]"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{js_string(k)}: {_js(v)}" for k, v in value.items()) + "}"
+    return json.dumps(value)
+
+
+def _js_field(key, value):
+    """Long option lists go one per line; explanation steps stay on one line"""
+    if key == "options" and len(_js(value)) > 120:
+        items = ",\n".join(f"{INDENT}        {_js(item)}" for item in value)
+        return f"[\n{items}\n{INDENT}    ]"
+    return _js(value)
+
+
+def compile_question(q):
+    lines = [f"{INDENT}// {q[key]}" for key in ("section", "note") if q.get(key)]
+    fields = [("id", q["id"]), ("topic", q["topic"])]
+    if q["difficulty"]:
+        fields.append(("difficulty", q["difficulty"]))
+    fields.append(("question", q["question"]))
+    if q["image"]:
+        fields += [("hasGraph", True), ("graphImage", q["image"])]
+    fields += [("options", q["options"]), ("answer", q["answer"]), ("explanation", q["explanation"])]
+    fields += list(q.get("extra", {}).items())
+    body = ",\n".join(f"{INDENT}    {key}: {_js_field(key, value)}" for key, value in fields)
+    lines += [f"{INDENT}{{", body, f"{INDENT}}}"]
+    return "\n".join(lines)
+
+
+def compile_questions(questions):
+    """The `[...]` array literal for a list of bank records"""
+    return "[\n" + ",\n".join(compile_question(q) for q in questions) + "\n        ]"
+
+
+def compile_page(html, questions):
+    start, end = find_questions_array(html)
+    return html[:start] + compile_questions(questions) + html[end:]
+
+
+def round_trip_errors(exam, html, questions):
+    """Fields that differ between the bank and the compiled page"""
+    compiled = extract_questions(html)
+    if len(compiled) != len(questions):
+        return [f"{exam}: {len(questions)} questions in the bank, {len(compiled)} in the page"]
+    errors = []
+    for index, (want, got) in enumerate(zip(questions, compiled)):
+        for field in ("id", "topic", "difficulty", "question", "options", "answer", "explanation", "image", "section"):
+            if want.get(field) != got.get(field):
+                errors.append(f"{exam}[{index}].{field}: {want.get(field)!r} compiled as {got.get(field)!r}")
+    return errors
+
+
+def _load_repaired(exam):
+    questions = load_exam(exam)
+    repaired = [repair_record(q) for q in questions]
+    for index, (before, after) in enumerate(zip(questions, repaired)):
+        fields = [f for f in before if before[f] != after[f]]
+        if fields:
+            print(f"[TEX] {exam}[{index}] (id {before['id']}): repaired {', '.join(fields)}")
+    return repaired
+
+
+def copy_site(out_dir):
+    """Copy what the exam pages link to (images/, other pages) into out_dir"""
+    shutil.copytree(os.path.join(HERE, "images"), os.path.join(out_dir, "images"), dirs_exist_ok=True)
+    pages = set(EXAMS.values())
+    for path in glob.glob(os.path.join(HERE, "*.html")):
+        if os.path.basename(path) not in pages:
+            shutil.copy2(path, out_dir)
+
+
+def build(exams, check=False, prerender=False, out_dir=HERE):
+    """Compile exams into out_dir; returns (changed pages, problems)"""
+    bank = {exam: _load_repaired(exam) for exam in exams}
+    renderer = None
+    if prerender:
+        renderer = MathPrerenderer()
+        records = [q for questions in bank.values() for q in questions]
+        if check:
+            # No node, no cache writes: uncached formulas leave their pages stale
+            missing = renderer.missing(records)
+            if missing:
+                print(f"[STALE] {len(missing)} formula(s) not in math_cache.json")
+        else:
+            renderer.prepare(records)
+            print(f"[MATH] {renderer.rendered} formula(s) typeset, {len(renderer.cache['formulas'])} cached")
+    if out_dir != HERE and not check:
+        os.makedirs(out_dir, exist_ok=True)
+        copy_site(out_dir)
+
+    changed = []
+    problems = []
+    for exam, questions in bank.items():
+        problems += validate(exam, questions)
+        if renderer:
+            questions = [renderer.render_record(q) for q in questions]
+        with open(os.path.join(HERE, EXAMS[exam]), "r", encoding="utf-8") as f:
+            template = f.read()
+        output = compile_page(template, questions)
+        if renderer:
+            output = renderer.render_page(output)
+        problems += round_trip_errors(exam, output, questions)
+
+        path = os.path.join(out_dir, EXAMS[exam])
+        current = None
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                current = f.read()
+        if output == current:
+            continue
+        changed.append(EXAMS[exam])
+        if not check and not problems:
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(output)
+    return changed, problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("exams", nargs="*", help=f"Exams to build (default: all of {', '.join(EXAMS)})")
+    parser.add_argument("--check", action="store_true", help="Only report pages that are out of date")
+    parser.add_argument("--prerender", action="store_true", help="Typeset math to SVG at build time (needs node and mathjax-full)")
+    parser.add_argument("--no-duplicates", action="store_true", help="Skip the duplicate question report")
+    parser.add_argument("--out", default=HERE, help="Folder to write the site to (default: in place)")
+    args = parser.parse_args()
+    unknown = [e for e in args.exams if e not in EXAMS]
+    if unknown:
+        parser.error(f"unknown exam(s): {', '.join(unknown)}")
+
+    exams = args.exams or [e for e in EXAMS if os.path.exists(os.path.join(HERE, "question_bank", f"{e}.json"))]
+    out_dir = os.path.abspath(args.out)
+    if args.prerender and out_dir == HERE:
+        parser.error("--prerender replaces the TeX pages' math; write them elsewhere with --out")
+    try:
+        changed, problems = build(exams, args.check, args.prerender, out_dir)
+    except MathRenderError as e:
+        sys.exit(f"[FAIL] {e}")
+    if problems:
+        print("\n".join(f"[FAIL] {p}" for p in problems))
+        sys.exit(1)
+    for page in changed:
+        print(f"[{'STALE' if args.check else 'OK'}] {page}")
+    print(f"{len(exams)} exams, {len(changed)} page(s) {'out of date' if args.check else 'rewritten'}")
+
+    if not args.no_duplicates:
+        clusters = find_duplicates(corpus())
+        if clusters:
+            print(f"\n{len(clusters)} duplicate question cluster(s) across the exams and topic pages:")
+            print_clusters(clusters, prefix="[DUP] ")
+    if args.check and changed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
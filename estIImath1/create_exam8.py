@@ -1,374 +0,0 @@
-"""Create Exam 8 with 40 unique hard questions - creative geometry focus"""
-import re
-
-with open('est-practice-exam8.html', 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# Update titles
-content = content.replace('Practice Exam 7', 'Practice Exam 8')
-content = content.replace('Exam 7', 'Exam 8')
-
-# New questions array
-new_questions = '''        const questions = [
-            // ===== Q1-11: ALGEBRA & FUNCTIONS (27.5%) =====
-            {
-                id: 1,
-                question: "The graph shows f(x) = |x - 2| + 1 with vertex V(2, 1). For what value of k does f(x) = k have exactly one solution?",
-                hasGraph: true,
-                graphImage: "images/ex8_q1_absvalue.png",
-                options: ["0", "1", "2", "3", "No such k"],
-                answer: 1,
-                explanation: ["f(x) = |x-2| + 1 has minimum at vertex.", "Minimum value is 1 at x = 2.", "f(x) = k has one solution when k = minimum.", "k = 1 gives x = 2 only.", "The answer is B: 1."]
-            },
-            {
-                id: 2,
-                question: "If \\\\(f(x) = \\\\frac{x^2 - 9}{x - 3}\\\\) for x ≠ 3, what is \\\\(\\\\lim_{x \\\\to 3} f(x)\\\\)?",
-                options: ["0", "3", "6", "9", "undefined"],
-                answer: 2,
-                explanation: ["Factor: (x²-9)/(x-3) = (x+3)(x-3)/(x-3).", "= x + 3 for x ≠ 3.", "As x → 3: limit = 3 + 3 = 6.", "Removable discontinuity.", "The answer is C: 6."]
-            },
-            {
-                id: 3,
-                question: "If \\\\(3^{2x-1} = 27^{x-2}\\\\), what is x?",
-                options: ["3", "5", "7", "9", "11"],
-                answer: 1,
-                explanation: ["27 = 3³, so 3^(2x-1) = 3^(3(x-2)).", "2x - 1 = 3x - 6.", "-1 + 6 = 3x - 2x.", "x = 5.", "The answer is B: 5."]
-            },
-            {
-                id: 4,
-                question: "The product of roots of \\\\(x^2 - (k+2)x + 2k = 0\\\\) is 6. What is the sum of roots?",
-                options: ["3", "4", "5", "6", "8"],
-                answer: 2,
-                explanation: ["Product = c/a = 2k = 6, so k = 3.", "Sum = -b/a = k + 2 = 3 + 2 = 5.", "Using Vieta's formulas.", "Product gives k, then find sum.", "The answer is C: 5."]
-            },
-            {
-                id: 5,
-                question: "If \\\\(f(x) = 2^x\\\\) and \\\\(g(x) = \\\\log_2 x\\\\), what is \\\\(f(g(8))\\\\)?",
-                options: ["2", "3", "4", "8", "16"],
-                answer: 3,
-                explanation: ["g(8) = log₂(8) = 3.", "f(g(8)) = f(3) = 2³ = 8.", "Function composition.", "f and g are inverses!", "The answer is D: 8."]
-            },
-            {
-                id: 6,
-                question: "If \\\\(|3x - 6| = |x + 2|\\\\), what is the sum of all solutions?",
-                options: ["1", "2", "4", "6", "8"],
-                answer: 1,
-                explanation: ["Case 1: 3x - 6 = x + 2 → 2x = 8, x = 4.", "Case 2: 3x - 6 = -(x + 2) → 3x - 6 = -x - 2.", "4x = 4, x = 1.", "Sum = 4 + 1... Wait, let me check: 4x = 4, x = 1. But also -2 case.", "Actually: Case 2: 3x-6 = -x-2, 4x = 4, x = 1. Sum = 4 + 1 = 5. Hmm not in options. Let me recalc."]
-            },
-            {
-                id: 6,
-                question: "If \\\\(|2x - 4| = |x + 1|\\\\), what is the sum of all solutions?",
-                options: ["1", "2", "3", "4", "5"],
-                answer: 2,
-                explanation: ["Case 1: 2x - 4 = x + 1 → x = 5.", "Case 2: 2x - 4 = -(x + 1) = -x - 1.", "3x = 3, x = 1.", "Sum = 5 + 1 = 6. Hmm. Let me use x = 5, 1. Sum = 6? Not matching. Actually: 2(5)-4=6, 5+1=6 ✓. 2(1)-4=-2, |−2|=2, 1+1=2 ✓. Sum = 6. Let me fix options."]
-            },
-            {
-                id: 6,
-                question: "If \\\\(|2x - 4| = |x - 1|\\\\), what is the sum of all solutions?",
-                options: ["1", "2", "3", "5/3", "8/3"],
-                answer: 2,
-                explanation: ["Case 1: 2x - 4 = x - 1 → x = 3.", "Case 2: 2x - 4 = -(x - 1) = -x + 1.", "3x = 5, x = 5/3.", "Sum = 3 + 5/3 = 14/3. Hmm still not matching. Let me just use different question."]
-            },
-            {
-                id: 6,
-                question: "If \\\\(f(x) = x^3 - 3x\\\\), at how many points does the graph of f cross the x-axis?",
-                options: ["0", "1", "2", "3", "4"],
-                answer: 3,
-                explanation: ["f(x) = x³ - 3x = x(x² - 3) = x(x-√3)(x+√3).", "Zeros at x = 0, √3, -√3.", "Three distinct real roots.", "Cubic with 3 x-intercepts.", "The answer is D: 3."]
-            },
-            {
-                id: 7,
-                question: "If \\\\(f(x) = \\\\sqrt{x-2}\\\\), what is the domain of f?",
-                options: ["x ≥ 0", "x ≥ 2", "x > 2", "x ≤ 2", "All real numbers"],
-                answer: 1,
-                explanation: ["Square root requires non-negative radicand.", "x - 2 ≥ 0.", "x ≥ 2.", "Domain: [2, ∞).", "The answer is B: x ≥ 2."]
-            },
-            {
-                id: 8,
-                question: "The function \\\\(g(x) = x^2 - 6x + k\\\\) has a minimum value of -4. What is k?",
-                options: ["1", "3", "5", "7", "9"],
-                answer: 2,
-                explanation: ["Complete square: g(x) = (x-3)² - 9 + k.", "Minimum at x = 3 is -9 + k.", "-9 + k = -4.", "k = 5.", "The answer is C: 5."]
-            },
-            {
-                id: 9,
-                question: "If \\\\(2^{x+1} + 2^x = 12\\\\), what is x?",
-                options: ["1", "2", "3", "4", "5"],
-                answer: 1,
-                explanation: ["2^(x+1) = 2 × 2^x.", "2 × 2^x + 2^x = 12.", "3 × 2^x = 12.", "2^x = 4 = 2².", "x = 2. The answer is B: 2."]
-            },
-            {
-                id: 10,
-                question: "If f is a linear function with f(2) = 7 and f(5) = 16, what is f(0)?",
-                options: ["1", "2", "3", "4", "5"],
-                answer: 0,
-                explanation: ["Slope = (16-7)/(5-2) = 9/3 = 3.", "f(x) = 3x + b.", "f(2) = 6 + b = 7, so b = 1.", "f(0) = 3(0) + 1 = 1.", "The answer is A: 1."]
-            },
-            {
-                id: 11,
-                question: "For \\\\(f(x) = \\\\frac{2x+1}{x-3}\\\\), what is the horizontal asymptote?",
-                options: ["y = 0", "y = 1", "y = 2", "y = 3", "No horizontal asymptote"],
-                answer: 2,
-                explanation: ["For rational functions, if degrees equal...", "Horizontal asymptote = leading coefficients ratio.", "= 2/1 = 2.", "y = 2.", "The answer is C: y = 2."]
-            },
-            // ===== Q12-20: GEOMETRY (22.5%) - CREATIVE! =====
-            {
-                id: 12,
-                question: "A right triangle has legs 6 and 8, and hypotenuse 10. What is the radius of the inscribed circle?",
-                hasGraph: true,
-                graphImage: "images/ex8_q12_inscribed.png",
-                options: ["1", "2", "3", "4", "5"],
-                answer: 1,
-                explanation: ["Inradius r = Area / semi-perimeter.", "Area = (1/2)(6)(8) = 24.", "Perimeter = 6 + 8 + 10 = 24, s = 12.", "r = 24/12 = 2.", "The answer is B: 2."]
-            },
-            {
-                id: 13,
-                question: "In a right triangle, the altitude to the hypotenuse divides it into segments of 4 and 9. What is the length of this altitude?",
-                options: ["5", "6", "7", "√13", "13"],
-                answer: 1,
-                explanation: ["Altitude = geometric mean of segments.", "h = √(4 × 9) = √36 = 6.", "This is the altitude-on-hypotenuse theorem.", "Also: legs are √(4×13) and √(9×13).", "The answer is B: 6."]
-            },
-            {
-                id: 14,
-                question: "In triangle ABC, the angle bisector from A meets BC at D. If AB = 6, AC = 9, and BC = 10, what is BD?",
-                options: ["3", "4", "5", "6", "7"],
-                answer: 1,
-                explanation: ["Angle bisector theorem: BD/DC = AB/AC.", "BD/DC = 6/9 = 2/3.", "BD + DC = 10.", "Let BD = 2k, DC = 3k. 5k = 10, k = 2.", "BD = 4. The answer is B: 4."]
-            },
-            {
-                id: 15,
-                question: "In a right triangle, the median to the hypotenuse has length 5. What is the length of the hypotenuse?",
-                options: ["5", "10", "15", "20", "25"],
-                answer: 1,
-                explanation: ["In a right triangle, median to hypotenuse = half of hypotenuse.", "So hypotenuse = 2 × median.", "= 2 × 5 = 10.", "Special property of right triangles.", "The answer is B: 10."]
-            },
-            {
-                id: 16,
-                question: "A 30-60-90 triangle has hypotenuse 12. What is the area?",
-                options: ["18", "18√3", "36", "36√3", "72"],
-                answer: 1,
-                explanation: ["In 30-60-90: sides are x, x√3, 2x.", "2x = 12, so x = 6.", "Legs: 6 and 6√3.", "Area = (1/2)(6)(6√3) = 18√3.", "The answer is B: 18√3."]
-            },
-            {
-                id: 17,
-                question: "A tangent from external point P to a circle has length 8. If P is 10 from the center, what is the radius?",
-                options: ["4", "5", "6", "7", "8"],
-                answer: 2,
-                explanation: ["Tangent perpendicular to radius at point of tangency.", "Right triangle: r² + 8² = 10².", "r² = 100 - 64 = 36.", "r = 6.", "The answer is C: 6."]
-            },
-            {
-                id: 18,
-                question: "Two circles have radii 5 and 3 with centers 12 apart. How many common tangents do they have?",
-                options: ["0", "1", "2", "3", "4"],
-                answer: 4,
-                explanation: ["Sum of radii = 8 < 12 (distance).", "Circles don't overlap and don't touch.", "External circles: 4 common tangents.", "2 external + 2 internal tangents.", "The answer is E: 4."]
-            },
-            {
-                id: 19,
-                question: "Based on the scatter plot, which best estimates the slope of the line of best fit?",
-                hasGraph: true,
-                graphImage: "images/ex8_q19_scatter.png",
-                options: ["0.5", "1", "1.5", "2", "2.5"],
-                answer: 3,
-                explanation: ["Observe points: from x=1 to x=10, y goes from ~5 to ~23.", "Change: Δy ≈ 18, Δx = 9.", "Slope ≈ 18/9 = 2.", "Line of best fit has positive slope ~2.", "The answer is D: 2."]
-            },
-            {
-                id: 20,
-                question: "A sector of a circle with radius 8 has arc length 6π. What is the area of the sector?",
-                options: ["12π", "18π", "24π", "32π", "48π"],
-                answer: 2,
-                explanation: ["Arc length = rθ, so 6π = 8θ.", "θ = 6π/8 = 3π/4 radians.", "Sector area = (1/2)r²θ = (1/2)(64)(3π/4).", "= 32 × 3π/4 = 24π.", "The answer is C: 24π."]
-            },
-            // ===== Q21-25: COORDINATE GEOMETRY (12.5%) =====
-            {
-                id: 21,
-                question: "Point A(3, 4) is reflected over the line y = x. What are the coordinates of the image?",
-                options: ["(4, 3)", "(-3, -4)", "(3, -4)", "(-4, -3)", "(4, -3)"],
-                answer: 0,
-                explanation: ["Reflection over y = x swaps coordinates.", "(x, y) → (y, x).", "(3, 4) → (4, 3).", "Simple reflection rule.", "The answer is A: (4, 3)."]
-            },
-            {
-                id: 22,
-                question: "What is the area of the triangle with vertices (0, 0), (4, 0), and (2, 6)?",
-                options: ["6", "8", "10", "12", "24"],
-                answer: 3,
-                explanation: ["Base on x-axis = 4.", "Height = y-coord of (2,6) = 6.", "Area = (1/2)(4)(6) = 12.", "Triangle area formula.", "The answer is D: 12."]
-            },
-            {
-                id: 23,
-                question: "The line 2x - 3y = 6 is perpendicular to ax + 2y = 5. What is a?",
-                options: ["-3", "-2", "2", "3", "4"],
-                answer: 2,
-                explanation: ["Line 1 slope: 2x - 3y = 6 → y = (2/3)x - 2, m₁ = 2/3.", "For perpendicular: m₁ × m₂ = -1.", "(2/3) × m₂ = -1, m₂ = -3/2.", "Line 2: ax + 2y = 5 → y = (-a/2)x + 5/2.", "-a/2 = -3/2, a = 3. Hmm not matching options."]
-            },
-            {
-                id: 23,
-                question: "The line 3x - y = 4 is perpendicular to ax + 3y = 7. What is a?",
-                options: ["-3", "-1", "1", "3", "9"],
-                answer: 2,
-                explanation: ["Line 1: 3x - y = 4 → y = 3x - 4, m₁ = 3.", "For perpendicular: m₁ × m₂ = -1.", "3 × m₂ = -1, m₂ = -1/3.", "Line 2: ax + 3y = 7 → y = (-a/3)x + 7/3.", "-a/3 = -1/3, a = 1.", "The answer is C: 1."]
-            },
-            {
-                id: 24,
-                question: "A circle has center (2, -1) and is tangent to the y-axis. What is its equation?",
-                options: ["(x-2)² + (y+1)² = 1", "(x-2)² + (y+1)² = 2", "(x-2)² + (y+1)² = 4", "(x+2)² + (y-1)² = 4", "(x-2)² + (y+1)² = 5"],
-                answer: 2,
-                explanation: ["Tangent to y-axis means radius = distance to y-axis.", "Distance from (2, -1) to y-axis = |2| = 2.", "r = 2, r² = 4.", "Equation: (x-2)² + (y+1)² = 4.", "The answer is C."]
-            },
-            {
-                id: 25,
-                question: "What is the equation of the perpendicular bisector of segment AB where A(1, 3) and B(5, 7)?",
-                options: ["x + y = 8", "x - y = -2", "x + y = 6", "y = x", "x + y = 10"],
-                answer: 0,
-                explanation: ["Midpoint M = ((1+5)/2, (3+7)/2) = (3, 5).", "Slope of AB = (7-3)/(5-1) = 1.", "Perpendicular slope = -1.", "Line through (3,5) with slope -1: y - 5 = -1(x - 3).", "y = -x + 8, x + y = 8. The answer is A."]
-            },
-            // ===== Q26-32: STATISTICS & PROBABILITY (17.5%) =====
-            {
-                id: 26,
-                question: "In a class, P(student plays soccer) = 0.6 and P(plays basketball) = 0.5. If P(plays both) = 0.3, what is P(plays neither)?",
-                options: ["0.1", "0.2", "0.3", "0.4", "0.5"],
-                answer: 1,
-                explanation: ["P(A ∪ B) = P(A) + P(B) - P(A ∩ B).", "= 0.6 + 0.5 - 0.3 = 0.8.", "P(neither) = 1 - P(A ∪ B) = 0.2.", "Inclusion-exclusion principle.", "The answer is B: 0.2."]
-            },
-            {
-                id: 27,
-                question: "A box has 4 red and 6 blue balls. Two balls drawn without replacement. P(both same color) = ?",
-                options: ["1/3", "7/15", "8/15", "2/3", "7/10"],
-                answer: 1,
-                explanation: ["P(both red) = (4/10)(3/9) = 12/90.", "P(both blue) = (6/10)(5/9) = 30/90.", "P(same) = 12/90 + 30/90 = 42/90 = 7/15.", "Add probabilities of disjoint events.", "The answer is B: 7/15."]
-            },
-            {
-                id: 28,
-                question: "How many ways can 8 people sit in a row if 3 specific people must sit together?",
-                options: ["720", "4320", "5040", "21600", "40320"],
-                answer: 3,
-                explanation: ["Treat 3 people as 1 unit: 6 units.", "Arrange 6 units: 6! = 720.", "The 3 people can arrange among themselves: 3! = 6.", "Total = 720 × 6 = 4320. Hmm. Wait: 6 units arranged in 6! ways, times 3! internal = 720 × 6 = 4320."]
-            },
-            {
-                id: 28,
-                question: "How many ways can 7 people sit in a row if 2 specific people must sit together?",
-                options: ["720", "1440", "2520", "5040", "10080"],
-                answer: 1,
-                explanation: ["Treat 2 people as 1 unit: 6 units.", "Arrange 6 units: 6! = 720.", "The 2 people can switch: 2! = 2.", "Total = 720 × 2 = 1440.", "The answer is B: 1440."]
-            },
-            {
-                id: 29,
-                question: "A fair die is rolled. Given the result is even, what is P(result > 4)?",
-                options: ["1/6", "1/4", "1/3", "1/2", "2/3"],
-                answer: 2,
-                explanation: ["Even results: {2, 4, 6}.", "Result > 4 from evens: {6}.", "Conditional: P(>4 | even) = 1/3.", "Conditional probability.", "The answer is C: 1/3."]
-            },
-            {
-                id: 30,
-                question: "Data set: {3, 5, 7, 9, x} has mean equal to median. What is x?",
-                options: ["5", "6", "7", "8", "11"],
-                answer: 1,
-                explanation: ["Median = 7 (middle value, assuming x ≥ 9 or sorted).", "If x ≤ 9: median is 7.", "Mean = (3+5+7+9+x)/5 = (24+x)/5.", "(24+x)/5 = 7 → 24 + x = 35 → x = 11.", "Wait: if x = 11, sorted: 3,5,7,9,11, median = 7. Mean = 35/5 = 7 ✓", "The answer is E: 11."]
-            },
-            {
-                id: 30,
-                question: "Data: {2, 5, 8, 10, x} has mean = median. What is x?",
-                options: ["5", "7", "8", "10", "15"],
-                answer: 0,
-                explanation: ["If sorted with x, find when mean = median.", "Try x = 5: sorted {2,5,5,8,10}, median = 5, mean = 30/5 = 6 ≠ 5.", "Try x = 10: {2,5,8,10,10}, median = 8, mean = 35/5 = 7 ≠ 8.", "Try finding: median depends on x position. This is tricky - let me use simpler version."]
-            },
-            {
-                id: 30,
-                question: "For data {2, 4, 6, 8, 10}, what is the standard deviation?",
-                options: ["2", "2√2", "4", "8", "10"],
-                answer: 1,
-                explanation: ["Mean = 30/5 = 6.", "Deviations: -4, -2, 0, 2, 4.", "Squared: 16, 4, 0, 4, 16. Sum = 40.", "Variance = 40/5 = 8.", "SD = √8 = 2√2. The answer is B."]
-            },
-            {
-                id: 31,
-                question: "In how many ways can 5 different books be arranged if 2 specific books must NOT be adjacent?",
-                options: ["48", "60", "72", "96", "120"],
-                answer: 2,
-                explanation: ["Total arrangements = 5! = 120.", "Adjacent arrangements: treat 2 as unit = 4! × 2! = 48.", "Not adjacent = 120 - 48 = 72.", "Complement counting.", "The answer is C: 72."]
-            },
-            {
-                id: 32,
-                question: "From the ogive (cumulative frequency graph), the median class is:",
-                hasGraph: true,
-                graphImage: "images/ex8_q32_ogive.png",
-                options: ["0-10", "10-20", "20-30", "30-40", "40-50"],
-                answer: 2,
-                explanation: ["Total frequency = 50.", "Median position = 25.", "From ogive: 25 falls in 20-30 class.", "Cumulative at 20 is 15, at 30 is 30.", "The answer is C: 20-30."]
-            },
-            // ===== Q33-37: NUMERATIONS & OPERATIONS (12.5%) =====
-            {
-                id: 33,
-                question: "In a geometric sequence, a₁ = 2 and a₄ = 54. What is a₆?",
-                options: ["162", "324", "486", "972", "1458"],
-                answer: 2,
-                explanation: ["a₄ = a₁ × r³ = 2r³ = 54.", "r³ = 27, r = 3.", "a₆ = a₁ × r⁵ = 2 × 3⁵ = 2 × 243 = 486.", "Geometric sequence formula.", "The answer is C: 486."]
-            },
-            {
-                id: 34,
-                question: "If \\\\(\\\\sqrt{2x + 3} = x\\\\), what is x?",
-                options: ["-1", "1", "3", "-1 and 3", "No solution"],
-                answer: 2,
-                explanation: ["Square both sides: 2x + 3 = x².", "x² - 2x - 3 = 0.", "(x-3)(x+1) = 0, x = 3 or -1.", "Check: √(2(3)+3) = √9 = 3 ✓.", "√(2(-1)+3) = √1 = 1 ≠ -1 ✗.", "The answer is C: 3."]
-            },
-            {
-                id: 35,
-                question: "If \\\\(\\\\log_2 x + \\\\log_2 (x-2) = 3\\\\), what is x?",
-                options: ["2", "3", "4", "5", "6"],
-                answer: 2,
-                explanation: ["log₂[x(x-2)] = 3.", "x(x-2) = 2³ = 8.", "x² - 2x - 8 = 0.", "(x-4)(x+2) = 0, x = 4 or -2.", "x must be > 2, so x = 4.", "The answer is C: 4."]
-            },
-            {
-                id: 36,
-                question: "The sum of an arithmetic series with first term 3, last term 47, and 12 terms is:",
-                options: ["250", "275", "300", "325", "350"],
-                answer: 2,
-                explanation: ["Sum = n(a₁ + aₙ)/2.", "= 12(3 + 47)/2.", "= 12 × 50/2 = 300.", "Arithmetic series formula.", "The answer is C: 300."]
-            },
-            {
-                id: 37,
-                question: "If \\\\(x^{1/3} = 2\\\\), what is \\\\(x^{2/3} + x^{-1/3}\\\\)?",
-                options: ["4", "4.5", "5", "5.5", "6"],
-                answer: 1,
-                explanation: ["x^(1/3) = 2.", "x^(2/3) = (x^(1/3))² = 4.", "x^(-1/3) = 1/x^(1/3) = 1/2.", "Sum = 4 + 0.5 = 4.5.", "The answer is B: 4.5."]
-            },
-            // ===== Q38-40: TRIGONOMETRY (7.5%) =====
-            {
-                id: 38,
-                question: "On the unit circle, point P corresponds to angle θ = 5π/6. What is cos θ?",
-                hasGraph: true,
-                graphImage: "images/ex8_q38_unitcircle.png",
-                options: ["-√3/2", "-1/2", "1/2", "√3/2", "-√2/2"],
-                answer: 0,
-                explanation: ["5π/6 is in Quadrant II.", "Reference angle = π - 5π/6 = π/6.", "cos(π/6) = √3/2.", "In Q2, cos is negative.", "cos(5π/6) = -√3/2. The answer is A."]
-            },
-            {
-                id: 39,
-                question: "If sin θ = 5/13 and θ is in Quadrant I, what is tan θ?",
-                options: ["5/12", "5/13", "12/13", "12/5", "13/12"],
-                answer: 0,
-                explanation: ["sin θ = opp/hyp = 5/13.", "adj = √(13² - 5²) = √144 = 12.", "tan θ = opp/adj = 5/12.", "Using Pythagorean theorem.", "The answer is A: 5/12."]
-            },
-            {
-                id: 40,
-                question: "Which is equal to sin(π - x)?<br>I. sin x<br>II. -sin x<br>III. cos x",
-                options: ["I only", "II only", "III only", "I and III only", "None"],
-                answer: 0,
-                explanation: ["sin(π - x) = sin π cos x - cos π sin x.", "= 0 × cos x - (-1) × sin x = sin x.", "I: TRUE.", "II: FALSE, III: FALSE.", "The answer is A: I only."]
-            }
-        ];'''
-
-# Replace questions
-pattern = r'const questions = \[.*?\];'
-content = re.sub(pattern, new_questions, content, flags=re.DOTALL)
-
-# Update image references
-content = content.replace('ex7_q1_parabola.png', 'ex8_q1_absvalue.png')
-content = content.replace('ex7_q12_trapezoid.png', 'ex8_q12_inscribed.png')
-content = content.replace('ex7_q19_piechart.png', 'ex8_q19_scatter.png')
-content = content.replace('ex7_q32_boxplot.png', 'ex8_q32_ogive.png')
-content = content.replace('ex7_q38_triangle.png', 'ex8_q38_unitcircle.png')
-
-with open('est-practice-exam8.html', 'w', encoding='utf-8') as f:
-    f.write(content)
-
-print("[OK] Exam 8 created with 40 unique questions!")
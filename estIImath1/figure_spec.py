@@ -0,0 +1,356 @@
+"""
+Declarative exam figures.
+
+A figure is a dataclass (Graph, Triangle, Circle, BarChart, PieChart,
+BoxPlot) describing what to draw; FigureRenderer turns any of them into
+an image. The renderer keeps one matplotlib Figure per figsize and clears
+and reuses it between specs, so rendering many figures pays the figure
+setup cost once.
+
+Set svg=True on a spec to also write an SVG sibling (see svg_export.py).
+
+Specs can live in Python (a FIGURES list in a generate_exam*_images.py
+script, picked up by render_figures.py) or in a JSON file:
+
+  [{"kind": "bar_chart", "output": "images/ex9_q19_bar.png",
+    "categories": ["A", "B"], "values": [3, 5], "title": "Votes"}]
+
+Usage:
+  python figure_spec.py specs.json [more.json ...]
+"""
+import json
+import math
+import os
+import sys
+import time
+from dataclasses import dataclass, field, fields
+from typing import List, Optional, Tuple
+
+import numpy as np
+from matplotlib.figure import Figure
+import matplotlib.patches as patches
+
+from svg_export import save_svg, svg_path_for
+
+Point = Tuple[float, float]
+
+# Names available to Curve.expr besides x
+CURVE_NAMESPACE = {
+    "np": np, "abs": np.abs, "sqrt": np.sqrt, "exp": np.exp, "log": np.log,
+    "sin": np.sin, "cos": np.cos, "tan": np.tan, "pi": np.pi,
+}
+
+
+@dataclass
+class Label:
+    text: str
+    at: Point
+    fontsize: float = 12
+    bold: bool = False
+    color: Optional[str] = None
+    ha: str = "left"
+    rotation: float = 0
+
+
+@dataclass
+class Curve:
+    expr: str  # numpy expression in x, e.g. "0.1 * (x + 2) * x * (x - 3)"
+    domain: Tuple[float, float]
+    samples: int = 300
+    style: str = "b-"
+    linewidth: float = 2.5
+    label: Optional[str] = None
+
+
+@dataclass
+class FigureSpec:
+    output: str  # Relative to estIImath1/, e.g. "images/ex6_q1_polynomial.png"
+    figsize: Tuple[float, float] = (8, 6)
+    title: str = ""
+    title_size: Optional[float] = None  # None keeps matplotlib's default title size
+    xlabel: str = ""
+    ylabel: str = ""
+    axis_label_size: float = 12
+    axis_label_bold: bool = False
+    xlim: Optional[Tuple[float, float]] = None
+    ylim: Optional[Tuple[float, float]] = None
+    equal_aspect: bool = False
+    grid: Optional[str] = "both"  # "both", "x", "y" or None
+    axes_lines: bool = False  # Draw the x and y axes through the origin
+    hide_axes: bool = False
+    labels: List[Label] = field(default_factory=list)
+    dpi: int = 150
+    tight_bbox: bool = False
+    svg: bool = False  # Also write <output>.svg
+
+    kind = ""
+    _nested = {"labels": Label}
+
+    @property
+    def name(self):
+        return os.path.splitext(os.path.basename(self.output))[0]
+
+
+@dataclass
+class Graph(FigureSpec):
+    curves: List[Curve] = field(default_factory=list)
+    points: List[Point] = field(default_factory=list)
+    legend: bool = False
+
+    kind = "graph"
+    _nested = {"labels": Label, "curves": Curve}
+
+
+@dataclass
+class AngleMark:
+    vertex: int
+    radius: float = 0.6
+    color: str = "green"
+
+
+@dataclass
+class Triangle(FigureSpec):
+    vertices: List[Point] = field(default_factory=list)
+    edgecolor: str = "blue"
+    linewidth: float = 2.5
+    fill_alpha: float = 0.0
+    right_angle: Optional[int] = None  # Vertex index
+    right_angle_size: float = 0.3
+    angles: List[AngleMark] = field(default_factory=list)
+
+    kind = "triangle"
+    _nested = {"labels": Label, "angles": AngleMark}
+
+
+@dataclass
+class Circle(FigureSpec):
+    center: Point = (0, 0)
+    radius: float = 1
+    edgecolor: str = "blue"
+    linewidth: float = 2
+    points: List[Point] = field(default_factory=list)
+    segments: List[Tuple[Point, Point]] = field(default_factory=list)
+    segment_style: str = "g-"
+
+    kind = "circle"
+    equal_aspect: bool = True
+
+
+@dataclass
+class BarChart(FigureSpec):
+    categories: List[str] = field(default_factory=list)
+    values: List[float] = field(default_factory=list)
+    colors: Optional[List[str]] = None
+    color: str = "steelblue"
+    value_labels: bool = True
+    grid: Optional[str] = "y"
+
+    kind = "bar_chart"
+
+
+@dataclass
+class PieChart(FigureSpec):
+    sizes: List[float] = field(default_factory=list)
+    slice_labels: List[str] = field(default_factory=list)
+    colors: Optional[List[str]] = None
+    explode: float = 0.02
+    autopct: str = "%1.0f%%"
+    startangle: float = 90
+    grid: Optional[str] = None
+
+    kind = "pie_chart"
+
+
+@dataclass
+class BoxPlot(FigureSpec):
+    data: List[float] = field(default_factory=list)
+    vertical: bool = False
+    color: str = "steelblue"
+    alpha: float = 0.7
+    grid: Optional[str] = "x"
+
+    kind = "box_plot"
+
+
+SPEC_KINDS = {cls.kind: cls for cls in (Graph, Triangle, Circle, BarChart, PieChart, BoxPlot)}
+
+
+def spec_from_dict(data):
+    data = dict(data)
+    cls = SPEC_KINDS[data.pop("kind")]
+    for name, nested in cls._nested.items():
+        if name in data:
+            data[name] = [nested(**item) if isinstance(item, dict) else item for item in data[name]]
+    known = {f.name for f in fields(cls)}
+    unknown = set(data) - known
+    if unknown:
+        raise ValueError(f"Unknown {cls.kind} fields: {', '.join(sorted(unknown))}")
+    return cls(**data)
+
+
+def load_specs(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [spec_from_dict(item) for item in json.load(f)]
+
+
+def _unit(frm, to):
+    dx, dy = to[0] - frm[0], to[1] - frm[1]
+    length = math.hypot(dx, dy)
+    return dx / length, dy / length
+
+
+class FigureRenderer:
+    """Renders specs onto cached Figures, one per figsize"""
+
+    def __init__(self, base_dir="."):
+        self.base_dir = base_dir
+        self._figures = {}
+
+    def _canvas(self, figsize):
+        figsize = tuple(figsize)
+        fig = self._figures.get(figsize)
+        if fig is None:
+            fig = self._figures[figsize] = Figure(figsize=figsize)
+            fig.add_subplot()
+        ax = fig.axes[0]
+        ax.clear()
+        ax.set_aspect("auto")
+        ax.set_axis_on()
+        return fig, ax
+
+    def render(self, spec, svg=False):
+        """Draw spec and save it; returns the written paths"""
+        fig, ax = self._canvas(spec.figsize)
+        getattr(self, f"_draw_{spec.kind}")(ax, spec)
+        self._decorate(ax, spec)
+        fig.tight_layout()
+        path = os.path.join(self.base_dir, spec.output)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        bbox = "tight" if spec.tight_bbox else None
+        fig.savefig(path, dpi=spec.dpi, bbox_inches=bbox)
+        if not (svg or spec.svg):
+            return [path]
+        svg_path = svg_path_for(path)
+        save_svg(fig, svg_path, bbox_inches=bbox)
+        return [path, svg_path]
+
+    def render_all(self, specs):
+        """Render specs in order; returns [(output, seconds)]"""
+        timings = []
+        for spec in specs:
+            start = time.perf_counter()
+            self.render(spec)
+            timings.append((spec.output, time.perf_counter() - start))
+        return timings
+
+    def _decorate(self, ax, spec):
+        weight = "bold" if spec.axis_label_bold else None
+        if spec.axes_lines:
+            ax.axhline(0, color="black", linewidth=1)
+            ax.axvline(0, color="black", linewidth=1)
+        if spec.grid:
+            ax.grid(True, axis=spec.grid, alpha=0.3)
+        if spec.xlim:
+            ax.set_xlim(*spec.xlim)
+        if spec.ylim:
+            ax.set_ylim(*spec.ylim)
+        if spec.equal_aspect:
+            ax.set_aspect("equal")
+        if spec.xlabel:
+            ax.set_xlabel(spec.xlabel, fontsize=spec.axis_label_size, fontweight=weight)
+        if spec.ylabel:
+            ax.set_ylabel(spec.ylabel, fontsize=spec.axis_label_size, fontweight=weight)
+        if spec.title:
+            # fontsize=None would mean font.size, smaller than the default axes.titlesize
+            title_kwargs = {"fontsize": spec.title_size} if spec.title_size else {}
+            ax.set_title(spec.title, fontweight="bold", **title_kwargs)
+        for label in spec.labels:
+            ax.annotate(
+                label.text, label.at, fontsize=label.fontsize, color=label.color, ha=label.ha,
+                rotation=label.rotation, fontweight="bold" if label.bold else None,
+            )
+        if spec.hide_axes:
+            ax.axis("off")
+
+    def _draw_graph(self, ax, spec):
+        for curve in spec.curves:
+            xs = np.linspace(curve.domain[0], curve.domain[1], curve.samples)
+            ys = eval(curve.expr, {"__builtins__": {}}, dict(CURVE_NAMESPACE, x=xs))
+            ax.plot(xs, ys, curve.style, linewidth=curve.linewidth, label=curve.label)
+        if spec.points:
+            px, py = zip(*spec.points)
+            ax.plot(px, py, "ko", markersize=5)
+        if spec.legend:
+            ax.legend(fontsize=12)
+
+    def _draw_triangle(self, ax, spec):
+        vertices = [tuple(v) for v in spec.vertices]
+        ax.add_patch(patches.Polygon(vertices, fill=False, edgecolor=spec.edgecolor, linewidth=spec.linewidth))
+        if spec.fill_alpha:
+            xs, ys = zip(*vertices)
+            ax.fill(xs, ys, alpha=spec.fill_alpha, color=spec.edgecolor)
+        if spec.right_angle is not None:
+            corner = vertices[spec.right_angle]
+            u = _unit(corner, vertices[(spec.right_angle + 1) % 3])
+            v = _unit(corner, vertices[(spec.right_angle + 2) % 3])
+            s = spec.right_angle_size
+            square = [
+                (corner[0] + u[0] * s, corner[1] + u[1] * s),
+                (corner[0] + (u[0] + v[0]) * s, corner[1] + (u[1] + v[1]) * s),
+                (corner[0] + v[0] * s, corner[1] + v[1] * s),
+            ]
+            ax.add_patch(patches.Polygon([corner] + square, closed=True, fill=False, edgecolor="red", linewidth=1.5))
+        for mark in spec.angles:
+            corner = vertices[mark.vertex]
+            rays = [vertices[(mark.vertex + k) % 3] for k in (1, 2)]
+            angles = sorted(math.degrees(math.atan2(p[1] - corner[1], p[0] - corner[0])) for p in rays)
+            if angles[1] - angles[0] > 180:
+                angles = [angles[1], angles[0] + 360]
+            ax.add_patch(patches.Arc(
+                corner, 2 * mark.radius, 2 * mark.radius, angle=0,
+                theta1=angles[0], theta2=angles[1], color=mark.color, linewidth=2,
+            ))
+
+    def _draw_circle(self, ax, spec):
+        ax.add_patch(patches.Circle(spec.center, spec.radius, fill=False, edgecolor=spec.edgecolor, linewidth=spec.linewidth))
+        for start, end in spec.segments:
+            ax.plot([start[0], end[0]], [start[1], end[1]], spec.segment_style, linewidth=2)
+        if spec.points:
+            px, py = zip(*spec.points)
+            ax.plot(px, py, "ro", markersize=8)
+
+    def _draw_bar_chart(self, ax, spec):
+        bars = ax.bar(spec.categories, spec.values, color=spec.colors or spec.color, edgecolor="black")
+        if spec.value_labels:
+            for bar, value in zip(bars, spec.values):
+                ax.text(
+                    bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.3,
+                    f"{value:g}", ha="center", fontsize=12, fontweight="bold",
+                )
+
+    def _draw_pie_chart(self, ax, spec):
+        ax.pie(
+            spec.sizes, explode=[spec.explode] * len(spec.sizes), labels=spec.slice_labels or None,
+            colors=spec.colors, autopct=spec.autopct, shadow=True, startangle=spec.startangle,
+            textprops={"fontsize": 12},
+        )
+
+    def _draw_box_plot(self, ax, spec):
+        boxes = ax.boxplot(spec.data, vert=spec.vertical, patch_artist=True)
+        boxes["boxes"][0].set_facecolor(spec.color)
+        boxes["boxes"][0].set_alpha(spec.alpha)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(2)
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    renderer = FigureRenderer(base_dir)
+    for path in sys.argv[1:]:
+        for output, seconds in renderer.render_all(load_specs(path)):
+            print(f"[OK] {seconds:6.2f}s  {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Duplicate and near-duplicate question detector.
+
+Scans every exam in the question bank and the topic practice pages
+(statistics.html, numerations-and-operations.html) as one corpus.
+Question text is normalized to math tokens: TeX delimiters ($...$ too)
+and commands are dropped, so \\(\\frac{x}{2}\\) and x/2 read alike, and numbers are masked, so questions that only change
+their numbers still match. Each question gets a MinHash signature of
+its token 3-grams; LSH banding buckets the signatures, and only pairs
+that share a bucket are compared, so the scan stays far below the
+n^2 pairwise comparisons as the corpus grows.
+
+Matches are grouped into clusters and labelled:
+  exact     same text (up to spacing and case)
+  numbers   same text with different numbers
+  near      token 3-gram Jaccard similarity >= --threshold
+
+build_exams.py runs this after compiling and prints the clusters.
+
+Usage:
+  python find_duplicates.py                    # report clusters across the corpus
+  python find_duplicates.py --threshold 0.6    # looser near-duplicate matching
+  python find_duplicates.py --json             # machine-readable clusters
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+from collections import defaultdict
+
+from question_bank import HERE, _JSReader, load_bank
+
+# Topic practice pages: file -> (variable name, id key, question key). The
+# variable is an array of questions or an object of arrays ({ops: [...]});
+# without an id key a question is named by its position ("ops[3]")
+TOPIC_PAGES = {
+    "statistics.html": ("Q", "i", "q"),
+    "numerations-and-operations.html": ("Q", None, "q"),
+}
+
+NUM_PERM = 64
+BANDS = 16  # 16 bands of 4 rows: pairs above ~0.5 Jaccard almost always share a bucket
+SHINGLE = 3
+DEFAULT_THRESHOLD = 0.7
+
+_MERSENNE = (1 << 61) - 1
+_PERMUTATIONS = [
+    (int.from_bytes(hashlib.blake2b(f"a{i}".encode(), digest_size=8).digest(), "big") % _MERSENNE or 1,
+     int.from_bytes(hashlib.blake2b(f"b{i}".encode(), digest_size=8).digest(), "big") % _MERSENNE)
+    for i in range(NUM_PERM)
+]
+
+_TOKEN = re.compile(r"\d+(?:\.\d+)?|[a-z]+|[^\sa-z\d]")
+_TEX_COMMAND = re.compile(r"\\(?:left|right|displaystyle|[()\[\]]|,|;|!|quad)")
+
+
+def corpus():
+    """[(source, id, question text)] for every bank question and topic page question"""
+    items = []
+    for exam, questions in load_bank().items():
+        items += [(exam, q["id"], q["question"]) for q in questions]
+    for page, (name, id_key, question_key) in TOPIC_PAGES.items():
+        path = os.path.join(HERE, page)
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+        m = re.search(r"const %s = [\[{]" % name, html)
+        if not m:
+            continue
+        data = _JSReader(html, m.end() - 1).value()
+        stem = os.path.splitext(page)[0]
+        for group, questions in data.items() if isinstance(data, dict) else [(None, data)]:
+            for index, q in enumerate(questions):
+                if id_key:
+                    qid = q[id_key]
+                else:
+                    qid = f"{group}[{index}]" if group else index
+                items.append((stem, qid, q[question_key]))
+    return items
+
+
+def math_tokens(text):
+    """Lowercased tokens with TeX markup dropped (\\frac -> frac, \\( and $ -> nothing)"""
+    text = _TEX_COMMAND.sub(" ", text.lower()).replace("$", " ")
+    text = text.replace("\\", " ")
+    return [t for t in _TOKEN.findall(text) if t not in "{}"]
+
+
+def mask_numbers(tokens):
+    return ["#" if t[0].isdigit() else t for t in tokens]
+
+
+def shingles(tokens):
+    if len(tokens) < SHINGLE:
+        return {" ".join(tokens)}
+    return {" ".join(tokens[i:i + SHINGLE]) for i in range(len(tokens) - SHINGLE + 1)}
+
+
+def minhash(features):
+    hashes = [int.from_bytes(hashlib.blake2b(f.encode(), digest_size=8).digest(), "big") for f in features]
+    return [min((a * h + b) % _MERSENNE for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def candidate_pairs(signatures):
+    """Index pairs that share at least one LSH band bucket"""
+    rows = NUM_PERM // BANDS
+    pairs = set()
+    for band in range(BANDS):
+        buckets = defaultdict(list)
+        for index, signature in enumerate(signatures):
+            buckets[tuple(signature[band * rows:(band + 1) * rows])].append(index)
+        for members in buckets.values():
+            pairs.update((a, b) for i, a in enumerate(members) for b in members[i + 1:])
+    return pairs
+
+
+def find_duplicates(items, threshold=DEFAULT_THRESHOLD):
+    """
+    Clusters of matching questions: [{"kind", "similarity", "members":
+    [(source, id, question)]}], strongest first. kind is the weakest
+    link in the cluster (near < numbers < exact).
+    """
+    tokens = [math_tokens(text) for _, _, text in items]
+    masked = [mask_numbers(t) for t in tokens]
+    features = [shingles(m) for m in masked]
+    signatures = [minhash(f) for f in features]
+
+    parent = list(range(len(items)))
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    links = []
+    for a, b in candidate_pairs(signatures):
+        if tokens[a] == tokens[b]:
+            kind, similarity = "exact", 1.0
+        elif masked[a] == masked[b]:
+            kind, similarity = "numbers", 1.0
+        else:
+            similarity = jaccard(features[a], features[b])
+            if similarity < threshold:
+                continue
+            kind = "near"
+        links.append((a, b, kind, similarity))
+        parent[root(a)] = root(b)
+
+    rank = {"near": 0, "numbers": 1, "exact": 2}
+    clusters = {}
+    for a, b, kind, similarity in links:
+        cluster = clusters.setdefault(root(a), {"kind": "exact", "similarity": 1.0, "members": set()})
+        cluster["members"].update((a, b))
+        if rank[kind] < rank[cluster["kind"]]:
+            cluster["kind"] = kind
+        cluster["similarity"] = min(cluster["similarity"], similarity)
+
+    result = []
+    for cluster in clusters.values():
+        members = [items[i] for i in sorted(cluster["members"])]
+        result.append({"kind": cluster["kind"], "similarity": round(cluster["similarity"], 3), "members": members})
+    result.sort(key=lambda c: (-rank[c["kind"]], -c["similarity"], c["members"][0][:2]))
+    return result
+
+
+def print_clusters(clusters, prefix=""):
+    for cluster in clusters:
+        where = ", ".join(f"{source}:{qid}" for source, qid, _ in cluster["members"])
+        print(f"{prefix}[{cluster['kind']} {cluster['similarity']:.2f}] {where}")
+        print(f"{prefix}    {cluster['members'][0][2][:110]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Minimum Jaccard similarity for near duplicates")
+    parser.add_argument("--json", action="store_true", help="Print clusters as JSON")
+    args = parser.parse_args()
+
+    items = corpus()
+    clusters = find_duplicates(items, args.threshold)
+    if args.json:
+        print(json.dumps(clusters, ensure_ascii=False, indent=2))
+        return
+    print_clusters(clusters)
+    counts = defaultdict(int)
+    for cluster in clusters:
+        counts[cluster["kind"]] += 1
+    summary = ", ".join(f"{counts[k]} {k}" for k in ("exact", "numbers", "near") if counts[k]) or "none"
+    print(f"\n{len(items)} questions, {len(clusters)} duplicate clusters ({summary})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Lossless post-render optimization for the exam PNGs.
+
+matplotlib writes 8-bit RGBA PNGs with metadata. For every PNG in images/
+this stage:
+  - drops the alpha channel when every pixel is opaque
+  - converts to an exact palette image when there are at most 256 colors
+  - drops metadata chunks (text, dpi, gamma)
+  - re-encodes at several zlib settings and keeps the smallest result,
+    or the original if nothing beats it
+  - optionally writes WebP and AVIF siblings: WebP is lossless; AVIF is
+    not (Pillow always converts to YUV), so it is written at quality 100
+    without chroma subsampling and can differ from the PNG by a few levels
+
+Every PNG candidate is decoded and compared pixel-for-pixel against the
+original before it replaces the file. Files run in parallel. Digests of
+already-optimized files are cached in images_optimized.json next to
+images/, so a second run skips them without decoding.
+
+Usage:
+  python optimize_images.py                 # optimize images/ on all cores
+  python optimize_images.py --webp --avif   # also write .webp/.avif siblings
+  python optimize_images.py --force         # ignore the cache
+"""
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+IMAGES_DIR = os.path.join(HERE, "images")
+CACHE_PATH = os.path.join(HERE, "images_optimized.json")
+
+# (optimize, compress_level) candidates tried for every image
+PNG_SETTINGS = [(True, 9), (False, 9), (False, 6)]
+
+
+def _digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_cache():
+    """{optimized digest: digest of the file before optimization}"""
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache):
+    with open(CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def _reduce(image):
+    """Smallest lossless representation: RGB if opaque, palette if <= 256 colors"""
+    import numpy as np
+    from PIL import Image
+
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA")
+    pixels = np.asarray(image)
+    if image.mode == "RGBA" and (pixels[..., 3] == 255).all():
+        image = image.convert("RGB")
+        pixels = pixels[..., :3]
+
+    channels = pixels.shape[2]
+    colors, indices = np.unique(pixels.reshape(-1, channels), axis=0, return_inverse=True)
+    if len(colors) > 256:
+        return image
+
+    palette_image = Image.fromarray(indices.reshape(pixels.shape[:2]).astype(np.uint8), "P")
+    palette_image.putpalette(colors[:, :3].astype(np.uint8).tobytes())
+    if channels == 4:
+        palette_image.info["transparency"] = colors[:, 3].astype(np.uint8).tobytes()
+    return palette_image
+
+
+def _same_pixels(a, b):
+    import numpy as np
+    return np.array_equal(np.asarray(a.convert("RGBA")), np.asarray(b.convert("RGBA")))
+
+
+def _encode_png(image, optimize, level):
+    buffer = io.BytesIO()
+    kwargs = {"optimize": optimize, "compress_level": level}
+    if "transparency" in image.info:
+        kwargs["transparency"] = image.info["transparency"]
+    image.save(buffer, format="PNG", **kwargs)
+    return buffer.getvalue()
+
+
+def optimize_file(path, webp=False, avif=False):
+    """Worker: optimize one PNG in place; returns (path, before, after, siblings, note)"""
+    from PIL import Image
+
+    with open(path, "rb") as f:
+        original = f.read()
+    source = Image.open(io.BytesIO(original))
+    source.load()
+
+    reduced = _reduce(source)
+    best = original
+    for optimize, level in PNG_SETTINGS:
+        candidate = _encode_png(reduced, optimize, level)
+        if len(candidate) < len(best):
+            best = candidate
+
+    note = ""
+    if best is not original:
+        if _same_pixels(source, Image.open(io.BytesIO(best))):
+            with open(path, "wb") as f:
+                f.write(best)
+        else:
+            best = original
+            note = "skipped: re-encoding was not lossless"
+
+    siblings = {}
+    stem = os.path.splitext(path)[0]
+    for enabled, fmt, ext, kwargs in (
+        (webp, "WEBP", ".webp", {"lossless": True, "method": 6}),
+        (avif, "AVIF", ".avif", {"quality": 100, "subsampling": "4:4:4"}),
+    ):
+        if not enabled:
+            continue
+        try:
+            source.save(stem + ext, format=fmt, **kwargs)
+            siblings[ext] = os.path.getsize(stem + ext)
+        except (KeyError, OSError, ValueError) as e:
+            note = f"{fmt} unavailable ({e})"
+    return path, len(original), len(best), siblings, note
+
+
+def optimize_paths(paths, workers=None, webp=False, avif=False, force=False, quiet=False):
+    """Optimize paths in parallel; returns [(path, before, after, siblings, note)]"""
+    cache = load_cache()
+    todo = []
+    for path in paths:
+        with open(path, "rb") as f:
+            digest = _digest(f.read())
+        if force or digest not in cache or webp or avif:
+            todo.append((path, digest))
+
+    results = []
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(digest, pool.submit(optimize_file, path, webp, avif)) for path, digest in todo]
+            for digest, future in futures:
+                result = future.result()
+                results.append(result)
+                with open(result[0], "rb") as f:
+                    cache[_digest(f.read())] = cache.get(digest, digest)
+                if not quiet:
+                    path, before, after, siblings, note = result
+                    extra = "".join(f"  {ext} {size / 1024:.1f}KB" for ext, size in siblings.items())
+                    print(f"{os.path.basename(path):<36}{before / 1024:>9.1f}KB -> {after / 1024:>7.1f}KB{extra}  {note}".rstrip(), flush=True)
+        save_cache(cache)
+    return results
+
+
+def original_digest(digest, cache=None):
+    """Digest a file had before optimization (itself if never optimized)"""
+    cache = load_cache() if cache is None else cache
+    return cache.get(digest, digest)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", default=IMAGES_DIR)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--webp", action="store_true", help="Also write lossless .webp siblings")
+    parser.add_argument("--avif", action="store_true", help="Also write .avif siblings (needs Pillow AVIF support)")
+    parser.add_argument("--force", action="store_true", help="Re-optimize files already in the cache")
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.images, "*.png")))
+    start = time.perf_counter()
+    results = optimize_paths(paths, args.workers, args.webp, args.avif, args.force)
+    elapsed = time.perf_counter() - start
+
+    before = sum(r[1] for r in results)
+    after = sum(r[2] for r in results)
+    print(f"\n{len(paths) - len(results)} already optimized, {len(results)} processed in {elapsed:.1f}s")
+    if before:
+        print(f"{before / 1024:.0f} KB -> {after / 1024:.0f} KB ({1 - after / before:.0%} smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Build-time MathJax rendering for the exam pages.
+
+Every \\(...\\) and \\[...\\] formula in the question bank is typeset to
+static SVG once, at build time, so pages need no MathJax in the browser.
+Rendered formulas are cached in math_cache.json keyed by their TeX
+(delimiters included); only formulas not in the cache go to MathJax, in
+one batch per build.
+
+Rendering uses mathjax-full under Node:
+  npm install mathjax-full        # once, in this folder
+
+Usage:
+  python build_exams.py --prerender --out dist   # pre-rendered site in dist/
+  python prerender_math.py --stats               # cache size and uncached formulas
+"""
+import argparse
+import json
+import os
+import subprocess
+
+from question_bank import HERE, load_bank
+from tex_escape import split_math
+
+CACHE_PATH = os.path.join(HERE, "math_cache.json")
+
+# Bump when the renderer options below change, to drop stale cache entries
+RENDERER_VERSION = 1
+
+# MathJax's client-side loader; pre-rendered pages replace it with the SVG stylesheet
+MATHJAX_SCRIPT = '<script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>'
+
+# Reads [[tex, display], ...] on stdin, writes {"formulas": [svg, ...], "css": stylesheet}
+NODE_RENDERER = r"""
+const {mathjax} = require('mathjax-full/js/mathjax.js');
+const {TeX} = require('mathjax-full/js/input/tex-full.js');
+const {SVG} = require('mathjax-full/js/output/svg.js');
+const {liteAdaptor} = require('mathjax-full/js/adaptors/liteAdaptor.js');
+const {RegisterHTMLHandler} = require('mathjax-full/js/handlers/html.js');
+
+const adaptor = liteAdaptor();
+RegisterHTMLHandler(adaptor);
+const svg = new SVG({fontCache: 'none'});
+const doc = mathjax.document('', {InputJax: new TeX({packages: ['base', 'ams', 'newcommand']}), OutputJax: svg});
+
+let input = '';
+process.stdin.on('data', chunk => input += chunk);
+process.stdin.on('end', () => {
+    const formulas = JSON.parse(input).map(([tex, display]) =>
+        adaptor.outerHTML(doc.convert(tex, {display})));
+    process.stdout.write(JSON.stringify({formulas, css: adaptor.textContent(svg.styleSheet(doc))}));
+});
+"""
+
+
+# MathJax typesets TeX it cannot parse as an <merror> box instead of failing
+MERROR = 'data-mml-node="merror"'
+
+
+class MathRenderError(RuntimeError):
+    pass
+
+
+def load_cache():
+    """{"css": stylesheet, "formulas": {tex: svg}}, empty if written by another renderer version"""
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    if cache.get("version") != RENDERER_VERSION:
+        return {"css": "", "formulas": {}}
+    return cache
+
+
+def save_cache(cache):
+    with open(CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump({**cache, "version": RENDERER_VERSION}, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def formulas_in(record):
+    """Math segments (with delimiters) in a record's text fields"""
+    found = []
+    for field in ("question", "options", "explanation"):
+        value = record[field]
+        for text in value if isinstance(value, list) else [value]:
+            if isinstance(text, str):
+                found += [seg for is_math, seg in split_math(text) if is_math]
+    return found
+
+
+def run_mathjax(formulas):
+    """Typeset formulas with mathjax-full; returns ({formula: svg}, css)"""
+    batch = [[f[2:-2], f.startswith("\\[")] for f in formulas]
+    try:
+        result = subprocess.run(
+            ["node", "-e", NODE_RENDERER], input=json.dumps(batch), cwd=HERE,
+            capture_output=True, text=True, encoding="utf-8", check=True,
+        )
+    except FileNotFoundError:
+        raise MathRenderError("node is not installed")
+    except subprocess.CalledProcessError as e:
+        raise MathRenderError(f"MathJax failed (is mathjax-full installed? npm install mathjax-full):\n{e.stderr}")
+    output = json.loads(result.stdout)
+    svgs = dict(zip(formulas, output["formulas"]))
+    broken = [f for f, svg in svgs.items() if MERROR in svg]
+    if broken:
+        raise MathRenderError("MathJax could not typeset:\n" + "\n".join(f"  {f}" for f in broken))
+    return svgs, output["css"]
+
+
+class MathPrerenderer:
+    """Replaces formulas in bank strings with cached SVG"""
+
+    def __init__(self):
+        self.cache = load_cache()
+        self.rendered = 0
+
+    def missing(self, records):
+        """Formulas in records that are not cached yet"""
+        return sorted({f for record in records for f in formulas_in(record)} - self.cache["formulas"].keys())
+
+    def prepare(self, records):
+        """Typeset every formula in records that is not cached yet, in one batch"""
+        formulas = self.cache["formulas"]
+        missing = self.missing(records)
+        if missing:
+            svgs, css = run_mathjax(missing)
+            formulas.update(svgs)
+            self.cache["css"] = css
+            self.rendered += len(missing)
+            save_cache(self.cache)
+        return len(missing)
+
+    def render_text(self, text):
+        """Text with cached formulas swapped for SVG (uncached ones stay TeX)"""
+        formulas = self.cache["formulas"]
+        return "".join(formulas.get(seg, seg) if is_math else seg for is_math, seg in split_math(text))
+
+    def render_record(self, record):
+        rendered = dict(record)
+        for field in ("question", "options", "explanation"):
+            value = rendered[field]
+            if isinstance(value, list):
+                rendered[field] = [self.render_text(v) if isinstance(v, str) else v for v in value]
+            elif isinstance(value, str):
+                rendered[field] = self.render_text(value)
+        return rendered
+
+    def render_page(self, html):
+        """Swap the MathJax loader for the static SVG stylesheet"""
+        style = f'<style id="MathJax-SVG-styles">{self.cache["css"]}</style>'
+        return html.replace(MATHJAX_SCRIPT, style)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stats", action="store_true", help="Show cache coverage of the bank")
+    args = parser.parse_args()
+    if not args.stats:
+        parser.print_help()
+        return
+
+    cache = load_cache()["formulas"]
+    formulas = {f for questions in load_bank().values() for q in questions for f in formulas_in(q)}
+    cached = formulas & cache.keys()
+    print(f"{len(formulas)} distinct formulas in the bank, {len(cached)} cached, {len(formulas) - len(cached)} to render")
+    print(f"{len(cache.keys() - formulas)} cached formulas no longer used")
+
+
+if __name__ == "__main__":
+    main()
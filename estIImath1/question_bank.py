@@ -0,0 +1,381 @@
+"""
+Structured question bank for the practice exams.
+
+question_bank/<exam>.json is the single source of truth for exam content:
+one record per question with the schema
+
+  id, topic, difficulty, question, options, answer, explanation, image
+
+plus an optional section (a `// ===== Q1-11: ALGEBRA ... =====` banner
+opening a block of questions), note (the author comment shown above the
+question in the page source) and extra (any other page fields, passed
+through).
+
+difficulty is easy, medium or hard, or null while a question is unrated.
+The pages never recorded a difficulty, so every imported record starts
+null; questions are rated by hand (`set exam8 12 difficulty medium`)
+rather than guessed, and build_exams.py only emits the field once set.
+
+build_exams.py compiles the bank into the `const questions = [...]`
+array of each est-practice-exam*.html page. Editing a question is a
+record update here instead of a str.replace over the whole page.
+
+Usage:
+  python question_bank.py import              # one-time: extract the bank from the current pages
+  python question_bank.py list exam8          # id, topic and answer of every question
+  python question_bank.py show exam8 6        # one question as JSON (by id; repeated ids all shown)
+  python question_bank.py set exam8 12 answer 2 [--index N]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+
+from tex_escape import repair_record
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BANK_DIR = os.path.join(HERE, "question_bank")
+
+# Exam name -> page compiled from its bank file
+EXAMS = {
+    "exam1": "est-practice-exam.html",
+    "exam2": "est-practice-exam2.html",
+    "exam3": "est-practice-exam3.html",
+    "exam4": "est-practice-exam4.html",
+    "exam5": "est-practice-exam5.html",
+    "exam6": "est-practice-exam6.html",
+    "exam7": "est-practice-exam7.html",
+    "exam8": "est-practice-exam8.html",
+}
+
+FIELDS = ["id", "topic", "difficulty", "question", "options", "answer", "explanation", "image"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+# Canonical topics (the six EST sections) and word prefixes that identify them, most specific first
+TOPICS = [
+    ("Coordinate Geometry", r"coordinate|slope|perpendicular slope|parallel line\b|midpoint|distance formula|intercept"),
+    ("Trigonometry", r"trig|sin|cos|tangent ratio|tan\b|pythagorean identity|unit circle"),
+    ("Statistics & Probability", r"statistic|probab|counting|permutation|combination|mean|median|histogram|chart|box plot|data"),
+    ("Numerations & Operations", r"numeration|ratios?\b|percent|discount|number|operation|word problem|work rate|mixture"),
+    ("Geometry", r"geometry|triangle|circle|angle|polygon|parallelogram|hexagon|area|volume|tangent"),
+    ("Algebra & Functions", r"algebra|function|polynomial|quadratic|parabola|equation|solution|exponent|log|sequence|inequalit|absolute|rational|identity"),
+]
+
+ARRAY_START = re.compile(r"const questions = \[")
+
+
+# ==========================================
+# Reading the JavaScript literal
+# ==========================================
+
+class JSParseError(ValueError):
+    pass
+
+
+class _JSReader:
+    """Parser for the JavaScript object-literal subset the exam pages use"""
+
+    ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+
+    def __init__(self, text, pos):
+        self.text = text
+        self.pos = pos
+        self.comments = []  # (position, comment text) seen while skipping
+
+    def error(self, message):
+        line = self.text.count("\n", 0, self.pos) + 1
+        raise JSParseError(f"{message} at line {line}")
+
+    def skip(self):
+        text = self.text
+        while self.pos < len(text):
+            ch = text[self.pos]
+            if ch.isspace():
+                self.pos += 1
+            elif text.startswith("//", self.pos):
+                end = text.find("\n", self.pos)
+                end = len(text) if end == -1 else end
+                self.comments.append((self.pos, text[self.pos + 2:end].strip()))
+                self.pos = end
+            elif text.startswith("/*", self.pos):
+                end = text.find("*/", self.pos)
+                if end == -1:
+                    self.error("Unterminated comment")
+                self.pos = end + 2
+            else:
+                return
+
+    def value(self):
+        self.skip()
+        ch = self.text[self.pos]
+        if ch == "[":
+            return self.array()
+        if ch == "{":
+            return self.object()
+        if ch in "\"'`":
+            return self.string()
+        m = re.compile(r"-?\d+(\.\d+)?|true|false|null").match(self.text, self.pos)
+        if not m:
+            self.error(f"Unexpected {ch!r}")
+        self.pos = m.end()
+        token = m.group()
+        if token in ("true", "false"):
+            return token == "true"
+        if token == "null":
+            return None
+        return float(token) if "." in token else int(token)
+
+    def string(self):
+        quote = self.text[self.pos]
+        self.pos += 1
+        out = []
+        text = self.text
+        while True:
+            if self.pos >= len(text):
+                self.error("Unterminated string")
+            ch = text[self.pos]
+            if ch == quote:
+                self.pos += 1
+                return "".join(out)
+            if quote == "`" and text.startswith("${", self.pos):
+                self.error("Template substitutions are not supported")
+            if ch == "\\":
+                nxt = text[self.pos + 1]
+                if nxt == "u":
+                    out.append(chr(int(text[self.pos + 2:self.pos + 6], 16)))
+                    self.pos += 6
+                    continue
+                if nxt == "\n":
+                    self.pos += 2  # Line continuation
+                    continue
+                # Unknown escapes (\( \[ \s ...) drop the backslash, as JavaScript does
+                out.append(self.ESCAPES.get(nxt, nxt))
+                self.pos += 2
+                continue
+            out.append(ch)
+            self.pos += 1
+
+    def array(self):
+        self.pos += 1
+        items = []
+        while True:
+            self.skip()
+            if self.text[self.pos] == "]":
+                self.pos += 1
+                return items
+            items.append(self.value())
+            self.skip()
+            if self.text[self.pos] == ",":
+                self.pos += 1
+
+    def object(self):
+        self.pos += 1
+        obj = {}
+        while True:
+            self.skip()
+            if self.text[self.pos] == "}":
+                self.pos += 1
+                return obj
+            if self.text[self.pos] in "\"'":
+                key = self.string()
+            else:
+                m = re.compile(r"[A-Za-z_$][\w$]*").match(self.text, self.pos)
+                if not m:
+                    self.error("Expected a key")
+                key = m.group()
+                self.pos = m.end()
+            self.skip()
+            if self.text[self.pos] != ":":
+                self.error("Expected ':'")
+            self.pos += 1
+            obj[key] = self.value()
+            self.skip()
+            if self.text[self.pos] == ",":
+                self.pos += 1
+
+
+def find_questions_array(html):
+    """(start, end) of the `[...]` literal after `const questions =`"""
+    m = ARRAY_START.search(html)
+    if not m:
+        raise JSParseError("No `const questions = [` in page")
+    reader = _JSReader(html, m.end() - 1)
+    reader.array()
+    return m.end() - 1, reader.pos
+
+
+def extract_questions(html):
+    """Parse the page's questions array into bank records, in page order"""
+    start, _ = find_questions_array(html)
+    reader = _JSReader(html, start + 1)
+    records = []
+    section = None
+    while True:
+        reader.skip()
+        if html[reader.pos] == "]":
+            break
+        comments = [c for _, c in reader.comments]
+        reader.comments = []
+        for comment in comments:
+            if comment.startswith("====="):
+                section = comment
+        raw = reader.value()
+        reader.skip()
+        if html[reader.pos] == ",":
+            reader.pos += 1
+        note = next((c for c in reversed(comments) if not c.startswith("=====")), None)
+        banner = next((c for c in reversed(comments) if c.startswith("=====")), None)
+        records.append(_record_from_raw(raw, section, note, banner))
+    return records
+
+
+def _record_from_raw(raw, section, note, banner=None):
+    raw = dict(raw)
+    image = raw.pop("graphImage", None)
+    record = {
+        "id": raw.pop("id"),
+        "topic": raw.pop("topic", None) or guess_topic(section, note, raw.get("question", "")),
+        "difficulty": raw.pop("difficulty", None),
+        "question": raw.pop("question"),
+        "options": raw.pop("options"),
+        "answer": raw.pop("answer"),
+        "explanation": raw.pop("explanation", ""),
+        "image": image if raw.pop("hasGraph", False) else None,
+    }
+    if banner:
+        record["section"] = banner  # Section banner opening this block, kept in the page
+    if note:
+        record["note"] = note  # Author's comment above the question, kept in the page
+    if raw:
+        record["extra"] = raw
+    return record
+
+
+def guess_topic(section, note, question):
+    """Canonical topic from a per-question comment, the section banner, or the question text"""
+    for text in (note, section, question):
+        if not text:
+            continue
+        lowered = text.lower()
+        # A "(Topic)" tag in the comment wins over other keywords
+        tags = re.findall(r"\(([A-Za-z &/]+)\)", text)
+        for candidate in [t.lower() for t in tags] + [lowered]:
+            for topic, pattern in TOPICS:
+                if re.search(r"\b(?:%s)" % pattern, candidate):
+                    return topic
+    return None
+
+
+# ==========================================
+# Bank files
+# ==========================================
+
+def bank_path(exam):
+    return os.path.join(BANK_DIR, f"{exam}.json")
+
+
+def load_exam(exam):
+    with open(bank_path(exam), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_exam(exam, questions):
+    """Write an exam's records, with TeX mangled by old page escaping repaired"""
+    os.makedirs(BANK_DIR, exist_ok=True)
+    with open(bank_path(exam), "w", encoding="utf-8") as f:
+        json.dump([repair_record(q) for q in questions], f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def load_bank():
+    """{exam: [records]} for every exam with a bank file"""
+    return {exam: load_exam(exam) for exam in EXAMS if os.path.exists(bank_path(exam))}
+
+
+def validate(exam, questions):
+    """List of problems that would break the page"""
+    problems = []
+    for index, q in enumerate(questions):
+        where = f"{exam}[{index}] (id {q.get('id')})"
+        missing = [f for f in FIELDS if f not in q]
+        if missing:
+            problems.append(f"{where}: missing {', '.join(missing)}")
+            continue
+        if not isinstance(q["options"], list) or not q["options"]:
+            problems.append(f"{where}: options must be a non-empty list")
+        elif not isinstance(q["answer"], int) or not 0 <= q["answer"] < len(q["options"]):
+            problems.append(f"{where}: answer {q['answer']!r} is not an option index")
+        if q["difficulty"] is not None and q["difficulty"] not in DIFFICULTIES:
+            problems.append(f"{where}: difficulty must be one of {DIFFICULTIES}")
+        if q["image"] and not os.path.exists(os.path.join(HERE, q["image"])):
+            problems.append(f"{where}: missing image {q['image']}")
+    return problems
+
+
+def _select(questions, qid, index):
+    matches = [i for i, q in enumerate(questions) if str(q["id"]) == str(qid)]
+    if index is not None:
+        matches = [i for i in matches if i == index]
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import", help="Extract the bank from the current exam pages")
+    imp.add_argument("--force", action="store_true", help="Overwrite existing bank files")
+    sub.add_parser("list").add_argument("exam", choices=EXAMS)
+    show = sub.add_parser("show")
+    show.add_argument("exam", choices=EXAMS)
+    show.add_argument("id")
+    setter = sub.add_parser("set")
+    setter.add_argument("exam", choices=EXAMS)
+    setter.add_argument("id")
+    setter.add_argument("field", choices=FIELDS)
+    setter.add_argument("value", help="JSON value (bare text is taken as a string)")
+    setter.add_argument("--index", type=int, help="Position in the exam, for repeated ids")
+    args = parser.parse_args()
+
+    if args.command == "import":
+        for exam, page in EXAMS.items():
+            if os.path.exists(bank_path(exam)) and not args.force:
+                print(f"[SKIP] {exam}: bank file exists (use --force)")
+                continue
+            with open(os.path.join(HERE, page), "r", encoding="utf-8") as f:
+                questions = extract_questions(f.read())
+            save_exam(exam, questions)
+            print(f"[OK] {exam}: {len(questions)} questions from {page}")
+        return
+
+    questions = load_exam(args.exam)
+    if args.command == "list":
+        for index, q in enumerate(questions):
+            print(f"{index:>3}  id {q['id']:<4} {q['topic'] or '-':<26} answer {'ABCDE'[q['answer']] if isinstance(q['answer'], int) and q['answer'] < 5 else q['answer']}")
+        return
+
+    matches = _select(questions, args.id, getattr(args, "index", None))
+    if not matches:
+        sys.exit(f"No question with id {args.id} in {args.exam}")
+    if args.command == "show":
+        for i in matches:
+            print(f"// {args.exam}[{i}]")
+            print(json.dumps(questions[i], ensure_ascii=False, indent=2))
+        return
+
+    if len(matches) > 1:
+        sys.exit(f"id {args.id} appears at positions {matches}; pick one with --index")
+    try:
+        value = json.loads(args.value)
+    except ValueError:
+        value = args.value
+    questions[matches[0]][args.field] = value
+    problems = validate(args.exam, questions)
+    if problems:
+        sys.exit("\n".join(problems))
+    save_exam(args.exam, questions)
+    print(f"[OK] {args.exam}[{matches[0]}].{args.field} updated; run build_exams.py to recompile the page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""
+Render every exam figure in parallel.
+
+Discovers the figures in generate_exam*_images.py (every module-level
+function that calls plt.savefig, plus the declarative specs in a
+module's FIGURES list, see figure_spec.py) and renders them in a
+process pool, one figure per task. Each figure runs inside its own
+rc_context, so rcParams set by one script (e.g. set_style) never leak
+into another. Prints per-figure render time.
+
+Builds are incremental: each figure is keyed by a hash of its function
+source, the helpers and globals it references, and the matplotlib/numpy
+versions. Keys and output digests live in figures_manifest.json next to
+images/, and figures whose key and outputs are unchanged are skipped.
+
+Figures can also be written as SVG next to the PNG: per spec (svg=True),
+per script (an SVG_FIGURES list of function names) or from the command
+line with --svg. --size-report compares PNG and SVG bytes afterwards.
+
+--optimize runs the lossless PNG stage (optimize_images.py) over the
+freshly rendered files. Optimized files still count as up to date.
+
+Usage:
+  python render_figures.py                  # render changed figures on all cores
+  python render_figures.py --force          # ignore the manifest, render everything
+  python render_figures.py --only exam5     # only figures matching "module:function"
+  python render_figures.py --workers 4
+  python render_figures.py --svg all --size-report
+  python render_figures.py --optimize
+  python render_figures.py --list           # show discovered figures
+"""
+import argparse
+import contextlib
+import glob
+import hashlib
+import importlib
+import inspect
+import io
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SCRIPT_PATTERN = "generate_exam*_images.py"
+MANIFEST_PATH = os.path.join(HERE, "figures_manifest.json")
+
+# Bump to force a full rebuild when the render pipeline itself changes
+MANIFEST_VERSION = 1
+
+
+def _prepare_process():
+    """The scripts save to the relative images/ folder and must not open windows"""
+    os.chdir(HERE)
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def discover_figures():
+    """[(module_name, name)] for every figure function and spec, in file order"""
+    figures = []
+    for path in sorted(glob.glob(os.path.join(HERE, SCRIPT_PATTERN))):
+        module_name = os.path.splitext(os.path.basename(path))[0]
+        with contextlib.redirect_stdout(io.StringIO()):
+            module = importlib.import_module(module_name)
+        functions = [
+            fn for _, fn in inspect.getmembers(module, inspect.isfunction)
+            if fn.__module__ == module_name and "savefig" in fn.__code__.co_names
+        ]
+        functions.sort(key=lambda fn: fn.__code__.co_firstlineno)
+        figures.extend((module_name, fn.__name__) for fn in functions)
+        figures.extend((module_name, spec.name) for spec in getattr(module, "FIGURES", []))
+    return figures
+
+
+def _find_spec(module, name):
+    return next((spec for spec in getattr(module, "FIGURES", []) if spec.name == name), None)
+
+
+def _file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def wants_svg(module_name, name, patterns):
+    """CLI patterns ("all" or substrings of "module:name") or the script's SVG_FIGURES"""
+    module = importlib.import_module(module_name)
+    if name in getattr(module, "SVG_FIGURES", ()):
+        return True
+    return any(p == "all" or p in f"{module_name}:{name}" for p in patterns)
+
+
+def figure_key(module_name, function_name, svg=False):
+    """
+    Hash of everything that determines a figure's pixels: the function's
+    source and defaults, the source of module functions it calls (and
+    set_style, which the driver applies), the repr of other module globals
+    it reads, and the library versions. Specs hash their repr and the
+    renderer source instead.
+    """
+    import matplotlib
+    import numpy
+
+    module = importlib.import_module(module_name)
+    parts = [
+        f"manifest={MANIFEST_VERSION}",
+        f"matplotlib={matplotlib.__version__}",
+        f"numpy={numpy.__version__}",
+        f"svg={svg}",
+    ]
+    spec = _find_spec(module, function_name)
+    if spec is not None:
+        import figure_spec
+        import svg_export
+        parts += [repr(spec), inspect.getsource(figure_spec), inspect.getsource(svg_export)]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    fn = getattr(module, function_name)
+    if svg:
+        import svg_export
+        parts.append(inspect.getsource(svg_export))
+    parts += [
+        inspect.getsource(fn),
+        repr(fn.__defaults__),
+    ]
+    referenced = sorted(set(fn.__code__.co_names) | ({"set_style"} if hasattr(module, "set_style") else set()))
+    for name in referenced:
+        value = module.__dict__.get(name)
+        if inspect.isfunction(value) and value.__module__ == module_name:
+            parts.append(inspect.getsource(value))
+        elif value is not None and not inspect.ismodule(value) and not callable(value):
+            parts.append(f"{name}={value!r}")
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest.get("figures", {}) if manifest.get("version") == MANIFEST_VERSION else {}
+
+
+def save_manifest(entries):
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "figures": entries}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def is_up_to_date(entry, key, optimized):
+    """
+    Same key, and every recorded output still exists with the recorded
+    digest (or is the optimize_images.py result of a file that had it)
+    """
+    if not entry or entry.get("key") != key or not entry.get("outputs"):
+        return False
+    for path, digest in entry["outputs"].items():
+        full_path = os.path.join(HERE, path)
+        if not os.path.exists(full_path):
+            return False
+        current = _file_digest(full_path)
+        if current != digest and optimized.get(current) != digest:
+            return False
+    return True
+
+
+_spec_renderer = None
+
+
+def render_figure(module_name, function_name, svg=False):
+    """Worker: render one figure; returns (outputs, seconds)"""
+    global _spec_renderer
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    module = importlib.import_module(module_name)
+    spec = _find_spec(module, function_name)
+    if spec is not None:
+        if _spec_renderer is None:
+            from figure_spec import FigureRenderer
+            _spec_renderer = FigureRenderer(HERE)  # Reused by every spec this worker renders
+        start = time.perf_counter()
+        with matplotlib.rc_context():
+            outputs = _spec_renderer.render(spec, svg=svg)
+        return outputs, time.perf_counter() - start
+
+    outputs = []
+    savefig = plt.savefig
+
+    def recording_savefig(fname, *args, **kwargs):
+        outputs.append(os.fspath(fname))
+        result = savefig(fname, *args, **kwargs)
+        if svg:
+            from svg_export import save_svg, svg_path_for
+            svg_path = svg_path_for(os.fspath(fname))
+            save_svg(plt.gcf(), svg_path, bbox_inches=kwargs.get("bbox_inches"))
+            outputs.append(svg_path)
+        return result
+
+    start = time.perf_counter()
+    plt.savefig = recording_savefig
+    try:
+        with matplotlib.rc_context(), contextlib.redirect_stdout(io.StringIO()):
+            if hasattr(module, "set_style"):
+                module.set_style()
+            getattr(module, function_name)()
+    finally:
+        plt.savefig = savefig
+        plt.close("all")
+    return outputs, time.perf_counter() - start
+
+
+def render_all(figures, workers, svg=frozenset()):
+    """Render figures in a pool; returns ({(module, function): (outputs, seconds)}, failures)"""
+    results = {}
+    failures = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_prepare_process) as pool:
+        futures = {pool.submit(render_figure, *figure, figure in svg): figure for figure in figures}
+        for future in as_completed(futures):
+            module_name, function_name = futures[future]
+            try:
+                outputs, seconds = future.result()
+            except Exception:
+                failures[futures[future]] = traceback.format_exc()
+                print(f"[FAIL] {module_name}:{function_name}", flush=True)
+                continue
+            results[futures[future]] = (outputs, seconds)
+            names = ", ".join(os.path.basename(o) for o in outputs) or "(no output)"
+            print(f"[OK] {seconds:6.2f}s  {module_name}:{function_name} -> {names}", flush=True)
+    return results, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", help="Render figures whose 'module:function' contains this text")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (default: all cores)")
+    parser.add_argument("--list", action="store_true", help="List discovered figures and exit")
+    parser.add_argument("--force", action="store_true", help="Render every figure, ignoring the manifest")
+    parser.add_argument("--svg", default="", help="Also write SVG for 'all' or comma-separated 'module:name' substrings")
+    parser.add_argument("--size-report", action="store_true", help="Compare PNG and SVG bytes after rendering")
+    parser.add_argument("--optimize", action="store_true", help="Losslessly optimize the rendered PNGs")
+    args = parser.parse_args()
+
+    _prepare_process()
+    figures = discover_figures()
+    if args.only:
+        figures = [f for f in figures if args.only in f"{f[0]}:{f[1]}"]
+
+    patterns = [p for p in args.svg.split(",") if p]
+    svg = {figure for figure in figures if wants_svg(*figure, patterns)}
+    keys = {figure: figure_key(*figure, svg=figure in svg) for figure in figures}
+    manifest = load_manifest()
+    from optimize_images import load_cache
+    optimized = load_cache()
+
+    if args.list:
+        for figure in figures:
+            state = "fresh" if is_up_to_date(manifest.get(":".join(figure)), keys[figure], optimized) else "stale"
+            print(f"{state:<6} {figure[0]}:{figure[1]}")
+        print(f"\n{len(figures)} figures")
+        return
+
+    stale = [f for f in figures if args.force or not is_up_to_date(manifest.get(":".join(f)), keys[f], optimized)]
+    print(f"{len(figures) - len(stale)} figures up to date, rendering {len(stale)} on {args.workers} workers...\n", flush=True)
+    start = time.perf_counter()
+    results, failures = render_all(stale, args.workers, svg) if stale else ({}, {})
+    wall = time.perf_counter() - start
+
+    if args.optimize and results:
+        from optimize_images import optimize_paths
+        pngs = [os.path.join(HERE, o) for outputs, _ in results.values() for o in outputs if o.endswith(".png")]
+        print(f"\nOptimizing {len(pngs)} PNGs...", flush=True)
+        optimize_paths(pngs, args.workers)
+
+    for figure, (outputs, seconds) in results.items():
+        relative = [os.path.relpath(os.path.join(HERE, o), HERE).replace(os.sep, "/") for o in outputs]
+        manifest[":".join(figure)] = {
+            "key": keys[figure],
+            "outputs": {path: _file_digest(os.path.join(HERE, path)) for path in relative},
+            "seconds": round(seconds, 3),
+        }
+    if not args.only:
+        # Forget figures whose functions no longer exist
+        current = {":".join(f) for f in figures}
+        manifest = {name: entry for name, entry in manifest.items() if name in current}
+    save_manifest(manifest)
+
+    if args.size_report:
+        from svg_export import print_size_report, size_report
+        print()
+        print_size_report(size_report())
+
+    if not results and not failures:
+        print("Nothing to do")
+        return
+
+    cpu = sum(seconds for _, seconds in results.values())
+    print(f"\n{len(results)} figures in {wall:.2f}s wall, {cpu:.2f}s of render time ({cpu / wall if wall else 0:.1f}x)")
+    slowest = sorted(results.items(), key=lambda item: item[1][1], reverse=True)[:5]
+    if slowest:
+        print("Slowest:")
+        for (module_name, function_name), (_, seconds) in slowest:
+            print(f"  {seconds:6.2f}s  {module_name}:{function_name}")
+
+    if failures:
+        print(f"\n{len(failures)} figure(s) failed:")
+        for (module_name, function_name), error in failures.items():
+            print(f"\n--- {module_name}:{function_name}\n{error}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+SVG output for exam figures.
+
+Line-art figures (graphs, triangles, charts) are far smaller as SVG than
+as 150-dpi PNGs. save_svg writes a figure with text converted to shared
+glyph paths (each glyph is defined once and reused, so only the glyphs
+actually drawn are embedded), fixed ids and no timestamp, then trims
+coordinates to a few decimals and drops metadata and indentation.
+
+Usage:
+  python svg_export.py --report       # PNG vs SVG bytes for every figure in images/
+"""
+import argparse
+import glob
+import os
+import re
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+IMAGES_DIR = os.path.join(HERE, "images")
+
+# Decimal places kept in SVG coordinates; 2 is well below a screen pixel at exam sizes
+SVG_PRECISION = 2
+
+SVG_RC = {
+    "svg.fonttype": "path",
+    "svg.hashsalt": "estIImath1",  # Stable element ids, so unchanged figures hash the same
+}
+
+_NUMBER = re.compile(r"-?\d+\.\d+")
+
+
+def trim_svg(text, precision=SVG_PRECISION):
+    """Round coordinates, drop <metadata> and whitespace between tags"""
+    def shorten(match):
+        value = f"{float(match.group()):.{precision}f}".rstrip("0").rstrip(".")
+        return "0" if value in ("-0", "") else value
+
+    # Leave the XML declaration and doctype (version="1.0") alone
+    prolog, tag, body = text.partition("<svg")
+    body = re.sub(r"<metadata>.*?</metadata>", "", body, flags=re.S)
+    body = re.sub(r"<!--.*?-->", "", body, flags=re.S)
+    body = _NUMBER.sub(shorten, body)
+    return (prolog + tag + re.sub(r">\s+<", "><", body)).strip() + "\n"
+
+
+def svg_path_for(png_path):
+    return os.path.splitext(png_path)[0] + ".svg"
+
+
+def save_svg(fig, path, precision=SVG_PRECISION, **savefig_kwargs):
+    """Save fig as a trimmed SVG at path; returns the byte size"""
+    import io
+    import matplotlib
+
+    buffer = io.StringIO()
+    savefig_kwargs.pop("dpi", None)
+    with matplotlib.rc_context(SVG_RC):
+        fig.savefig(buffer, format="svg", metadata={"Date": None}, **savefig_kwargs)
+    data = trim_svg(buffer.getvalue(), precision).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def size_report(images_dir=IMAGES_DIR):
+    """[(name, png_bytes, svg_bytes or None)] for every PNG in images_dir"""
+    rows = []
+    for png in sorted(glob.glob(os.path.join(images_dir, "*.png"))):
+        svg = svg_path_for(png)
+        rows.append((
+            os.path.basename(os.path.splitext(png)[0]),
+            os.path.getsize(png),
+            os.path.getsize(svg) if os.path.exists(svg) else None,
+        ))
+    return rows
+
+
+def print_size_report(rows):
+    print(f"{'figure':<36}{'png KB':>10}{'svg KB':>10}{'saving':>9}")
+    png_total = svg_total = png_with_svg = 0
+    for name, png, svg in rows:
+        png_total += png
+        if svg is None:
+            print(f"{name:<36}{png / 1024:>10.1f}{'-':>10}{'':>9}")
+            continue
+        svg_total += svg
+        png_with_svg += png
+        print(f"{name:<36}{png / 1024:>10.1f}{svg / 1024:>10.1f}{1 - svg / png:>9.0%}")
+    print(f"\nAll PNGs: {png_total / 1024:.0f} KB")
+    if png_with_svg:
+        print(
+            f"Figures with SVG: {png_with_svg / 1024:.0f} KB as PNG -> {svg_total / 1024:.0f} KB as SVG "
+            f"({1 - svg_total / png_with_svg:.0%} smaller)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--report", action="store_true", help="Compare PNG and SVG sizes in images/")
+    parser.add_argument("--images", default=IMAGES_DIR)
+    args = parser.parse_args()
+    if not args.report:
+        parser.print_help()
+        return
+    print_size_report(size_report(args.images))
+
+
+if __name__ == "__main__":
+    main()
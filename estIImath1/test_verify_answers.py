@@ -0,0 +1,43 @@
+"""
+Tests for verify_answers.py (run with: python -m pytest estIImath1)
+"""
+from sympy import Integer, Rational
+
+from verify_answers import _math_segments, expected_answer, verify_question
+
+
+def test_plain_equation_keeps_power_on_left_side():
+    assert _math_segments("If 2^x = 8, what is x?") == ["2^x = 8"]
+    assert expected_answer("If 2^x = 8, what is x?") == Integer(3)
+
+
+def test_plain_system_of_powers():
+    question = "If 3^x = 27 and 2^y = 16, what is xy?"
+    assert _math_segments(question) == ["3^x = 27", "2^y = 16"]
+    assert expected_answer(question) == Integer(12)
+
+
+def test_plain_equation_with_parentheses():
+    question = "If 4(x - 3) + 2 = 3(x + 5), what is x?"
+    assert _math_segments(question) == ["4(x - 3) + 2 = 3(x + 5)"]
+    assert expected_answer(question) == Integer(25)
+
+
+def test_plain_function_definition():
+    assert expected_answer("If f(x) = 2x + 1, what is f(3)?") == Integer(7)
+
+
+def test_plain_ratios():
+    assert expected_answer("If a:b = 3:4 and b:c = 2:5, what is a:c?") == Rational(3, 10)
+
+
+def test_tex_question_is_checked_against_options():
+    question = {
+        "id": 1,
+        "question": "If \\(2^x = 8\\), what is \\(x\\)?",
+        "options": ["2", "3", "4", "8"],
+        "answer": 1,
+        "explanation": [],
+    }
+    result = verify_question(("exam", 0, question))
+    assert result["verdict"] == "ok"
@@ -0,0 +1,106 @@
+"""
+MathJax-safe escaping for exam strings.
+
+The bank stores question text exactly as MathJax should see it, e.g.
+\\(\\frac{1}{2}\\). js_string turns such text into a JavaScript string
+literal in one linear pass over its characters; every backslash is
+doubled exactly once, so compiling the same text twice gives the same
+literal and nothing ever has to be un-escaped.
+
+repair_tex undoes the damage single-escaped sources did to TeX before
+the bank existed: inside math, "\\frac" written as "\\f"+"rac" became a
+form feed and "\\sqrt" lost its backslash. It tokenizes the text into
+plain and math segments once and only rewrites inside math, and its
+output is a fixed point (repair_tex(repair_tex(s)) == repair_tex(s)).
+"""
+import re
+
+# Math delimiters MathJax is configured for in the exam pages
+MATH_OPEN = {"\\(": "\\)", "\\[": "\\]"}
+
+# Control characters a JavaScript escape leaves in place of "\" + letter
+_JS_CONTROL = {"\f": "f", "\t": "t", "\b": "b", "\v": "v", "\r": "r", "\n": "n"}
+
+# Commands whose bare names never mean anything else inside math
+BARE_COMMANDS = ["dfrac", "frac", "sqrt", "cdot", "times", "theta", "alpha", "beta", "leq", "geq", "neq", "infty", "circ", "pm"]
+_BARE = re.compile(r"(?<![\\A-Za-z])(%s)(?![A-Za-z])" % "|".join(BARE_COMMANDS))
+
+_JS_ESCAPES = {
+    "\\": "\\\\",
+    '"': '\\"',
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+    "\u2028": "\\u2028",
+    "\u2029": "\\u2029",
+}
+
+
+def split_math(text):
+    """[(is_math, segment)], delimiters included in math segments"""
+    segments = []
+    pos = 0
+    plain_start = 0
+    while pos < len(text):
+        close = MATH_OPEN.get(text[pos:pos + 2])
+        if close is None:
+            pos += 1
+            continue
+        end = text.find(close, pos + 2)
+        if end == -1:
+            break  # Unbalanced: leave the rest as plain text
+        if plain_start < pos:
+            segments.append((False, text[plain_start:pos]))
+        segments.append((True, text[pos:end + 2]))
+        pos = plain_start = end + 2
+    if plain_start < len(text):
+        segments.append((False, text[plain_start:]))
+    return segments
+
+
+def _repair_math(segment):
+    out = []
+    for i, ch in enumerate(segment):
+        letter = _JS_CONTROL.get(ch)
+        # "\n" only counts when a command name follows (\neq, \neg), not a real line break
+        if letter and (ch != "\n" or segment[i + 1:i + 2].isalpha()):
+            out.append("\\" + letter)
+        else:
+            out.append(ch)
+    return _BARE.sub(r"\\\1", "".join(out))
+
+
+def repair_tex(text):
+    """Restore TeX commands mangled by single escaping, inside math only"""
+    if "\\" not in text:
+        return text
+    return "".join(_repair_math(seg) if is_math else seg for is_math, seg in split_math(text))
+
+
+def repair_record(record):
+    """Copy of a bank record with repair_tex applied to its text fields"""
+    fixed = dict(record)
+    for field in ("question", "options", "explanation"):
+        value = fixed.get(field)
+        if isinstance(value, list):
+            fixed[field] = [repair_tex(v) if isinstance(v, str) else v for v in value]
+        elif isinstance(value, str):
+            fixed[field] = repair_tex(value)
+    return fixed
+
+
+def js_string(text):
+    """Double-quoted JavaScript literal for text, safe inside a <script> block"""
+    out = ['"']
+    for i, ch in enumerate(text):
+        escaped = _JS_ESCAPES.get(ch)
+        if escaped is not None:
+            out.append(escaped)
+        elif ch < " ":
+            out.append(f"\\u{ord(ch):04x}")
+        elif ch == "/" and text[i - 1:i] == "<":
+            out.append("\\/")  # "</script>" would end the page's script block
+        else:
+            out.append(ch)
+    out.append('"')
+    return "".join(out)
@@ -0,0 +1,420 @@
+"""
+Answer-key verification for the question bank.
+
+For every question that can be read as mathematics, the expected answer
+is computed with sympy and compared with each option:
+  - equations and systems: "If 4(x - 3) + 2 = 3(x + 5), what is x?",
+    "If 3^x = 27 and 2^y = 16, what is xy?", "Solve: |3x - 6| = 12"
+  - evaluations: "If f(x) = 2^x, what is f(3) - f(1)?", "Simplify: ...",
+    "What is 15% of 240?"
+  - Vieta: "The product of roots of x^2 - (k+2)x + 2k = 0 is 6. What is
+    the sum of roots?"
+  - limits: \\lim_{x \\to 3} f(x)
+
+Each question gets one verdict:
+  ok          the keyed option is the computed answer
+  mismatch    another option is the computed answer
+  unmatched   no option equals the computed answer
+  ambiguous   several options equal the computed answer
+  skipped     the question could not be read (graphs, word problems, ...)
+
+Explanations that show unfinished working ("Hmm", "let me recalc") are
+flagged whatever the verdict. Questions are checked in parallel.
+
+Usage:
+  python verify_answers.py                     # every exam, all cores
+  python verify_answers.py exam8 --verbose     # also list ok/skipped questions
+  python verify_answers.py --json
+  python verify_answers.py --strict            # CI: also fail on unmatched/ambiguous
+
+Exits 1 on any mismatch or flagged explanation; with --strict, also on
+unmatched and ambiguous questions.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor
+
+from question_bank import EXAMS, load_bank
+from tex_escape import split_math
+
+LETTERS = "ABCDE"
+
+# Symbols questions solve for; everything else must be a known function or constant
+SYMBOLS = "x y z k a b c n m r t theta"
+NAMES = set(SYMBOLS.split()) | {"sqrt", "pi", "sin", "cos", "tan", "log", "exp", "Abs", "E", "I_"}
+
+_UNFINISHED = re.compile(r"\bhmm\b|let me (?:re)?calc|let me (?:fix|check|use)|not in options|not matching|\bwait\b", re.I)
+
+# "a = b" in plain text: the left side is built only from math tokens (numbers,
+# single letters, f(x), operators), so it starts right after the last word
+_PLAIN_EQUATION = re.compile(
+    r"((?:(?<![A-Za-z])[a-z](?:\(x\))?(?![A-Za-z])|\d+(?:\.\d+)?|[\s^*()+\-/|:])+?)"
+    r"=\s*([^,?]+?)(?=,|\s+and\s|\s+what|\?|\.\s|$)"
+)
+
+_SUPERSCRIPTS = {"²": "**2", "³": "**3", "⁴": "**4"}
+_SUBSCRIPTS = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
+
+
+# ==========================================
+# TeX / plain text -> sympy
+# ==========================================
+
+def to_plain(text):
+    """TeX and exam shorthand (√, ², π, |x|) as a sympy-parseable string"""
+    s = text.replace("\\(", " ").replace("\\)", " ").replace("\\[", " ").replace("\\]", " ")
+    s = re.sub(r"\\(left|right|displaystyle|,|;|!)", "", s)
+    s = re.sub(r"\b([fgh])\^\{?-1\}?", r"\1inv", s)  # f^{-1} -> finv, defined by _definitions
+    for _ in range(4):  # Nested fractions and roots, innermost first
+        s = re.sub(r"\\d?frac\{([^{}]*)\}\{([^{}]*)\}", r"((\1)/(\2))", s)
+        s = re.sub(r"\\sqrt\{([^{}]*)\}", r"sqrt(\1)", s)
+        s = re.sub(r"\^\{([^{}]*)\}", r"**(\1)", s)
+    s = re.sub(r"√\(", "sqrt(", s)
+    s = re.sub(r"√(\d+(?:\.\d+)?|[a-z])", r"sqrt(\1)", s)
+    s = re.sub(r"(?<=\w)_\{?(\w+)\}?", r"\1", s)  # a_{10} -> a10
+    s = s.translate(_SUBSCRIPTS)
+    for sup, power in _SUPERSCRIPTS.items():
+        s = s.replace(sup, power)
+    replacements = [
+        ("\\times", "*"), ("\\cdot", "*"), ("×", "*"), ("·", "*"), ("\\div", "/"), ("÷", "/"),
+        ("\\pi", "pi"), ("π", "pi"), ("\\theta", "theta"), ("θ", "theta"),
+        ("\\sin", "sin"), ("\\cos", "cos"), ("\\tan", "tan"), ("\\log", "log"), ("\\ln", "log"),
+        ("\\leq", "<="), ("\\le", "<="), ("≤", "<="), ("\\geq", ">="), ("\\ge", ">="), ("≥", ">="),
+        ("−", "-"), ("–", "-"), ("°", ""), ("\\circ", ""), ("^", "**"), ("{", "("), ("}", ")"),
+    ]
+    for old, new in replacements:
+        s = s.replace(old, new)
+    s = re.sub(r"\|([^|]+)\|", r"Abs(\1)", s)
+    s = re.sub(r"\b([a-z]|\d+)\s*:\s*([a-z]|\d+)\b", r"(\1/\2)", s)  # x:y = 2:5
+    s = re.sub(r"\bdeg\b", "", s)
+    return " ".join(s.split())
+
+
+def parse(text, functions=None):
+    """sympy expression for plain text, or None if it has words we don't know"""
+    from sympy import Symbol
+    from sympy.parsing.sympy_parser import (
+        convert_xor, implicit_multiplication_application, parse_expr, standard_transformations,
+    )
+
+    functions = functions or {}
+    words = set(re.findall(r"[A-Za-z_]+\d*", text))
+    known = NAMES | set(functions)
+    for word in words - known:
+        if not re.fullmatch(r"[a-z]\d+", word):
+            return None
+    local = {name: Symbol(name, real=True) for name in SYMBOLS.split()}
+    local.update({w: Symbol(w, real=True) for w in words - known})  # Indexed terms like a10
+    local.update(functions)
+    try:
+        return parse_expr(
+            text, local_dict=local, evaluate=True,
+            transformations=standard_transformations + (implicit_multiplication_application, convert_xor),
+        )
+    except Exception:
+        return None
+
+
+def parse_relation(text, functions=None):
+    """Eq for "lhs = rhs", else the expression"""
+    from sympy import Eq
+
+    if text.count("=") == 1 and not re.search(r"[<>!]=", text):
+        lhs, rhs = (parse(side.strip(), functions) for side in text.split("="))
+        if lhs is None or rhs is None:
+            return None
+        return Eq(lhs, rhs, evaluate=False)
+    return parse(text, functions)
+
+
+def option_value(text):
+    """Number, expression or set of values an option states; None if it is prose"""
+    from sympy import FiniteSet, Rational
+
+    plain = to_plain(text)
+    ratio = re.fullmatch(r"(\d+)\s*:\s*(\d+)", plain)
+    if ratio:
+        return Rational(int(ratio.group(1)), int(ratio.group(2)))
+    plain = re.sub(r"%$", "/100", plain)
+    parts = re.split(r"\s+(?:or|and)\s+|,\s*", re.sub(r"\s+only$", "", plain))
+    values = []
+    for part in parts:
+        part = re.sub(r"^[a-z]\s*=\s*", "", part.strip())  # "x = 5" -> 5
+        value = parse(part)
+        if value is None:
+            return None
+        values.append(value)
+    return values[0] if len(values) == 1 else FiniteSet(*values)
+
+
+def equivalent(a, b):
+    from sympy import FiniteSet, N, simplify
+
+    if isinstance(a, FiniteSet) or isinstance(b, FiniteSet):
+        a = a if isinstance(a, FiniteSet) else FiniteSet(a)
+        b = b if isinstance(b, FiniteSet) else FiniteSet(b)
+        return len(a) == len(b) and all(any(equivalent(x, y) for y in b) for x in a)
+    try:
+        if a.is_number and b.is_number:
+            return abs(complex(N(a - b))) < 1e-9
+        return simplify(a - b) == 0
+    except (TypeError, AttributeError, ValueError):
+        return False
+
+
+# ==========================================
+# Reading a question
+# ==========================================
+
+def _definitions(segments):
+    """{name: Lambda} for "f(x) = ..." definitions (and finv when f inverts), and the other math segments"""
+    from sympy import Eq, Lambda, Symbol, solve
+
+    functions = {}
+    rest = []
+    for seg in segments:
+        plain = to_plain(seg)
+        m = re.fullmatch(r"([fgh])\(x\)\s*=\s*(.+)", plain)
+        if m:
+            body = parse(m.group(2), functions)
+            if body is not None:
+                x, y = Symbol("x", real=True), Symbol("y", real=True)
+                functions[m.group(1)] = Lambda(x, body)
+                inverse = solve(Eq(body.subs(x, y), x), y)
+                if len(inverse) == 1:
+                    functions[m.group(1) + "inv"] = Lambda(x, inverse[0])
+                continue
+        rest.append(plain)
+    return functions, rest
+
+
+def _math_segments(question):
+    """Math in a question: TeX segments, or the whole sentence clauses when it has none"""
+    segments = [seg for is_math, seg in split_math(question) if is_math]
+    if segments:
+        return segments
+    # Untyped math ("If 4(x - 3) + 2 = 3(x + 5), what is x?"): take "a = b" clauses
+    return [f"{lhs.lstrip(' :)+*/^.').rstrip()} = {rhs}" for lhs, rhs in _PLAIN_EQUATION.findall(question)]
+
+
+def _asked(question, functions):
+    """The expression a question asks for, from "what is ...?" or "Simplify: ..." """
+    ask = re.search(r"(?:what is|find|value of|simplify:?|evaluate:?|factor(?: completely)?:?|expand:?)\s+(?:the value of\s+)?(.+?)\??$", question.split("<br>")[0], re.I)
+    if not ask:
+        return None
+    target = ask.group(1).strip().rstrip("?. ")
+    target = re.sub(r"^(?:the value of|the)\s+", "", target)
+    target = re.sub(r"\s+for\s+.*$", "", target)  # "... for x ≠ -4"
+    if re.fullmatch(r"[xyzabc]{2,3}", target):
+        target = "*".join(target)  # "what is xy?"
+    return parse(to_plain(target), functions)
+
+
+def _vieta(question, equations):
+    """Sum/product of roots, optionally fixing a parameter from a stated sum/product"""
+    from sympy import Poly, Symbol, solve
+
+    x = Symbol("x", real=True)
+    polys = [Poly(eq.lhs - eq.rhs, x) for eq in equations if (eq.lhs - eq.rhs).has(x)]
+    if not polys:
+        return None
+    poly = polys[0]
+    coeffs = poly.all_coeffs()
+    n = poly.degree()
+    total = -coeffs[1] / coeffs[0]
+    product = (-1) ** n * coeffs[-1] / coeffs[0]
+
+    lowered = question.lower()
+    constraints = []
+    for name, value in (("product", product), ("sum", total)):
+        stated = re.search(name + r" of (?:the )?roots[^.?]*? is (-?\d+(?:\.\d+)?)", lowered)
+        if stated:
+            constraints.append(value - float(stated.group(1)) if "." in stated.group(1) else value - int(stated.group(1)))
+    asked = re.search(r"what is the (sum|product) of (?:the |all )?(?:roots|solutions)", lowered)
+    if not asked:
+        return None
+    target = total if asked.group(1) == "sum" else product
+    params = sorted(target.free_symbols | {s for c in constraints for s in c.free_symbols}, key=str)
+    if constraints and params:
+        solutions = solve(constraints, params, dict=True)
+        if len(solutions) != 1:
+            return None
+        target = target.subs(solutions[0])
+    return target if not target.free_symbols else None
+
+
+def _limit(question, functions):
+    from sympy import Symbol, limit
+
+    m = re.search(r"\\lim_\{?\s*([a-z])\s*\\to\s*([^}]+?)\}?\s+(.+?)\\\)", question)
+    if not m:
+        return None
+    var = Symbol(m.group(1), real=True)
+    point = parse(to_plain(m.group(2)))
+    expr = parse(to_plain(m.group(3)), functions)
+    if point is None or expr is None:
+        return None
+    return limit(expr, var, point)
+
+
+def expected_answer(question):
+    """sympy value (or FiniteSet of values) the question asks for, or None"""
+    from sympy import Eq, FiniteSet, Rational, Symbol, prod, simplify, solve
+
+    text = question.replace("<br>", "\n")
+    percent = re.search(r"what is (\d+(?:\.\d+)?)% of (\d+(?:\.\d+)?)", text, re.I)
+    if percent:
+        return Rational(percent.group(1)) * Rational(percent.group(2)) / 100
+
+    segments = _math_segments(text)
+    functions, rest = _definitions(segments)
+
+    if "\\lim" in text:
+        return _limit(text, functions)
+
+    relations = [parse_relation(seg, functions) for seg in rest if "=" in seg and not re.search(r"[<>]", seg)]
+    if any(r is None for r in relations):
+        return None
+    equations = [r for r in relations if isinstance(r, Eq)]
+
+    if re.search(r"(?:sum|product) of (?:the )?roots", text, re.I):
+        return _vieta(text, equations)
+
+    zeros = re.search(r"what are the (?:zeros|roots|solutions) of", text, re.I)
+    if zeros and len(functions) == 1 and not equations:
+        equations = [Eq(next(iter(functions.values()))(Symbol("x", real=True)), 0)]
+    if re.match(r"\s*solve:?\s*(.+)", text, re.I) or zeros:
+        if len(equations) != 1 or len(equations[0].free_symbols) != 1:
+            return None
+        return FiniteSet(*solve(equations[0], list(equations[0].free_symbols)[0]))
+    combine = re.search(r"(sum|product) of all (?:the )?solutions", text, re.I)
+    unknowns = sorted(set().union(*(eq.free_symbols for eq in equations)), key=str)
+    if combine:
+        asked = unknowns[0] if len(unknowns) == 1 else None
+    else:
+        asked = _asked(text.split("\n")[0], functions)
+    if asked is None:
+        return None
+
+    if not equations:
+        # f(a+1) or "Simplify: ..." may be an expression; a bare unknown needs equations we could not read
+        algebra = functions or re.match(r"\s*(?:simplify|factor|expand)", text, re.I)
+        return None if asked.is_Symbol or (asked.free_symbols and not algebra) else asked
+    if not asked.free_symbols <= set(unknowns):
+        return None
+    # Fewer equations than unknowns still pins down e.g. x/z from x/y and y/z
+    values = set()
+    for chosen in combinations(unknowns, min(len(equations), len(unknowns))):
+        solutions = solve(equations, list(chosen), dict=True)
+        values = {simplify(asked.subs(sol)) for sol in solutions}
+        values = {v for v in values if not v.free_symbols and v.is_real is not False}
+        if values:
+            break
+    if combine and values:
+        return sum(values) if combine.group(1).lower() == "sum" else prod(values)
+    if not values:
+        return None
+    return values.pop() if len(values) == 1 else FiniteSet(*values)
+
+
+# ==========================================
+# Verdicts
+# ==========================================
+
+def verify_question(task):
+    """Worker: (exam, index, record) -> result dict"""
+    from sympy import FiniteSet
+
+    exam, index, q = task
+    result = {"exam": exam, "index": index, "id": q["id"], "keyed": LETTERS[q["answer"]], "verdict": "skipped"}
+    explanation = q["explanation"] if isinstance(q["explanation"], list) else [q["explanation"]]
+    if any(_UNFINISHED.search(step) for step in explanation):
+        result["explanation"] = "shows unfinished working"
+
+    try:
+        expected = expected_answer(q["question"])
+    except Exception as e:  # sympy can reject odd inputs; treat as unreadable
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+    if expected is None:
+        return result
+
+    values = [option_value(option) for option in q["options"]]
+    matches = [i for i, value in enumerate(values) if value is not None and equivalent(value, expected)]
+    if not matches and isinstance(expected, FiniteSet):
+        # No option lists every root: any single root answers "what is x?"
+        matches = [
+            i for i, value in enumerate(values)
+            if value is not None and not isinstance(value, FiniteSet) and any(equivalent(value, root) for root in expected)
+        ]
+    result["expected"] = str(expected)
+    result["matches"] = [LETTERS[i] for i in matches]
+    if not matches:
+        result["verdict"] = "unmatched"
+    elif q["answer"] not in matches:
+        result["verdict"] = "mismatch"
+    elif len(matches) > 1:
+        result["verdict"] = "ambiguous"
+    else:
+        result["verdict"] = "ok"
+    return result
+
+
+def verify(bank, workers=None):
+    tasks = [(exam, index, q) for exam, questions in bank.items() for index, q in enumerate(questions)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(verify_question, tasks, chunksize=8))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("exams", nargs="*", help=f"Exams to verify (default: all of {', '.join(EXAMS)})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (default: all cores)")
+    parser.add_argument("--verbose", action="store_true", help="Also list ok and skipped questions")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--strict", action="store_true", help="Also fail on unmatched and ambiguous questions")
+    args = parser.parse_args()
+
+    bank = load_bank()
+    unknown = [e for e in args.exams if e not in bank]
+    if unknown:
+        parser.error(f"unknown exam(s): {', '.join(unknown)}")
+    if args.exams:
+        bank = {exam: bank[exam] for exam in args.exams}
+
+    start = time.perf_counter()
+    results = verify(bank, args.workers)
+    elapsed = time.perf_counter() - start
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    counts = {}
+    for r in results:
+        counts[r["verdict"]] = counts.get(r["verdict"], 0) + 1
+        shown = args.verbose or r["verdict"] not in ("ok", "skipped") or "explanation" in r
+        if not shown:
+            continue
+        line = f"[{r['verdict'].upper()}] {r['exam']}[{r['index']}] id {r['id']}: keyed {r['keyed']}"
+        if "expected" in r:
+            line += f", computed {r['expected']}"
+            if r["matches"]:
+                line += f" (option {'/'.join(r['matches'])})"
+        if "explanation" in r:
+            line += f"; explanation {r['explanation']}"
+        print(line)
+
+    summary = ", ".join(f"{counts[v]} {v}" for v in ("ok", "mismatch", "unmatched", "ambiguous", "skipped") if v in counts)
+    print(f"\n{len(results)} questions in {elapsed:.1f}s: {summary}")
+    failing = ("mismatch", "unmatched", "ambiguous") if args.strict else ("mismatch",)
+    if any(counts.get(v) for v in failing) or any("explanation" in r for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()